@@ -3,9 +3,21 @@ Aplikasi Analisis Siaran Pers Indonesia.
 Aplikasi ini menganalisis dokumen siaran pers dan mencari berita terkait.
 """
 
+import os
+from datetime import date, timedelta
 import streamlit as st
+from modules.batch_processor import analyze_batch, iter_uploaded_documents
+from modules.analysis_service import analyze_text, compare_keyword_methods
 from modules.document_processor import DocumentProcessor
-from modules.keyword_extractor import KeywordExtractor
+from modules.instrumentation import cache_gauges
+from modules.keyword_extractor import warm_up
+from modules.large_document import sweep_stale_text_files
+from modules.models import AnalysisResult
+from modules.news_archive import get_shared_archive
+from modules.quote_tracker import QuotePickupMatcher
+from modules.result_cache import content_key, get_result_cache
+from modules.sentiment_analyzer import get_shared_sentiment_analyzer
+from modules.visualizer import get_shared_visualizer
 
 # Set konfigurasi halaman
 st.set_page_config(
@@ -27,12 +39,23 @@ def show_welcome():
     1. **Ekstraksi Teks** - Unggah dokumen PDF, DOCX, atau TXT
     2. **Analisis Kata Kunci** - Ekstrak kata kunci penting dan kutipan 
     3. **Pencarian Media** - Temukan berita terkait dari berbagai media (Coming Soon)
-    4. **Analisis Sentimen** - Ketahui bagaimana media menanggapi (Coming Soon)
-    5. **Visualisasi Data** - Lihat tren dan laporan interaktif (Coming Soon)
+    4. **Analisis Sentimen** - Ketahui bagaimana media menanggapi
+    5. **Visualisasi Data** - Lihat tren dan laporan interaktif
     
     **Untuk Memulai**: Pilih menu di sidebar dan ikuti petunjuk yang diberikan.
     """)
 
+def set_document_text(text):
+    """Menyimpan teks dokumen dan membuang hasil analisis jika teksnya berubah."""
+    st.session_state.extracted_text = text
+    # Dokumen besar dikenali dari hash teks lengkapnya, bukan dari pratinjau
+    large_document = st.session_state.get("large_document")
+    document_hash = large_document.key if large_document else content_key(text)
+    if st.session_state.get("document_hash") != document_hash:
+        st.session_state.document_hash = document_hash
+        st.session_state.pop("analysis_result", None)
+        st.session_state.pop("analysis_key", None)
+
 def display_extracted_text():
     """Menampilkan teks yang sudah diekstrak dari dokumen."""
     if "extracted_text" in st.session_state and "document_name" in st.session_state:
@@ -41,9 +64,25 @@ def display_extracted_text():
         
         st.subheader(f"Teks dari {filename}")
         
-        # Tampilkan teks yang diekstrak
+        large_document = st.session_state.get("large_document")
+        if large_document:
+            # Dokumen besar: hanya pratinjau yang ditampilkan, tanpa penyuntingan
+            with st.expander("Lihat Pratinjau Teks", expanded=False):
+                st.text_area("Pratinjau Teks", text, height=300, disabled=True)
+            show_large_document_caption(large_document)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.info(f"Jumlah kata: {large_document.words}")
+            with col2:
+                st.info(f"Jumlah karakter: {large_document.characters}")
+            return True
+        
+        # Tampilkan teks yang diekstrak; suntingan dianalisis ulang secara inkremental
         with st.expander("Lihat Teks Lengkap", expanded=False):
-            st.text_area("Teks yang Diekstrak", text, height=300)
+            edited = st.text_area("Teks yang Diekstrak (dapat disunting)", text, height=300)
+        if edited != text:
+            set_document_text(edited)
+            text = edited
         
         # Tampilkan statistik
         col1, col2 = st.columns(2)
@@ -55,6 +94,153 @@ def display_extracted_text():
         return True
     return False
 
+def show_large_document_caption(large_document):
+    """Menjelaskan bahwa dokumen besar hanya ditampilkan sebagian."""
+    if large_document.truncated:
+        st.caption(f"Dokumen besar: ditampilkan {len(large_document.preview)} dari "
+                   f"{large_document.characters} karakter. Analisis memproses seluruh teks per bagian.")
+
+def show_batch_analysis():
+    """Menganalisis banyak dokumen sekaligus dengan pemrosesan paralel."""
+    st.write("### Analisis Batch Dokumen")
+    
+    uploaded_files = st.file_uploader(
+        "Pilih beberapa dokumen (PDF, DOCX, TXT) atau arsip ZIP",
+        type=["pdf", "docx", "doc", "txt", "zip"],
+        accept_multiple_files=True
+    )
+    workers = st.slider("Jumlah proses paralel", min_value=1, max_value=os.cpu_count() or 1,
+                        value=os.cpu_count() or 1)
+    
+    if not uploaded_files or not st.button("Mulai Analisis Batch"):
+        return
+    
+    documents = list(iter_uploaded_documents(uploaded_files))
+    if not documents:
+        st.warning("Tidak ada dokumen yang didukung dalam unggahan.")
+        return
+    
+    progress = st.progress(0.0)
+    status = st.empty()
+    rows = []
+    failures = []
+    
+    # Tampilkan hasil per dokumen segera setelah selesai diproses
+    for result in analyze_batch(documents, workers=workers):
+        progress.progress(result["index"] / len(documents))
+        status.text(f"Selesai {result['index']} dari {len(documents)}: {result['name']}")
+        if result["status"] == "ok":
+            analysis = result["analysis"]
+            get_shared_visualizer().store.add_release(result["analysis_key"], analysis)
+            rows.append({
+                "Dokumen": result["name"],
+                "Kata Kunci": ", ".join(keyword for keyword, _ in analysis["keywords"][:5]),
+                "Kutipan": len(analysis["quotes"]),
+                "Waktu (dtk)": round(result["elapsed"], 2)
+            })
+        else:
+            failures.append(f"{result['name']}: {result['error']}")
+    
+    import pandas as pd
+    st.success(f"{len(rows)} dokumen berhasil dianalisis.")
+    st.dataframe(pd.DataFrame(rows), use_container_width=True)
+    if failures:
+        st.error("Dokumen yang gagal diproses:\n\n" + "\n".join(f"- {failure}" for failure in failures))
+
+def show_sentiment_analysis():
+    """Menampilkan sentimen konteks kutipan dan frasa kunci dari dokumen yang dianalisis."""
+    st.write("### Analisis Sentimen")
+    
+    analysis = st.session_state.get("analysis_result")
+    if not analysis:
+        st.warning("Belum ada hasil analisis. Jalankan Ekstraksi Kata Kunci terlebih dahulu.")
+        return
+    
+    quotes = [dict(quote) for quote in analysis["quotes"]]
+    phrases = list(analysis["key_phrases"])
+    if not quotes and not phrases:
+        st.info("Tidak ada kutipan atau frasa kunci untuk dianalisis.")
+        return
+    
+    with st.spinner("Menghitung sentimen (model dimuat sekali pada penggunaan pertama)..."):
+        analyzer = get_shared_sentiment_analyzer()
+        analyzer.analyze_quotes(quotes)
+        phrase_sentiments = analyzer.analyze(phrases)
+    
+    import pandas as pd
+    rows = [
+        {"Jenis": "Kutipan", "Teks": quote["quote"], "Sentimen": quote["sentiment"]["label"],
+         "Skor": round(quote["sentiment"]["score"], 3)}
+        for quote in quotes
+    ]
+    rows.extend(
+        {"Jenis": "Frasa Kunci", "Teks": phrase, "Sentimen": sentiment["label"],
+         "Skor": round(sentiment["score"], 3)}
+        for phrase, sentiment in zip(phrases, phrase_sentiments)
+    )
+    st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+def show_reports():
+    """Menampilkan tren kata kunci, sentimen per media, dan pemuatan kutipan dari metrik teragregasi."""
+    st.write("### Laporan & Visualisasi")
+    
+    visualizer = get_shared_visualizer()
+    store = visualizer.store
+    
+    # Liputan dokumen saat ini diambil dari arsip berita lokal dan ditambahkan ke metrik
+    archive = get_shared_archive()
+    analysis = st.session_state.get("analysis_result")
+    if archive is not None and analysis and st.button("Perbarui liputan dari arsip berita"):
+        with st.spinner("Mencari liputan dan menghitung sentimen..."):
+            quotes = [quote["quote"] for quote in analysis["quotes"]]
+            keywords = [keyword for keyword, _ in analysis["keywords"][:10]] + list(analysis["key_phrases"])
+            articles = archive.search(keywords, quotes, limit=200)
+            picked = store.add_quote_hits(QuotePickupMatcher(quotes).scan(articles))
+            scored = get_shared_sentiment_analyzer().analyze_articles(articles, deduplicate=True)
+            added = store.add_articles(scored)
+        st.success(f"{added} artikel dan {picked} pemuatan kutipan baru ditambahkan ke laporan.")
+    
+    if not (len(store.keywords) or len(store.sentiment) or len(store.quotes)):
+        st.info("Belum ada data laporan. Analisis dokumen di menu Ekstraksi Kata Kunci atau Analisis Batch "
+                "terlebih dahulu.")
+        return
+    
+    ranges = {"Semua": None, "30 hari terakhir": 30, "90 hari terakhir": 90, "1 tahun terakhir": 365}
+    days = ranges[st.selectbox("Rentang waktu", list(ranges))]
+    start = (date.today() - timedelta(days=days)).isoformat() if days else None
+    
+    # Grafik dibangun dari rollup dan dipakai ulang selama datanya tidak berubah
+    if len(store.keywords):
+        st.plotly_chart(visualizer.keyword_trend_figure(start=start), use_container_width=True)
+    if len(store.sentiment):
+        weight = "reach" if st.checkbox("Hitung salinan sindikasi") else "articles"
+        st.plotly_chart(visualizer.sentiment_by_outlet_figure(start=start, weight=weight),
+                        use_container_width=True)
+    if len(store.quotes):
+        st.plotly_chart(visualizer.quote_pickup_figure(start=start), use_container_width=True)
+
+def show_debug_panel():
+    """Menampilkan rincian waktu per tahap dan penghitung untuk dokumen saat ini."""
+    import pandas as pd
+    
+    with st.expander("Panel Debug", expanded=True):
+        for title, key in (("Ekstraksi", "extraction_profile"), ("Analisis", "analysis_profile")):
+            profile = st.session_state.get(key)
+            if not profile:
+                continue
+            st.write(f"#### {title}")
+            stages = profile["stages"]
+            st.dataframe(pd.DataFrame({
+                "Tahap": list(stages),
+                "Waktu (ms)": [round(entry["seconds"] * 1000, 2) for entry in stages.values()],
+                "Panggilan": [entry["calls"] for entry in stages.values()]
+            }), use_container_width=True)
+            if profile["counters"]:
+                st.json(profile["counters"])
+        
+        st.write("#### Cache")
+        st.json(cache_gauges())
+
 def main():
     """Fungsi utama aplikasi."""
     # Sidebar navigation
@@ -63,26 +249,25 @@ def main():
         "Beranda",
         "Unggah Dokumen",
         "Ekstraksi Kata Kunci",
+        "Analisis Batch",
         "Pencarian Berita",      # Coming soon
-        "Analisis Sentimen",     # Coming soon
-        "Laporan & Visualisasi"  # Coming soon
+        "Analisis Sentimen",
+        "Laporan & Visualisasi"
     ]
     
-    menu_icons = ["🏠", "📄", "🔑", "🔍", "📊", "📈"]
+    menu_icons = ["🏠", "📄", "🔑", "🗂️", "🔍", "📊", "📈"]
     
     # Tambahkan label "Coming Soon" untuk fitur yang belum tersedia
+    coming_soon = {"Pencarian Berita"}
     menu_labels = []
-    for i, (option, icon) in enumerate(zip(menu_options, menu_icons)):
-        if i >= 3:  # Menu ke-3 dst masih coming soon
+    for option, icon in zip(menu_options, menu_icons):
+        if option in coming_soon:
             menu_labels.append(f"{icon} {option} (Coming Soon)")
         else:
             menu_labels.append(f"{icon} {option}")
     
     choice = st.sidebar.radio("", menu_labels, index=0)
     
-    # Inisialisasi objek KeywordExtractor
-    keyword_extractor = KeywordExtractor()
-    
     # Tampilkan konten berdasarkan pilihan menu
     if "Beranda" in choice:
         show_welcome()
@@ -93,20 +278,25 @@ def main():
         if result:
             text, filename = result
             
-            # Simpan teks dalam session state untuk digunakan oleh modul berikutnya
-            st.session_state.extracted_text = text
+            # Simpan teks dalam session state untuk digunakan oleh modul berikutnya.
+            # Hasil analisis versi sebelumnya dibuang; segmen yang tidak berubah
+            # dipakai ulang dari cache extractor saat analisis berikutnya.
+            set_document_text(text)
             st.session_state.document_name = filename
+            large_document = st.session_state.get("large_document")
             
             # Tampilkan teks yang diekstrak
             with st.expander("Lihat Teks Lengkap", expanded=True):
-                st.text_area("Teks yang Diekstrak", text, height=400)
+                st.text_area("Teks yang Diekstrak", text, height=400, disabled=large_document is not None)
+            if large_document:
+                show_large_document_caption(large_document)
             
             # Tampilkan statistik
             col1, col2 = st.columns(2)
             with col1:
-                st.info(f"Jumlah kata: {len(text.split())}")
+                st.info(f"Jumlah kata: {large_document.words if large_document else len(text.split())}")
             with col2:
-                st.info(f"Jumlah karakter: {len(text)}")
+                st.info(f"Jumlah karakter: {large_document.characters if large_document else len(text)}")
             
             # Tambahkan tombol untuk melanjutkan ke langkah berikutnya
             if st.button("Lanjut ke Ekstraksi Kata Kunci"):
@@ -125,30 +315,58 @@ def main():
         # Proses ekstraksi kata kunci
         with st.spinner("Menganalisis teks..."):
             if "analysis_result" not in st.session_state:
-                # Lakukan analisis jika belum ada hasil
-                text = st.session_state.extracted_text
-                analysis = keyword_extractor.analyze_text(text)
-                st.session_state.analysis_result = analysis
-            else:
-                # Gunakan hasil yang sudah ada
-                analysis = st.session_state.analysis_result
+                # Ambil dari cache bersama (hasil unggahan rekan dengan dokumen yang sama) atau analisis ulang
+                # Dokumen besar dianalisis per bagian dari file sementaranya
+                result = analyze_text(st.session_state.get("large_document") or st.session_state.extracted_text)
+                if result["status"] != "ok":
+                    st.error(result["error"])
+                    return
+                st.session_state.analysis_result = result["analysis"]
+                st.session_state.analysis_key = result["analysis_key"]
+                st.session_state.analysis_profile = result["profile"]
+                get_shared_visualizer().store.add_release(result["analysis_key"], result["analysis"])
+            
+            # Gunakan hasil yang sudah ada
+            analysis = st.session_state.analysis_result
         
         # Tampilkan hasil analisis
         if analysis:
             st.subheader("Hasil Analisis")
+            counters = st.session_state.get("analysis_profile", {}).get("counters", {})
+            if counters.get("segment_cache_hits"):
+                reused = counters["segment_cache_hits"]
+                st.caption(f"{reused} dari {reused + counters.get('segment_cache_misses', 0)} "
+                           "segmen dipakai ulang dari versi sebelumnya.")
             
             tab1, tab2, tab3 = st.tabs(["Kata Kunci & Frasa", "Kutipan", "Entitas"])
             
             with tab1:
                 # Tampilkan kata kunci
                 st.write("#### Kata Kunci")
-                keyword_data = []
-                for keyword, score in analysis["keywords"]:
-                    keyword_data.append({"Kata Kunci": keyword, "Skor": f"{score:.4f}"})
+                typed_result = AnalysisResult.from_analysis(analysis)
+                keywords_df = typed_result.keywords_frame().rename(
+                    columns={"keyword": "Kata Kunci", "score": "Skor", "start": "Posisi"}
+                ).drop(columns="end")
+                st.dataframe(keywords_df.style.format({"Skor": "{:.4f}"}), use_container_width=True)
                 
-                import pandas as pd
-                keywords_df = pd.DataFrame(keyword_data)
-                st.dataframe(keywords_df, use_container_width=True)
+                # Bandingkan TF-IDF dengan kata kunci berbasis embedding
+                if st.checkbox("Bandingkan TF-IDF dan embedding"):
+                    import pandas as pd
+                    large_document = st.session_state.get("large_document")
+                    if large_document is not None:
+                        st.caption("Dokumen besar: TF-IDF dihitung dari seluruh teks per bagian; "
+                                   "embedding dihitung dari bagian pertama dokumen.")
+                    with st.spinner("Menghitung kata kunci dengan kedua metode..."):
+                        comparison = compare_keyword_methods(large_document or st.session_state.extracted_text)
+                    columns = st.columns(len(comparison))
+                    for column, (method, entry) in zip(columns, comparison.items()):
+                        with column:
+                            st.write(f"**{method.upper()}** ({entry['elapsed'] * 1000:.0f} ms)")
+                            if entry["error"]:
+                                st.warning(entry["error"])
+                            else:
+                                st.dataframe(pd.DataFrame(entry["keywords"], columns=["Kata Kunci", "Skor"])
+                                             .style.format({"Skor": "{:.4f}"}), use_container_width=True)
                 
                 # Tampilkan frasa kunci
                 st.write("#### Frasa Kunci")
@@ -183,14 +401,27 @@ def main():
             # Tambahkan tombol untuk melanjutkan ke langkah berikutnya
             st.success("Ekstraksi kata kunci dan kutipan berhasil! Anda dapat melanjutkan ke langkah berikutnya.")
             if st.button("Reset Analisis"):
-                if "analysis_result" in st.session_state:
-                    del st.session_state.analysis_result
+                get_result_cache().discard(st.session_state.get("analysis_key"))
+                st.session_state.pop("analysis_result", None)
+                st.session_state.pop("analysis_key", None)
                 st.experimental_rerun()
     
-    elif "Pencarian Berita" in choice or "Analisis Sentimen" in choice or "Laporan" in choice:
+    elif "Analisis Batch" in choice:
+        show_batch_analysis()
+    
+    elif "Analisis Sentimen" in choice:
+        show_sentiment_analysis()
+    
+    elif "Laporan" in choice:
+        show_reports()
+    
+    elif "Pencarian Berita" in choice:
         st.info("Fitur ini sedang dalam pengembangan dan akan segera tersedia.")
         # Placeholder untuk fitur yang akan datang
     
+    if st.sidebar.checkbox("Tampilkan panel debug"):
+        show_debug_panel()
+    
     # Tambahkan info di sidebar
     st.sidebar.markdown("---")
     st.sidebar.info(
@@ -201,6 +432,14 @@ def main():
     # Tambahkan footer
     st.sidebar.markdown("---")
     st.sidebar.caption("© 2025 Analisis Siaran Pers Indonesia")
+    
+    # Panaskan extractor bersama di latar belakang setelah halaman pertama tampil.
+    # Set ANALISIS_WARMUP=0 untuk menonaktifkan.
+    if os.environ.get("ANALISIS_WARMUP", "1") != "0":
+        warm_up(background=True)
+    
+    # Hapus file teks dokumen besar yang ditinggalkan session lama (paling sering sekali per 10 menit)
+    sweep_stale_text_files()
 
 if __name__ == "__main__":
     main()
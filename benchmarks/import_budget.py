@@ -0,0 +1,105 @@
+"""
+Import-time budget check for Analisis Siaran Pers.
+Imports each module in a fresh interpreter and reports its startup cost, so
+heavy NLP/ML dependencies do not creep back into module import paths.
+
+Usage:
+    python benchmarks/import_budget.py [--repeat N] [--scale FACTOR]
+
+Exits with status 1 if any module exceeds its budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Anggaran waktu impor (milidetik) untuk setiap modul tanpa Streamlit
+BUDGETS_MS: Dict[str, float] = {
+    "modules": 50,
+    "modules.analysis_context": 50,
+    "modules.analysis_service": 100,
+    "modules.batch_processor": 100,
+    "modules.corpus_model": 50,
+    "modules.document_processor": 50,
+    "modules.embedding_keywords": 50,
+    "modules.gazetteer": 50,
+    "modules.instrumentation": 50,
+    "modules.keyword_extractor": 50,
+    "modules.large_document": 50,
+    "modules.models": 50,
+    "modules.news_archive": 50,
+    "modules.near_duplicates": 50,
+    "modules.news_finder": 300,
+    "modules.quote_tracker": 50,
+    "modules.result_cache": 50,
+    "modules.sentiment_analyzer": 50,
+    "modules.server": 100,
+    "modules.stemming": 50,
+    "modules.term_matrix": 50,
+    "modules.visualizer": 50,
+}
+
+# Pustaka berat yang tidak boleh dimuat hanya karena modul diimpor
+HEAVY_MODULES = (
+    "nltk", "sklearn", "scipy", "Sastrawi", "torch", "transformers", "PyPDF2", "docx2txt", "streamlit"
+)
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(f"{{elapsed:.1f}}|{{','.join(heavy)}}")
+"""
+
+
+def measure(module: str, repeat: int = 3) -> Tuple[float, List[str]]:
+    """
+    Import a module in fresh interpreters and return the best time and heavy modules loaded.
+
+    Args:
+        module: Dotted module name
+        repeat: Number of fresh interpreters to try (the minimum is reported)
+
+    Returns:
+        Tuple of (milliseconds, heavy dependency names loaded by the import)
+    """
+    best = float("inf")
+    heavy: List[str] = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        elapsed, loaded = output.split("|")
+        best = min(best, float(elapsed))
+        heavy = [name for name in loaded.split(",") if name]
+    return best, heavy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Laporan biaya impor per modul")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah percobaan per modul")
+    parser.add_argument("--scale", type=float, default=1.0, help="Pengali anggaran (mis. untuk mesin CI lambat)")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'Modul':32} {'Waktu (ms)':>10} {'Anggaran':>10}  Pustaka berat")
+    for module, budget in BUDGETS_MS.items():
+        elapsed, heavy = measure(module, args.repeat)
+        budget *= args.scale
+        over = elapsed > budget or heavy
+        failures += bool(over)
+        status = "GAGAL" if over else "ok"
+        print(f"{module:32} {elapsed:10.1f} {budget:10.0f}  {', '.join(heavy) or '-'}  {status}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+Pipeline benchmark for Analisis Siaran Pers.
+Times text extraction per format and each KeywordExtractor stage over a
+synthetic (or real) corpus, reports throughput and peak memory, and flags
+regressions against a stored baseline.
+
+Usage:
+    python benchmarks/pipeline.py [--docs N] [--words N] [--repeat N]
+        [--corpus DIR] [--baseline FILE] [--save-baseline] [--tolerance 0.2]
+
+Exits with status 1 if any metric regresses beyond the tolerance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import generate_corpus  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# Tahap analisis dijalankan dengan urutan yang sama seperti KeywordExtractor.analyze_text
+ANALYSIS_STAGES = ("context", "keywords", "key_phrases", "quotes", "entities")
+
+
+def _analysis_steps(extractor, text: str) -> List[Tuple[str, Callable[[], object]]]:
+    """Return the analysis stages of one text as (name, function) pairs sharing one context."""
+    state = {}
+
+    def build_context():
+        state["context"] = extractor.build_context(text)
+
+    return [
+        ("context", build_context),
+        ("keywords", lambda: extractor.extract_keywords_tfidf(text, num_keywords=15, context=state["context"])),
+        ("key_phrases", lambda: extractor.extract_keyphrases(text, num_phrases=5, context=state["context"])),
+        ("quotes", lambda: extractor.extract_quotes(text, context=state["context"])),
+        ("entities", lambda: extractor.extract_named_entities(text, context=state["context"])),
+    ]
+
+
+def _load_corpus(args) -> List[Tuple[str, bytes]]:
+    if args.corpus:
+        from modules.batch_processor import iter_path_documents
+        return list(iter_path_documents([args.corpus]))
+    formats = tuple(name.strip() for name in args.formats.split(",") if name.strip())
+    return list(generate_corpus(args.docs, args.words, args.quote_density, args.entity_density,
+                                formats, args.seed))
+
+
+def run_once(documents: List[Tuple[str, bytes]], extractor, trace_memory: bool = False,
+             reset: Optional[Callable[[], None]] = None) -> Dict[str, Dict]:
+    """
+    Run extraction and analysis over all documents once.
+
+    Args:
+        documents: List of (name, content) tuples
+        extractor: KeywordExtractor used for the analysis stages
+        trace_memory: Record the peak traced allocation per stage (slower)
+        reset: Called (untimed) before each document is analyzed, e.g. to clear caches
+
+    Returns:
+        Mapping of stage name to {"seconds", "docs", "words", "peak_mb"}
+    """
+    from modules.document_processor import DocumentProcessor
+
+    stages: Dict[str, Dict] = defaultdict(lambda: {"seconds": 0.0, "docs": 0, "words": 0, "peak_mb": 0.0})
+
+    def measure(stage: str, function: Callable[[], object], words: int = 0):
+        if trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        value = function()
+        elapsed = time.perf_counter() - started
+        entry = stages[stage]
+        entry["seconds"] += elapsed
+        entry["docs"] += 1
+        entry["words"] += words
+        if trace_memory:
+            peak = (tracemalloc.get_traced_memory()[1] - baseline) / (1024 * 1024)
+            entry["peak_mb"] = max(entry["peak_mb"], peak)
+        return value
+
+    for name, content in documents:
+        extension = name.rsplit(".", 1)[-1].lower()
+        text = measure(f"extract_{extension}", lambda: DocumentProcessor.extract_text_from_bytes(name, content))
+        words = len(text.split())
+        stages[f"extract_{extension}"]["words"] += words
+        if len(text.strip()) < 50:
+            continue
+        if reset:
+            reset()
+        for stage, function in _analysis_steps(extractor, text):
+            measure(stage, function, words)
+        stages["analyze_total"]["docs"] += 1
+        stages["analyze_total"]["words"] += words
+
+    stages["analyze_total"]["seconds"] = sum(stages[stage]["seconds"] for stage in ANALYSIS_STAGES)
+    if trace_memory:
+        stages["analyze_total"]["peak_mb"] = max(stages[stage]["peak_mb"] for stage in ANALYSIS_STAGES)
+    return dict(stages)
+
+
+def benchmark(documents: List[Tuple[str, bytes]], repeat: int = 3) -> Dict[str, Dict]:
+    """
+    Benchmark the pipeline and summarize per-stage metrics.
+
+    Timings are the median of ``repeat`` untraced runs after one warm-up run;
+    peak memory comes from a separate tracemalloc run. The extractor has no
+    segment cache and its stem cache is cleared before every document, so the
+    timings measure the pipeline itself rather than results cached by an
+    earlier run or by another format of the same release.
+
+    Args:
+        documents: List of (name, content) tuples
+        repeat: Number of timed runs
+
+    Returns:
+        Mapping of stage name to {"ms_per_doc", "docs_per_sec", "words_per_sec", "peak_mb"}
+    """
+    from modules.keyword_extractor import KeywordExtractor
+
+    extractor = KeywordExtractor(segment_cache_size=0)
+    run_once(documents[:1], extractor)
+
+    reset = extractor.stemmer.clear
+    runs = [run_once(documents, extractor, reset=reset) for _ in range(repeat)]
+
+    tracemalloc.start()
+    try:
+        traced = run_once(documents, extractor, trace_memory=True, reset=reset)
+    finally:
+        tracemalloc.stop()
+
+    summary = {}
+    for stage in runs[0]:
+        seconds = statistics.median(run[stage]["seconds"] for run in runs)
+        docs = runs[0][stage]["docs"]
+        words = runs[0][stage]["words"]
+        summary[stage] = {
+            "ms_per_doc": seconds / docs * 1000 if docs else 0.0,
+            "docs_per_sec": docs / seconds if seconds else 0.0,
+            "words_per_sec": words / seconds if seconds else 0.0,
+            "peak_mb": traced[stage]["peak_mb"],
+        }
+    return summary
+
+
+def compare(summary: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """
+    Compare a summary with a baseline.
+
+    Args:
+        summary: Current results from ``benchmark``
+        baseline: Stored results
+        tolerance: Allowed relative slowdown or memory growth (0.2 = 20%)
+
+    Returns:
+        Descriptions of regressed metrics
+    """
+    regressions = []
+    for stage, metrics in summary.items():
+        reference = baseline.get(stage)
+        if not reference:
+            continue
+        for metric in ("ms_per_doc", "peak_mb"):
+            # Abaikan nilai yang terlalu kecil untuk diukur dengan andal
+            if reference[metric] < 0.05:
+                continue
+            change = metrics[metric] / reference[metric] - 1
+            if change > tolerance:
+                regressions.append(f"{stage}.{metric}: {reference[metric]:.2f} -> {metrics[metric]:.2f} "
+                                   f"(+{change * 100:.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ekstraksi dan analisis siaran pers")
+    parser.add_argument("--docs", type=int, default=20, help="Jumlah rilis sintetis")
+    parser.add_argument("--words", type=int, default=600, help="Perkiraan jumlah kata per rilis")
+    parser.add_argument("--quote-density", type=float, default=2.0, help="Kutipan per 100 kata")
+    parser.add_argument("--entity-density", type=float, default=4.0, help="Kalimat berentitas per 100 kata")
+    parser.add_argument("--formats", default="txt,docx,pdf", help="Format file, dipisahkan koma")
+    parser.add_argument("--seed", type=int, default=42, help="Seed acak")
+    parser.add_argument("--corpus", default=None, help="Folder atau ZIP dokumen nyata (menggantikan korpus sintetis)")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan terukur")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="File JSON baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Simpan hasil sebagai baseline baru")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Toleransi regresi relatif")
+    parser.add_argument("--json", default=None, help="Tulis hasil lengkap ke file JSON")
+    args = parser.parse_args()
+
+    documents = _load_corpus(args)
+    summary = benchmark(documents, args.repeat)
+
+    print(f"{'Tahap':16} {'ms/dok':>10} {'dok/dtk':>10} {'kata/dtk':>12} {'puncak MB':>10}")
+    for stage, metrics in sorted(summary.items()):
+        print(f"{stage:16} {metrics['ms_per_doc']:10.2f} {metrics['docs_per_sec']:10.1f} "
+              f"{metrics['words_per_sec']:12.0f} {metrics['peak_mb']:10.2f}")
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "documents": len(documents),
+        "stages": summary,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Baseline disimpan ke {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline {args.baseline} belum ada; jalankan dengan --save-baseline.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    regressions = compare(summary, baseline["stages"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESI {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,31 @@
 Analisis Siaran Pers Modules Package.
 """
 
-# Import modules to make them available when importing the package
-from .document_processor import DocumentProcessor
-from .keyword_extractor import KeywordExtractor
+import importlib
+
+# Modul diimpor saat atribut pertama kali diakses (PEP 562), sehingga
+# "import modules" tidak ikut memuat pustaka NLP/ML yang berat.
+_EXPORTS = {
+    'DocumentProcessor': '.document_processor',
+    'KeywordExtractor': '.keyword_extractor',
+    'get_shared_extractor': '.keyword_extractor',
+    'warm_up': '.keyword_extractor',
+    'SentimentAnalyzer': '.sentiment_analyzer',
+    'get_shared_sentiment_analyzer': '.sentiment_analyzer',
+    'AnalysisResult': '.models',
+    'export_results': '.models',
+    'NewsArchive': '.news_archive',
+    'Visualizer': '.visualizer',
+}
 
 # Modules yang akan diimplementasikan kemudian
 # from .news_finder import NewsFinder
-# from .sentiment_analyzer import SentimentAnalyzer
-# from .visualizer import Visualizer
 
-__all__ = ['DocumentProcessor', 'KeywordExtractor']  # Tambahkan modul lain di sini nanti
+__all__ = list(_EXPORTS)  # Tambahkan modul lain di sini nanti
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,196 @@
+"""
+Analysis Context Module for Analisis Siaran Pers.
+Holds the segmented and tokenized form of a document so every extraction
+stage can share it instead of re-tokenizing the text. Per-segment results
+are memoized by content, so a revised draft only re-processes the
+paragraphs that changed.
+"""
+
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Batas segmen: baris kosong, atau akhir baris tepat setelah tanda akhir kalimat
+SEGMENT_BOUNDARY = re.compile(r'\n[ \t]*\n\s*|(?<=[.!?"\u201d\u2019])[ \t]*\n\s*')
+
+
+def split_segments(text: str) -> List[Tuple[int, int]]:
+    """
+    Split text into paragraph-like segments that never cut through a sentence.
+
+    Args:
+        text: Document text
+
+    Returns:
+        (start, end) character offsets of the non-empty segments
+    """
+    spans = []
+    start = 0
+    for match in SEGMENT_BOUNDARY.finditer(text):
+        if text[start:match.start()].strip():
+            spans.append((start, match.start()))
+        start = match.end()
+    if text[start:].strip():
+        spans.append((start, len(text)))
+    return spans
+
+
+def _parse_segment(segment: str) -> List[Tuple[int, int, List[str]]]:
+    """Split a segment into sentences and word tokens, with offsets relative to the segment."""
+    from nltk.tokenize import word_tokenize, sent_tokenize
+
+    # Cari offset setiap kalimat secara berurutan (linear terhadap panjang segmen)
+    parsed = []
+    cursor = 0
+    for sentence in sent_tokenize(segment):
+        start = segment.find(sentence, cursor)
+        if start < 0:
+            start = cursor
+        end = start + len(sentence)
+        parsed.append((start, end, word_tokenize(sentence, preserve_line=True)))
+        cursor = end
+    return parsed
+
+
+class SegmentCache:
+    """Thread-safe LRU of per-segment and per-sentence results keyed by (kind, text)."""
+
+    def __init__(self, capacity: int = 20000):
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Maximum number of entries kept (0 disables caching)
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, kind: str, text: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for a segment, computing it on a miss.
+
+        Cached values are shared between documents and must not be mutated.
+
+        Args:
+            kind: Result type, e.g. "sentences", "terms" or "entities"
+            text: Segment or sentence text
+            compute: Function producing the result
+
+        Returns:
+            Cached or freshly computed result
+        """
+        key = (kind, text)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        value = compute()
+        if self.capacity:
+            with self._lock:
+                self._cache[key] = value
+                if len(self._cache) > self.capacity:
+                    self._cache.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        with self._lock:
+            return {"size": len(self._cache), "capacity": self.capacity, "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class AnalysisContext:
+    """Sentences, tokens and offsets of one document, built once per analysis."""
+
+    def __init__(self, text: str, sentences: List[str], sentence_spans: List[Tuple[int, int]],
+                 sentence_tokens: List[List[str]], segment_spans: Optional[List[Tuple[int, int]]] = None):
+        """
+        Initialize the context. Use ``AnalysisContext.build`` to create one from raw text.
+
+        Args:
+            text: Original document text
+            sentences: Sentences in document order
+            sentence_spans: (start, end) character offsets of each sentence in ``text``
+            sentence_tokens: Word tokens of each sentence
+            segment_spans: (start, end) character offsets of each segment (defaults to the whole text)
+        """
+        self.text = text
+        self.segment_spans = segment_spans if segment_spans is not None else [(0, len(text))]
+        self.sentences = sentences
+        self.sentence_spans = sentence_spans
+        self.sentence_tokens = sentence_tokens
+        self.lower_sentences = [sentence.lower() for sentence in sentences]
+        self.sentence_starts = [start for start, _ in sentence_spans]
+        # Hasil antar-tahap (mis. TF-IDF) disimpan di sini agar tidak dihitung ulang
+        self.cache: Dict[Any, Any] = {}
+
+    @classmethod
+    def build(cls, text: str, segment_cache: Optional[SegmentCache] = None) -> "AnalysisContext":
+        """
+        Segment and tokenize a document once.
+
+        The text is split into segments first; each segment is sentence-split
+        and tokenized on its own, so unchanged segments of a revised draft are
+        served from ``segment_cache``.
+
+        Args:
+            text: Text to analyze
+            segment_cache: Optional cache of parsed segments
+
+        Returns:
+            AnalysisContext for the text
+        """
+        segment_spans = split_segments(text)
+        sentences = []
+        spans = []
+        tokens = []
+        for segment_start, segment_end in segment_spans:
+            segment = text[segment_start:segment_end]
+            if segment_cache is not None:
+                parsed = segment_cache.get_or_compute("sentences", segment, lambda: _parse_segment(segment))
+            else:
+                parsed = _parse_segment(segment)
+            for start, end, sentence_tokens in parsed:
+                sentences.append(segment[start:end])
+                spans.append((segment_start + start, segment_start + end))
+                tokens.append(sentence_tokens)
+        return cls(text, sentences, spans, tokens, segment_spans)
+
+    def segments(self) -> List[Tuple[int, str]]:
+        """Return (start offset, text) of each segment."""
+        return [(start, self.text[start:end]) for start, end in self.segment_spans]
+
+    @property
+    def tfidf_documents(self) -> List[str]:
+        """Sentences used as TF-IDF documents, chunked when the text has too few sentences."""
+        if len(self.sentences) >= 2:
+            return self.sentences
+        # Split into chunks of ~100 characters
+        chunks = [self.text[i:i + 100] for i in range(0, len(self.text), 100)]
+        return chunks if chunks else ["dummy text"]
+
+    def sentence_index_at(self, offset: int) -> int:
+        """
+        Return the index of the sentence containing a character offset.
+
+        Args:
+            offset: Character offset in the original text
+
+        Returns:
+            Sentence index, or -1 if the offset lies before the first sentence
+        """
+        return bisect_right(self.sentence_starts, offset) - 1
@@ -0,0 +1,310 @@
+"""
+Analysis Service Module for Analisis Siaran Pers.
+Headless analysis API: extracts and analyzes documents without any
+Streamlit dependency and reports errors as structured results, so the same
+code runs in the UI, batch jobs and the HTTP worker service.
+"""
+
+import logging
+import time
+from typing import Callable, Dict, Optional, Union
+
+from .document_processor import (
+    EXTRACTION_VERSION, MAX_PDF_PAGES, DocumentError, DocumentProcessor, check_upload_size, content_size
+)
+from .instrumentation import count, profile, stage
+from .large_document import LargeDocument, is_large, stream_document_chunks
+from .result_cache import content_key, get_result_cache
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker() -> None:
+    """Warm one shared KeywordExtractor in a worker process."""
+    from .keyword_extractor import warm_up
+    warm_up()
+
+
+def _serializable(analysis: Dict) -> Dict:
+    """Return a copy of an analysis result that can be encoded as JSON."""
+    analysis = dict(analysis)
+    # Skor numpy diubah ke float agar hasil dapat diserialisasi
+    analysis["keywords"] = [(keyword, float(score)) for keyword, score in analysis["keywords"]]
+    return analysis
+
+
+def _cached(key: str, compute: Callable[[], object], stage_name: str):
+    """Return the cached result for a key, counting result-cache hits and misses."""
+    computed = []
+
+    def run():
+        computed.append(True)
+        return compute()
+
+    value = get_result_cache().get_or_compute(key, run)
+    count(f"result_cache_{'misses' if computed else 'hits'}.{stage_name}")
+    return value
+
+
+def extract_document(name: str, content, progress_callback: Optional[Callable[[int, int], None]] = None,
+                     use_cache: bool = True) -> Dict:
+    """
+    Extract text from a document.
+
+    Args:
+        name: Document file name (its extension selects the extractor)
+        content: Raw file bytes or a binary file object
+        progress_callback: Called with (pages_done, total_pages) while a PDF is extracted
+        use_cache: Reuse and store results in the shared result cache
+
+    Returns:
+        Dictionary with name, status ("ok" or "error"), stage, text, error, elapsed seconds
+        and profile (stage timings and counters)
+    """
+    started = time.perf_counter()
+    result = {"name": name, "status": "error", "stage": "extract", "text": None, "error": None, "elapsed": 0.0}
+    with profile(name) as current:
+        _extract_into(result, name, content, progress_callback, use_cache)
+    result["profile"] = current.to_dict()
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def extract_large_document(name: str, content,
+                           progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """
+    Extract a very large document to a temporary text file, keeping only a preview in memory.
+
+    Args:
+        name: Document file name (its extension selects the extractor)
+        content: Raw file bytes or a binary file object
+        progress_callback: Called with (pages_done, total_pages) while a PDF is extracted
+
+    Returns:
+        Dictionary with name, status ("ok" or "error"), stage, document (LargeDocument),
+        text (the preview), error, elapsed seconds and profile
+    """
+    started = time.perf_counter()
+    result = {"name": name, "status": "error", "stage": "extract", "document": None, "text": None,
+              "error": None, "elapsed": 0.0}
+    with profile(name) as current:
+        try:
+            document = LargeDocument.extract(name, content, progress_callback)
+            result.update(status="ok", document=document, text=document.preview)
+        except DocumentError as e:
+            result["error"] = str(e)
+        except Exception as e:
+            logger.exception("Ekstraksi %s gagal", name)
+            result["error"] = f"{type(e).__name__}: {e}"
+    result["profile"] = current.to_dict()
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def _extract_into(result: Dict, name: str, content, progress_callback, use_cache: bool) -> None:
+    """Fill the text, status and error of an extraction result."""
+    def extract() -> str:
+        return DocumentProcessor.extract_text_from_bytes(name, content, progress_callback)
+
+    try:
+        # Ukuran diperiksa sebelum isi file dibaca ke memori
+        check_upload_size(content_size(content))
+        if use_cache:
+            extension = name.rsplit(".", 1)[-1].lower()
+            key = content_key(content, "extract", EXTRACTION_VERSION, extension, MAX_PDF_PAGES)
+            result["text"] = _cached(key, extract, "extract")
+        else:
+            result["text"] = extract()
+        result["status"] = "ok"
+    except DocumentError as e:
+        result["error"] = str(e)
+    except Exception as e:
+        logger.exception("Ekstraksi %s gagal", name)
+        result["error"] = f"{type(e).__name__}: {e}"
+
+
+def analyze_text(text: Union[str, LargeDocument], use_cache: bool = True, method: Optional[str] = None) -> Dict:
+    """
+    Analyze extracted text with the shared KeywordExtractor.
+
+    Args:
+        text: Text to analyze, or a LargeDocument to analyze chunk by chunk
+        use_cache: Reuse and store results in the shared result cache
+        method: Keyword method, "tfidf" or "embedding" (defaults to ANALISIS_KEYWORD_METHOD)
+
+    Returns:
+        Dictionary with status ("ok" or "error"), stage, analysis (JSON-serializable),
+        analysis_key, error, elapsed seconds and profile (stage timings and counters)
+    """
+    started = time.perf_counter()
+    result = {"status": "error", "stage": "analyze", "analysis": None, "analysis_key": None,
+              "error": None, "elapsed": 0.0}
+    with profile("analyze") as current:
+        _analyze_into(result, text, use_cache, method)
+    result["profile"] = current.to_dict()
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def _analyze_into(result: Dict, text: Union[str, LargeDocument], use_cache: bool, method: Optional[str]) -> None:
+    """Fill the analysis, key, status and error of an analysis result."""
+    from .keyword_extractor import get_shared_extractor
+
+    try:
+        # Pemuatan pertama (kamus stemmer, stopwords) tercatat sebagai tahap tersendiri
+        with stage("analyze.load"):
+            extractor = get_shared_extractor()
+        if isinstance(text, LargeDocument):
+            # Dokumen besar dianalisis per potongan langsung dari file teksnya
+            key = content_key(text.key, "analyze", extractor.cache_signature(method))
+            document = text
+
+            def analyze() -> Dict:
+                return _serializable(extractor.analyze_chunks(document.chunks(), keyword_method=method))
+        else:
+            key = content_key(text, "analyze", extractor.cache_signature(method))
+
+            def analyze() -> Dict:
+                return _serializable(extractor.analyze_text(text, keyword_method=method))
+        result["analysis_key"] = key
+
+        if use_cache:
+            result["analysis"] = _cached(key, analyze, "analyze")
+        else:
+            result["analysis"] = analyze()
+        result["status"] = "ok"
+    except (ValueError, ImportError) as e:
+        result["error"] = str(e)
+    except Exception as e:
+        logger.exception("Analisis teks gagal")
+        result["error"] = f"{type(e).__name__}: {e}"
+
+
+def _analyze_streaming_into(result: Dict, name: str, content, use_cache: bool, method: Optional[str]) -> None:
+    """Fill an ``analyze_document`` result by analyzing chunks while later pages are still extracted."""
+    from .keyword_extractor import get_shared_extractor
+
+    try:
+        check_upload_size(content_size(content))
+        with stage("analyze.load"):
+            extractor = get_shared_extractor()
+        extension = name.rsplit(".", 1)[-1].lower()
+        key = content_key(content, "analyze_stream", EXTRACTION_VERSION, extension, MAX_PDF_PAGES,
+                          extractor.cache_signature(method))
+        result["analysis_key"] = key
+
+        def analyze() -> Dict:
+            length = 0
+
+            def chunks():
+                nonlocal length
+                for offset, chunk in stream_document_chunks(name, content):
+                    length = offset + len(chunk)
+                    yield offset, chunk
+
+            analysis = _serializable(extractor.analyze_chunks(chunks(), keyword_method=method))
+            return {"analysis": analysis, "text_length": length}
+
+        streamed = _cached(key, analyze, "analyze") if use_cache else analyze()
+        result.update(status="ok", analysis=streamed["analysis"], text_length=streamed["text_length"])
+    except DocumentError as e:
+        result["error"] = str(e)
+    except (ValueError, ImportError) as e:
+        result.update(stage="analyze", error=str(e))
+    except Exception as e:
+        logger.exception("Analisis %s gagal", name)
+        result.update(stage="analyze", error=f"{type(e).__name__}: {e}")
+
+
+def analyze_document(name: str, content, use_cache: bool = True, typed: bool = False,
+                     method: Optional[str] = None) -> Dict:
+    """
+    Extract and analyze a single document.
+
+    Documents above ANALISIS_LARGE_DOCUMENT_MB are extracted page by page
+    and analyzed in segment-aligned chunks as the pages arrive, so the full
+    text is never held in memory.
+
+    Args:
+        name: Document file name
+        content: Raw file bytes or a binary file object
+        use_cache: Reuse and store results in the shared result cache
+        typed: Also return the analysis as an ``AnalysisResult`` with character
+            offsets under "result" (not JSON-serializable)
+        method: Keyword method, "tfidf" or "embedding" (defaults to ANALISIS_KEYWORD_METHOD)
+
+    Returns:
+        Dictionary with name, status ("ok" or "error"), stage of the failure
+        ("extract" or "analyze", None on success), analysis, analysis_key,
+        text_length, error, elapsed seconds and profile (stage timings and counters)
+    """
+    started = time.perf_counter()
+    with profile(name) as current:
+        result = {"name": name, "status": "error", "stage": "extract", "analysis": None, "analysis_key": None,
+                  "text_length": 0, "error": None, "elapsed": 0.0}
+        if is_large(content_size(content)):
+            # Potongan awal dianalisis selagi halaman berikutnya masih diekstrak
+            _analyze_streaming_into(result, name, content, use_cache, method)
+        else:
+            extracted = extract_document(name, content, use_cache=use_cache)
+            result["error"] = extracted["error"]
+            if extracted["status"] == "ok":
+                result["text_length"] = len(extracted["text"])
+                analyzed = analyze_text(extracted["text"], use_cache=use_cache, method=method)
+                result.update(status=analyzed["status"], stage="analyze", analysis=analyzed["analysis"],
+                              analysis_key=analyzed["analysis_key"], error=analyzed["error"])
+    result["profile"] = current.to_dict()
+
+    if result["status"] == "ok":
+        result["stage"] = None
+        if typed:
+            from .models import AnalysisResult
+            result["result"] = AnalysisResult.from_analysis(result["analysis"])
+
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def compare_keyword_methods(text: Union[str, LargeDocument], methods=("tfidf", "embedding"),
+                            num_keywords: int = 15) -> Dict[str, Dict]:
+    """
+    Extract keywords with several methods on the same text, for a side-by-side comparison.
+
+    A LargeDocument is compared through the chunked analysis of its whole
+    text (``analyze_text``, shared through the result cache), keeping at most
+    15 keywords per method; embedding keywords then come from its first chunk
+    (see ``KeywordExtractor.analyze_chunks``).
+
+    Args:
+        text: Text to analyze, or a LargeDocument
+        methods: Keyword methods to run
+        num_keywords: Number of keywords per method
+
+    Returns:
+        Mapping of method to {"keywords", "elapsed", "error"}; keyword scores are floats
+    """
+    from .keyword_extractor import get_shared_extractor
+
+    comparison = {}
+    if isinstance(text, LargeDocument):
+        for method in methods:
+            started = time.perf_counter()
+            analyzed = analyze_text(text, method=method)
+            keywords = analyzed["analysis"]["keywords"][:num_keywords] if analyzed["status"] == "ok" else []
+            comparison[method] = {"keywords": [(keyword, float(score)) for keyword, score in keywords],
+                                  "elapsed": time.perf_counter() - started, "error": analyzed["error"]}
+        return comparison
+
+    extractor = get_shared_extractor()
+    context = extractor.build_context(text)
+    for method in methods:
+        started = time.perf_counter()
+        entry = {"keywords": [], "elapsed": 0.0, "error": None}
+        try:
+            keywords = extractor.extract_keywords(text, num_keywords=num_keywords, context=context, method=method)
+            entry["keywords"] = [(keyword, float(score)) for keyword, score in keywords]
+        except (ValueError, ImportError) as e:
+            entry["error"] = str(e)
+        entry["elapsed"] = time.perf_counter() - started
+        comparison[method] = entry
+    return comparison
@@ -0,0 +1,214 @@
+"""
+Batch Processor Module for Analisis Siaran Pers.
+Analyzes many press releases at once (a folder, a ZIP archive or several
+uploads) across a process pool and streams per-document results.
+"""
+
+import logging
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .analysis_service import analyze_document, init_worker
+from .document_processor import SUPPORTED_EXTENSIONS
+
+# Pasangan (nama_file, isi_file) yang akan dianalisis
+Document = Tuple[str, bytes]
+
+logger = logging.getLogger(__name__)
+
+
+def _is_supported(filename: str) -> bool:
+    """Check whether a file name has an extension the DocumentProcessor handles."""
+    return filename.rsplit(".", 1)[-1].lower() in SUPPORTED_EXTENSIONS
+
+
+def iter_zip_documents(source) -> Iterator[Document]:
+    """
+    Yield supported documents from a ZIP archive.
+
+    Args:
+        source: Path or file-like object of the archive
+
+    Yields:
+        (name, content) tuples, one member at a time
+    """
+    with zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            if not info.is_dir() and _is_supported(info.filename):
+                yield info.filename, archive.read(info)
+
+
+def iter_path_documents(paths: Iterable[str]) -> Iterator[Document]:
+    """
+    Yield supported documents from files, folders (recursively) and ZIP archives.
+
+    Args:
+        paths: File, folder or ZIP paths
+
+    Yields:
+        (name, content) tuples, read lazily
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file() and _is_supported(child.name):
+                    yield str(child.relative_to(path)), child.read_bytes()
+        elif path.suffix.lower() == ".zip":
+            yield from iter_zip_documents(path)
+        elif _is_supported(path.name):
+            yield path.name, path.read_bytes()
+
+
+def iter_uploaded_documents(uploaded_files) -> Iterator[Document]:
+    """
+    Yield documents from Streamlit uploads, expanding any ZIP archives.
+
+    Args:
+        uploaded_files: List of Streamlit UploadedFile objects
+
+    Yields:
+        (name, content) tuples
+    """
+    for uploaded_file in uploaded_files:
+        if uploaded_file.name.lower().endswith(".zip"):
+            yield from iter_zip_documents(uploaded_file)
+        elif _is_supported(uploaded_file.name):
+            yield uploaded_file.name, uploaded_file.getvalue()
+
+
+def analyze_batch(documents: Iterable[Document], workers: Optional[int] = None,
+                  max_pending: Optional[int] = None, typed: bool = False) -> Iterator[Dict]:
+    """
+    Analyze documents in parallel and yield results as they finish.
+
+    Only a bounded number of documents is held in flight, so large archives
+    are not loaded into memory all at once. A failure never ends the batch:
+    if a worker process dies (e.g. killed for running out of memory), the
+    pool is recreated and the documents that were in flight are retried one
+    at a time, so the document that kills its worker is reported by name.
+
+    Args:
+        documents: Iterable of (name, content) tuples
+        workers: Number of worker processes (defaults to the CPU count)
+        max_pending: Maximum number of submitted but unfinished documents
+        typed: Also return an ``AnalysisResult`` with character offsets under "result"
+
+    Yields:
+        Result dictionaries from ``analysis_service.analyze_document`` with an added "index"
+        (completion order, starting at 1); documents whose worker failed get
+        status "error" and stage "worker"
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    documents = iter(documents)
+    completed = 0
+
+    # Future -> (nama, isi, dijalankan sendiri); isi disimpan agar dokumen dapat diulang
+    pending: Dict = {}
+    retries = deque()
+    exhausted = False
+    executor = None
+    try:
+        while pending or retries or not exhausted:
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+            if retries:
+                # Dokumen yang sedang berjalan saat worker mati diulang satu per satu
+                if not pending:
+                    name, content = retries.popleft()
+                    pending[executor.submit(analyze_document, name, content, True, typed)] = (name, content, True)
+            else:
+                # Isi antrean sampai batas maksimum
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        name, content = next(documents)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[executor.submit(analyze_document, name, content, True, typed)] = (name, content, False)
+
+            if not pending:
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = any(isinstance(future.exception(), BrokenProcessPool) for future in done)
+            if broken:
+                # Semua dokumen lain di pool yang rusak juga gagal; kumpulkan sebelum pool dibuat ulang
+                done, _ = wait(pending)
+                executor.shutdown(wait=True)
+                executor = None
+
+            for future in done:
+                name, content, isolated = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    result = future.result()
+                elif isinstance(error, BrokenProcessPool) and not isolated:
+                    retries.append((name, content))
+                    continue
+                else:
+                    logger.error("Worker gagal memproses %s: %r", name, error)
+                    if isinstance(error, BrokenProcessPool):
+                        message = "Proses worker berhenti saat memproses dokumen ini (misalnya kehabisan memori)."
+                    else:
+                        message = f"{type(error).__name__}: {error}"
+                    result = {"name": name, "status": "error", "stage": "worker", "analysis": None,
+                              "analysis_key": None, "text_length": 0, "error": message, "elapsed": 0.0,
+                              "profile": {}}
+                completed += 1
+                result["index"] = completed
+                yield result
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Menjalankan analisis batch dari command line:
+# python -m modules.batch_processor <file|folder|zip>... [--workers N] [--output hasil.jsonl]
+#     [--export folder_tabel] [--export-format parquet|arrow]
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="Analisis batch dokumen siaran pers")
+    parser.add_argument("paths", nargs="+", help="File, folder, atau arsip ZIP")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker")
+    parser.add_argument("--output", default=None, help="File JSON Lines untuk hasil (default: stdout)")
+    parser.add_argument("--export", default=None, help="Folder untuk tabel kolumnar (butuh pyarrow)")
+    parser.add_argument("--export-format", choices=("parquet", "arrow"), default="parquet",
+                        help="Format tabel kolumnar")
+    args = parser.parse_args()
+
+    writer = None
+    if args.export:
+        from .models import ResultTableWriter
+        writer = ResultTableWriter(args.export, args.export_format)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failures = 0
+    try:
+        for result in analyze_batch(iter_path_documents(args.paths), workers=args.workers,
+                                    typed=writer is not None):
+            typed_result = result.pop("result", None)
+            if writer is not None and typed_result is not None:
+                writer.add(result["name"], typed_result)
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            output.flush()
+            if result["status"] != "ok":
+                failures += 1
+            print(f"[{result['index']}] {result['name']}: {result['status']} "
+                  f"({result['elapsed']:.2f} dtk){' - ' + result['error'] if result['error'] else ''}",
+                  file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if writer is not None:
+            writer.close()
+
+    sys.exit(1 if failures else 0)
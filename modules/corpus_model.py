@@ -0,0 +1,132 @@
+"""
+Corpus Model Module for Analisis Siaran Pers.
+Keeps document frequencies of stemmed terms over the press-release archive
+so new documents can be scored against corpus-wide IDF without refitting.
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class CorpusTfidfModel:
+    """Incrementally updated IDF model over stemmed terms."""
+
+    def __init__(self, doc_freq: Dict[str, int] = None, n_docs: int = 0):
+        """
+        Initialize the model.
+
+        Args:
+            doc_freq: Number of documents containing each term
+            n_docs: Number of documents seen so far
+        """
+        # Hanya term yang pernah muncul yang disimpan (representasi jarang)
+        self.doc_freq: Dict[str, int] = dict(doc_freq or {})
+        self.n_docs = n_docs
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def add_documents(self, documents: Iterable[List[str]]) -> int:
+        """
+        Update document frequencies with new documents.
+
+        Args:
+            documents: Iterable of token lists (already stemmed and filtered)
+
+        Returns:
+            Number of documents added
+        """
+        added = 0
+        for tokens in documents:
+            with self._lock:
+                for term in set(tokens):
+                    self.doc_freq[term] = self.doc_freq.get(term, 0) + 1
+                self.n_docs += 1
+                self._fingerprint = None
+            added += 1
+        return added
+
+    def fingerprint(self) -> str:
+        """
+        Return a content hash of the vocabulary and document frequencies (and so of the IDF).
+
+        Computed once and recomputed only after documents are added; used in
+        cache keys so a model refitted on another corpus of the same size
+        invalidates cached analyses.
+        """
+        with self._lock:
+            if self._fingerprint is None:
+                payload = json.dumps([self.n_docs, sorted(self.doc_freq.items())], ensure_ascii=False)
+                self._fingerprint = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+            return self._fingerprint
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency, as in scikit-learn's TfidfTransformer."""
+        return math.log((1 + self.n_docs) / (1 + self.doc_freq.get(term, 0))) + 1
+
+    def transform(self, tokens: List[str]) -> Dict[str, float]:
+        """
+        Score the terms of one document against the corpus IDF.
+
+        Args:
+            tokens: Stemmed and filtered tokens of the document
+
+        Returns:
+            Dictionary of term -> TF-IDF score (L2-normalized)
+        """
+        counts = Counter(tokens)
+        if not counts:
+            return {}
+
+        total = sum(counts.values())
+        scores = {term: (count / total) * self.idf(term) for term, count in counts.items()}
+        norm = math.sqrt(sum(score * score for score in scores.values())) or 1.0
+        return {term: score / norm for term, score in scores.items()}
+
+    def top_terms(self, tokens: List[str], num_terms: int = 10) -> List[Tuple[str, float]]:
+        """Return the highest scoring terms of a document."""
+        scores = self.transform(tokens)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:num_terms]
+
+    def save(self, path: str) -> None:
+        """Write the model to a JSON file (atomically)."""
+        with self._lock:
+            payload = {"n_docs": self.n_docs, "doc_freq": self.doc_freq}
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CorpusTfidfModel":
+        """Load a model saved with ``save``."""
+        with open(path, encoding="utf-8") as handle:
+            payload = json.load(handle)
+        return cls(payload.get("doc_freq", {}), payload.get("n_docs", 0))
+
+
+# Membangun/memperbarui model dari folder arsip:
+# python -m modules.corpus_model <folder_arsip> <model.json>
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+    from .keyword_extractor import get_shared_extractor
+
+    if len(sys.argv) != 3:
+        print("Penggunaan: python -m modules.corpus_model <folder_arsip> <model.json>")
+        sys.exit(1)
+
+    archive_dir, model_path = sys.argv[1], sys.argv[2]
+    model = CorpusTfidfModel.load(model_path) if os.path.exists(model_path) else CorpusTfidfModel()
+    extractor = get_shared_extractor()
+    files = sorted(Path(archive_dir).rglob("*.txt"))
+    model.add_documents(
+        extractor.preprocess_text(path.read_text(encoding="utf-8", errors="replace")).split()
+        for path in files
+    )
+    model.save(model_path)
+    print(f"Model berisi {len(model.doc_freq)} term dari {model.n_docs} dokumen")
@@ -3,95 +3,607 @@ Document Processor Module for Analisis Siaran Pers.
 Handles document uploads and text extraction from various file formats.
 """
 
+import codecs
 import io
-import streamlit as st
-import PyPDF2
-import docx2txt
-from typing import Optional, Tuple
+import itertools
+import logging
+import os
+import re
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .instrumentation import count, stage
+
+logger = logging.getLogger(__name__)
+
+
+def env_number(name: str, default, cast: Callable = int):
+    """
+    Read a non-negative numeric setting from the environment.
+
+    Invalid or negative values are logged and replaced by the default, so a
+    typo in a setting does not stop the modules from importing.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or invalid
+        cast: Conversion applied to the raw value (int or float)
+
+    Returns:
+        Parsed value or the default
+    """
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    # value >= 0 juga menolak NaN
+    if value is None or not value >= 0:
+        logger.warning("Nilai %s=%r tidak valid, memakai bawaan %s", name, raw, default)
+        return default
+    return value
+
+# Versi logika ekstraksi; naikkan jika hasil ekstraksi berubah agar cache lama tidak dipakai
+EXTRACTION_VERSION = "3"
+
+# Jumlah halaman minimum sebelum ekstraksi PDF dibagi ke beberapa proses
+PARALLEL_PDF_MIN_PAGES = 40
+
+# Jumlah proses untuk ekstraksi PDF besar (1 = tanpa paralelisme)
+PDF_WORKERS = env_number("ANALISIS_PDF_WORKERS", 1)
+
+# Batas ukuran file (MB) dan jumlah halaman PDF yang diekstrak (0 = tanpa batas)
+MAX_UPLOAD_MB = env_number("ANALISIS_MAX_UPLOAD_MB", 200.0, float)
+MAX_PDF_PAGES = env_number("ANALISIS_MAX_PDF_PAGES", 2000)
+
+# Format dokumen yang dapat diekstrak (ekstensi file)
+SUPPORTED_EXTENSIONS = {"pdf", "docx", "doc", "txt"}
+
+# Ukuran blok (byte) saat file dibaca dan teks didekode bertahap
+TEXT_BLOCK_BYTES = 1024 * 1024
+
+# Tanda urutan byte (BOM); UTF-32 diperiksa sebelum UTF-16 karena awalannya sama
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Byte yang tidak terdefinisi di Windows-1252
+CP1252_UNDEFINED = re.compile(rb"[\x81\x8d\x8f\x90\x9d]")
+
+# Byte NUL, tidak pernah muncul dalam teks 8-bit
+NUL_BYTE = re.compile(rb"\x00")
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class DocumentError(Exception):
+    """Raised when text cannot be extracted from a document."""
+
+
+class EmptyDocumentError(DocumentError):
+    """Raised when a document was read successfully but contains no text."""
+
+
+def _as_readable(source):
+    """
+    Return a form of the document that PyPDF2 and zipfile can open.
+
+    Bytes are wrapped in a BytesIO, file paths are passed through, and file
+    objects are rewound and read in place without copying.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    source.seek(0)
+    return source
+
+
+def content_size(source) -> int:
+    """Return the size in bytes of document content given as bytes, a file path or a seekable file object."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    position = source.tell()
+    size = source.seek(0, io.SEEK_END)
+    source.seek(position)
+    return size
+
+
+def iter_blocks(source, block_bytes: int = TEXT_BLOCK_BYTES) -> Iterator[bytes]:
+    """
+    Yield the raw content of a document in fixed-size blocks.
+
+    Args:
+        source: Bytes, a file path, or a binary file object (read from the start)
+        block_bytes: Bytes per block
+
+    Yields:
+        Blocks of content in order (slices of in-memory content are not copied)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), block_bytes):
+            yield view[start:start + block_bytes]
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            yield from iter(lambda: handle.read(block_bytes), b"")
+    else:
+        source.seek(0)
+        yield from iter(lambda: source.read(block_bytes), b"")
+
+
+def detect_encoding(source) -> str:
+    """
+    Detect the encoding of a text document in one pass without decoding it into memory.
+
+    A byte order mark decides first. NUL bytes never occur in 8-bit text, so
+    content that has them is read as UTF-16 without a BOM when the NULs fall
+    on one byte of each pair (ASCII in UTF-16), and as latin-1 otherwise.
+    Remaining content is validated as UTF-8; if it is not UTF-8, Windows-1252
+    is used when every byte is defined there (keeping the curly quotes of
+    files saved by Word) and latin-1, which accepts any byte, is the last resort.
+
+    Args:
+        source: Bytes, a file path, or a binary file object
+
+    Returns:
+        Python codec name
+    """
+    blocks = iter_blocks(source)
+    first = next(blocks, b"")
+    for mark, encoding in BYTE_ORDER_MARKS:
+        if bytes(first[:len(mark)]) == mark:
+            return encoding
+
+    # Byte NUL menandakan UTF-16 tanpa BOM (atau berkas biner), bukan UTF-8
+    if NUL_BYTE.search(first):
+        sample = bytes(first)
+        even_nuls = sample[0::2].count(0)
+        odd_nuls = sample[1::2].count(0)
+        # Teks latin dalam UTF-16 berisi NUL pada sebagian besar byte tinggi setiap pasangan
+        pairs = len(sample) // 2
+        if odd_nuls * 2 > pairs and odd_nuls > 4 * even_nuls:
+            return "utf-16-le"
+        if even_nuls * 2 > pairs and even_nuls > 4 * odd_nuls:
+            return "utf-16-be"
+        return "latin-1"
+
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    is_utf8 = is_cp1252 = True
+    for block in itertools.chain([first], blocks):
+        if is_utf8 and NUL_BYTE.search(block):
+            is_utf8 = False
+        if is_utf8:
+            try:
+                utf8.decode(block)
+            except UnicodeDecodeError:
+                is_utf8 = False
+        if is_cp1252 and CP1252_UNDEFINED.search(block):
+            is_cp1252 = False
+        if not (is_utf8 or is_cp1252):
+            return "latin-1"
+    if is_utf8:
+        try:
+            utf8.decode(b"", final=True)
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+    return "cp1252" if is_cp1252 else "latin-1"
+
+
+def check_extension(filename: str) -> str:
+    """
+    Return the lower-cased extension of a supported document.
+
+    The extension names the extraction stage in the metrics, so unknown
+    (client-supplied) extensions are rejected before any stage is opened.
+
+    Raises:
+        DocumentError: If the format is not supported
+    """
+    extension = filename.split(".")[-1].lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise DocumentError(f"Format file tidak didukung: {extension}")
+    return extension
+
+
+def check_upload_size(size: int) -> None:
+    """
+    Reject documents larger than ANALISIS_MAX_UPLOAD_MB.
+
+    Raises:
+        DocumentError: If the size exceeds the limit
+    """
+    if MAX_UPLOAD_MB and size > MAX_UPLOAD_MB * 1024 * 1024:
+        raise DocumentError(
+            f"Ukuran file {size / (1024 * 1024):.1f} MB melebihi batas {MAX_UPLOAD_MB:g} MB."
+        )
+
+
+def _extract_pdf_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Extract a range of pages in a worker process."""
+    return list(DocumentProcessor.iter_pdf_pages(path, (start, stop)))
+
+
+def _extract_pdf_parallel(source, total: int, workers: int,
+                          progress_callback: Optional[Callable[[int, int], None]] = None) -> List[str]:
+    """
+    Extract PDF pages in contiguous ranges across worker processes.
+
+    Workers read the PDF from a file path, so in-memory content is written to a
+    temporary file once instead of being copied to every worker.
+    """
+    temp_path = None
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+    else:
+        stream = _as_readable(source)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            while True:
+                chunk = stream.read(1024 * 1024)
+                if not chunk:
+                    break
+                temp_file.write(chunk)
+            temp_path = path = temp_file.name
+
+    try:
+        chunk_size = max(1, -(-total // (workers * 4)))
+        ranges = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+        pages: List[str] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map menjaga urutan halaman; hasil awal tersedia sebelum semua selesai
+            for chunk in executor.map(_extract_pdf_page_range, [path] * len(ranges),
+                                      [start for start, _ in ranges], [stop for _, stop in ranges]):
+                pages.extend(chunk)
+                if progress_callback:
+                    progress_callback(len(pages), total)
+        return pages
+    finally:
+        if temp_path:
+            os.remove(temp_path)
 
 class DocumentProcessor:
     """Class to handle document processing operations."""
     
     @staticmethod
-    def extract_text_from_pdf(file_content: bytes) -> str:
-        """Extract text from PDF file."""
-        text = ""
-        try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n\n"
-            return text
-        except Exception as e:
-            st.error(f"Error saat mengekstrak teks dari PDF: {e}")
-            return ""
+    def open_pdf(source):
+        """
+        Open a PDF once so its pages can be counted and extracted with the same reader.
+        
+        Args:
+            source: PDF as bytes, a file path, a binary file object (read in place)
+                or an already open PdfReader (returned as is)
+            
+        Returns:
+            PyPDF2.PdfReader
+        """
+        import PyPDF2
+        if isinstance(source, PyPDF2.PdfReader):
+            return source
+        return PyPDF2.PdfReader(_as_readable(source))
+    
+    @staticmethod
+    def iter_pdf_pages(source, page_range: Optional[Tuple[int, int]] = None) -> Iterator[str]:
+        """
+        Yield the text of each PDF page as soon as it is extracted.
+        
+        Args:
+            source: PDF as bytes, a file path, a binary file object (read in place)
+                or a reader from ``open_pdf``
+            page_range: Optional (start, stop) zero-based page range, stop exclusive
+            
+        Yields:
+            Text of each page in order
+        """
+        pdf_reader = DocumentProcessor.open_pdf(source)
+        num_pages = len(pdf_reader.pages)
+        start, stop = page_range or (0, num_pages)
+        for page_num in range(max(start, 0), min(stop, num_pages)):
+            yield pdf_reader.pages[page_num].extract_text() or ""
     
     @staticmethod
-    def extract_text_from_docx(file_content: bytes) -> str:
-        """Extract text from DOCX file."""
+    def count_pdf_pages(source) -> int:
+        """Return the number of pages in a PDF (or ``open_pdf`` reader) without extracting any text."""
+        return len(DocumentProcessor.open_pdf(source).pages)
+    
+    @staticmethod
+    def extract_text_from_pdf(file_content, max_pages: Optional[int] = None, workers: Optional[int] = None,
+                              progress_callback: Optional[Callable[[int, int], None]] = None) -> str:
+        """
+        Extract text from PDF file.
+        
+        Args:
+            file_content: PDF as bytes, a file path, or a binary file object
+            max_pages: Only extract the first ``max_pages`` pages
+            workers: Extract page ranges in this many worker processes for large PDFs
+            progress_callback: Called with (pages_done, total_pages) as pages finish
+            
+        Returns:
+            Extracted text, pages separated by blank lines
+        """
         try:
-            text = docx2txt.process(io.BytesIO(file_content))
-            return text
+            # Satu pembaca untuk menghitung dan mengekstrak halaman; PDF hanya di-parse sekali
+            reader = DocumentProcessor.open_pdf(file_content)
+            total = len(reader.pages)
+            if max_pages and total > max_pages:
+                count("pages_skipped", total - max_pages)
+                total = max_pages
+            
+            if workers and workers > 1 and total >= PARALLEL_PDF_MIN_PAGES:
+                pages = _extract_pdf_parallel(file_content, total, workers, progress_callback)
+            else:
+                pages = []
+                for page_text in DocumentProcessor.iter_pdf_pages(reader, (0, total)):
+                    pages.append(page_text)
+                    if progress_callback:
+                        progress_callback(len(pages), total)
+            
+            return "".join(page_text + "\n\n" for page_text in pages)
         except Exception as e:
-            st.error(f"Error saat mengekstrak teks dari DOCX: {e}")
-            return ""
+            raise DocumentError(f"Error saat mengekstrak teks dari PDF: {e}") from e
     
     @staticmethod
-    def extract_text_from_txt(file_content: bytes) -> str:
-        """Extract text from TXT file."""
+    def iter_docx_paragraphs(source) -> Iterator[str]:
+        """
+        Yield the text of each non-empty DOCX paragraph, streamed from the zipped XML.
+        
+        The main document part is read with an incremental XML parser and each
+        top-level block (paragraph or table) is dropped once it is processed,
+        so memory does not grow with the document. Table cells yield their
+        paragraphs in reading order; tabs and line breaks are kept.
+        
+        Args:
+            source: DOCX as bytes, a file path, or a binary file object (read in place)
+            
+        Yields:
+            Text of each paragraph in order
+        """
+        from xml.etree.ElementTree import iterparse
+        
+        text_tag, paragraph_tag = f"{WORD_NAMESPACE}t", f"{WORD_NAMESPACE}p"
+        breaks = {f"{WORD_NAMESPACE}tab": "\t", f"{WORD_NAMESPACE}br": "\n", f"{WORD_NAMESPACE}cr": "\n"}
+        
+        with zipfile.ZipFile(_as_readable(source)) as archive, archive.open("word/document.xml") as part:
+            runs: List[str] = []
+            depth = 0
+            body = None
+            for event, element in iterparse(part, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2:
+                        body = element
+                    continue
+                depth -= 1
+                if element.tag == text_tag:
+                    runs.append(element.text or "")
+                elif element.tag in breaks:
+                    runs.append(breaks[element.tag])
+                elif element.tag == paragraph_tag:
+                    paragraph = "".join(runs)
+                    runs.clear()
+                    if paragraph.strip():
+                        yield paragraph
+                # Blok tingkat atas selesai; buang agar pohon XML tidak tumbuh
+                if depth == 2 and body is not None:
+                    body.clear()
+    
+    @staticmethod
+    def iter_doc_text(source) -> Iterator[str]:
+        """
+        Yield the text of a legacy Word 97-2003 (.doc) file line by line using antiword.
+        
+        Args:
+            source: DOC as bytes, a file path, or a binary file object
+            
+        Yields:
+            Lines of text, one paragraph per line
+            
+        Raises:
+            DocumentError: If antiword is not installed or cannot read the file
+        """
+        import shutil
+        import subprocess
+        
+        antiword = shutil.which("antiword")
+        if antiword is None:
+            raise DocumentError("File .doc (Word 97-2003) membutuhkan program antiword. "
+                                "Pasang antiword atau simpan dokumen sebagai DOCX.")
+        
+        temp_path = None
+        if isinstance(source, (str, os.PathLike)):
+            path = os.fspath(source)
+        else:
+            with tempfile.NamedTemporaryFile(suffix=".doc", delete=False) as temp_file:
+                for block in iter_blocks(source):
+                    temp_file.write(block)
+                temp_path = path = temp_file.name
+        
+        # stderr ditulis ke file sementara: pipa yang tidak dibaca bisa penuh dan membuat antiword macet
+        errors = tempfile.TemporaryFile()
+        # -w 0: satu paragraf per baris, tanpa pemenggalan baris
+        process = subprocess.Popen([antiword, "-m", "UTF-8.txt", "-w", "0", path], stdout=subprocess.PIPE,
+                                   stderr=errors, encoding="utf-8", errors="replace")
         try:
-            text = file_content.decode("utf-8")
-            return text
-        except UnicodeDecodeError:
+            yield from process.stdout
+            if process.wait() != 0:
+                errors.seek(0)
+                error = errors.read().decode("utf-8", "replace").strip()
+                raise DocumentError(f"antiword gagal membaca dokumen: {error or process.returncode}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            errors.close()
+            if temp_path:
+                os.remove(temp_path)
+    
+    @staticmethod
+    def iter_word_text(source) -> Iterator[str]:
+        """
+        Yield the text of a Word document, choosing the parser from its content.
+        
+        DOCX files (zip archives, including ones saved with a .doc name) are
+        streamed paragraph by paragraph; other files are read as legacy .doc.
+        
+        Args:
+            source: Document as bytes, a file path, or a binary file object
+            
+        Yields:
+            Text pieces in order, paragraphs separated by blank lines
+            
+        Raises:
+            DocumentError: If the document cannot be read
+        """
+        if zipfile.is_zipfile(_as_readable(source)):
             try:
-                # Coba dengan encoding lain jika utf-8 gagal
-                text = file_content.decode("latin-1")
-                return text
+                for paragraph in DocumentProcessor.iter_docx_paragraphs(source):
+                    yield paragraph + "\n\n"
             except Exception as e:
-                st.error(f"Error saat mengekstrak teks dari TXT: {e}")
-                return ""
+                raise DocumentError(f"Error saat mengekstrak teks dari DOCX: {e}") from e
+        else:
+            try:
+                yield from DocumentProcessor.iter_doc_text(source)
+            except DocumentError:
+                raise
+            except Exception as e:
+                raise DocumentError(f"Error saat mengekstrak teks dari DOC: {e}") from e
+    
+    @staticmethod
+    def iter_txt_text(source, encoding: Optional[str] = None) -> Iterator[str]:
+        """
+        Decode a text document block by block.
+        
+        Args:
+            source: Text file as bytes, a file path, or a binary file object
+            encoding: Codec to use (detected with ``detect_encoding`` if omitted)
+            
+        Yields:
+            Decoded text in document order
+        """
+        decoder = codecs.getincrementaldecoder(encoding or detect_encoding(source))(errors="replace")
+        for block in iter_blocks(source):
+            text = decoder.decode(block)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+    
+    @staticmethod
+    def extract_text_from_docx(file_content) -> str:
+        """Extract text from a DOCX or legacy DOC file (bytes, a file path, or a binary file object)."""
+        return "".join(DocumentProcessor.iter_word_text(file_content))
+    
+    @staticmethod
+    def extract_text_from_txt(file_content) -> str:
+        """Extract text from a TXT file (bytes, a file path, or a binary file object) in its detected encoding."""
+        try:
+            return "".join(DocumentProcessor.iter_txt_text(file_content))
+        except Exception as e:
+            raise DocumentError(f"Error saat mengekstrak teks dari TXT: {e}") from e
     
     @staticmethod
-    def extract_text(uploaded_file) -> Tuple[str, bool]:
+    def extract_text(uploaded_file, progress_callback: Optional[Callable[[int, int], None]] = None) -> Tuple[str, bool]:
         """
         Extract text from uploaded file based on file extension.
         
+        Streamlit adapter over ``extract_text_from_bytes``: errors are shown in
+        the page instead of being raised.
+        
         Args:
             uploaded_file: Streamlit UploadedFile object
+            progress_callback: Called with (pages_done, total_pages) while a PDF is extracted
             
         Returns:
             Tuple of (extracted_text, success_status)
         """
+        import streamlit as st
+        
         if uploaded_file is None:
             return "", False
         
-        file_extension = uploaded_file.name.split(".")[-1].lower()
-        file_content = uploaded_file.getvalue()
+        # Dokumen dibaca langsung dari objek unggahan tanpa menyalin isinya
+        try:
+            return DocumentProcessor.extract_text_from_bytes(uploaded_file.name, uploaded_file, progress_callback), True
+        except EmptyDocumentError as e:
+            st.warning(str(e))
+        except DocumentError as e:
+            st.error(str(e))
+        return "", False
+    
+    @staticmethod
+    def extract_text_from_bytes(filename: str, file_content,
+                                progress_callback: Optional[Callable[[int, int], None]] = None) -> str:
+        """
+        Extract text from raw file content based on the file name's extension.
+        
+        Args:
+            filename: Original file name, used to pick the extractor
+            file_content: Raw file bytes, a file path, or a binary file object
+            progress_callback: Called with (pages_done, total_pages) while a PDF is extracted
+            
+        Returns:
+            Extracted text; PDFs are cut off after ANALISIS_MAX_PDF_PAGES pages
+            
+        Raises:
+            DocumentError: If the format is not supported, the file exceeds
+                ANALISIS_MAX_UPLOAD_MB or extraction fails
+            EmptyDocumentError: If the document contains no text
+        """
+        file_extension = check_extension(filename)
+        check_upload_size(content_size(file_content))
+        pages = [0]
         
-        if file_extension == "pdf":
-            text = DocumentProcessor.extract_text_from_pdf(file_content)
-        elif file_extension in ["docx", "doc"]:
-            text = DocumentProcessor.extract_text_from_docx(file_content)
-        elif file_extension == "txt":
-            text = DocumentProcessor.extract_text_from_txt(file_content)
-        else:
-            st.error(f"Format file tidak didukung: {file_extension}")
-            return "", False
+        def on_page(done: int, total: int) -> None:
+            pages[0] = done
+            if progress_callback:
+                progress_callback(done, total)
         
-        if text.strip():
-            return text, True
-        else:
-            st.warning("Tidak ada teks yang dapat diekstrak dari dokumen.")
-            return "", False
+        with stage(f"extract.{file_extension}"):
+            if file_extension == "pdf":
+                text = DocumentProcessor.extract_text_from_pdf(
+                    file_content, max_pages=MAX_PDF_PAGES, workers=PDF_WORKERS, progress_callback=on_page
+                )
+            elif file_extension in ["docx", "doc"]:
+                text = DocumentProcessor.extract_text_from_docx(file_content)
+            else:
+                text = DocumentProcessor.extract_text_from_txt(file_content)
+        count("pages", pages[0])
+        count("characters", len(text))
+        
+        if not text.strip():
+            raise EmptyDocumentError("Tidak ada teks yang dapat diekstrak dari dokumen.")
+        return text
     
     @staticmethod
     def upload_document() -> Optional[Tuple[str, str]]:
         """
         Handle document upload in Streamlit.
         
+        Extraction runs through the headless analysis service, so results are
+        shared through the result cache with other sessions and workers.
+        Uploads larger than ANALISIS_LARGE_DOCUMENT_MB are extracted to a
+        temporary file instead; the LargeDocument is kept in
+        ``st.session_state.large_document`` and only its preview is returned.
+        
         Returns:
             Tuple of (extracted_text, filename) if successful, None otherwise
         """
+        import streamlit as st
+        from .analysis_service import extract_document, extract_large_document
+        from .large_document import is_large
+        
         st.write("### Unggah Dokumen Siaran Pers")
         
         uploaded_file = st.file_uploader(
@@ -102,19 +614,45 @@ class DocumentProcessor:
         
         if uploaded_file is not None:
             with st.spinner("Mengekstrak teks dari dokumen..."):
-                text, success = DocumentProcessor.extract_text(uploaded_file)
+                progress = st.empty()
+                
+                def show_progress(done: int, total: int):
+                    progress.progress(done / total, text=f"Halaman {done} dari {total}")
+                
+                size = content_size(uploaded_file)
+                previous = st.session_state.get("large_document")
+                if previous is not None and (previous.name, previous.source_size) == (uploaded_file.name, size):
+                    # File yang sama masih terunggah; teks sementaranya dipakai ulang pada rerun
+                    result = {"status": "ok", "text": previous.preview,
+                              "profile": st.session_state.get("extraction_profile", {})}
+                else:
+                    # Buang file teks sementara dari dokumen besar sebelumnya
+                    if previous is not None:
+                        previous.discard()
+                        del st.session_state.large_document
+                    if is_large(size):
+                        result = extract_large_document(uploaded_file.name, uploaded_file,
+                                                         progress_callback=show_progress)
+                        if result["status"] == "ok":
+                            st.session_state.large_document = result["document"]
+                    else:
+                        result = extract_document(uploaded_file.name, uploaded_file,
+                                                  progress_callback=show_progress)
+                progress.empty()
+                st.session_state.extraction_profile = result["profile"]
                 
-                if success:
+                if result["status"] == "ok":
                     st.success(f"Berhasil mengekstrak teks dari {uploaded_file.name}")
-                    return text, uploaded_file.name
+                    return result["text"], uploaded_file.name
                 else:
-                    st.error("Gagal mengekstrak teks. Silakan coba file lain.")
+                    st.error(f"Gagal mengekstrak teks: {result['error']} Silakan coba file lain.")
                     return None
         
         return None
 
 # Fungsi untuk testing modul ini secara mandiri
 def test_document_processor():
+    import streamlit as st
     st.title("Test Document Processor")
     result = DocumentProcessor.upload_document()
     
@@ -0,0 +1,212 @@
+"""
+Embedding Keywords Module for Analisis Siaran Pers.
+KeyBERT-style keyword extraction: candidate n-grams are ranked by cosine
+similarity to the document embedding, using one shared multilingual
+sentence encoder whose embeddings are cached by text hash across documents.
+"""
+
+import hashlib
+import os
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Encoder multibahasa ringan yang mendukung Bahasa Indonesia
+DEFAULT_ENCODER = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+# Encoder dimuat sekali per proses dan dipakai bersama oleh semua instance
+_encoders: Dict[Tuple[str, bool], object] = {}
+_encoders_lock = threading.Lock()
+
+_shared_encoder: Optional["EmbeddingEncoder"] = None
+_shared_lock = threading.Lock()
+
+
+def _load_encoder(model_name: str, quantize: bool):
+    """
+    Load (or reuse) a sentence-transformers model on CPU.
+
+    Args:
+        model_name: Hugging Face model name or local path
+        quantize: Apply dynamic int8 quantization to the linear layers
+
+    Returns:
+        SentenceTransformer model
+    """
+    key = (model_name, quantize)
+    with _encoders_lock:
+        if key in _encoders:
+            return _encoders[key]
+
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "Ekstraksi kata kunci berbasis embedding membutuhkan paket 'sentence-transformers'."
+            ) from e
+        model = SentenceTransformer(model_name, device="cpu")
+        model.eval()
+        if quantize:
+            import torch
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+        _encoders[key] = model
+        return model
+
+
+class EmbeddingEncoder:
+    """Batched sentence encoder with an LRU cache of normalized embeddings keyed by text hash."""
+
+    def __init__(self, model_name: str = DEFAULT_ENCODER, quantize: bool = False,
+                 batch_size: int = 64, cache_size: int = 20000):
+        """
+        Initialize the encoder. The model is loaded lazily on first use.
+
+        Args:
+            model_name: Hugging Face model name or local path
+            quantize: Use an int8-quantized model for faster CPU inference
+            batch_size: Number of texts per encoding batch
+            cache_size: Maximum number of embeddings kept in the cache
+        """
+        self.model_name = model_name
+        self.quantize = quantize
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, object]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _text_key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def encode(self, texts: List[str]):
+        """
+        Encode texts, computing only the embeddings that are not cached.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            numpy array of shape (len(texts), dimensions) with L2-normalized rows
+        """
+        import numpy as np
+        from .instrumentation import count
+
+        keys = [self._text_key(text) for text in texts]
+        found: Dict[str, object] = {}
+        pending: Dict[str, str] = {}
+
+        with self._cache_lock:
+            for key, text in zip(keys, texts):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = cached
+                else:
+                    pending[key] = text
+            self.hits += len(texts) - len(pending)
+            self.misses += len(pending)
+        count("embedding_cache_hits", len(texts) - len(pending))
+        count("embedding_cache_misses", len(pending))
+
+        if pending:
+            model = _load_encoder(self.model_name, self.quantize)
+            vectors = model.encode(list(pending.values()), batch_size=self.batch_size,
+                                   convert_to_numpy=True, normalize_embeddings=True)
+            with self._cache_lock:
+                for key, vector in zip(pending, vectors):
+                    found[key] = vector
+                    self._cache[key] = vector
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack([found[key] for key in keys])
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        with self._cache_lock:
+            return {"size": len(self._cache), "capacity": self.cache_size, "hits": self.hits, "misses": self.misses}
+
+
+def get_shared_encoder() -> EmbeddingEncoder:
+    """
+    Return the process-wide EmbeddingEncoder.
+
+    Configuration is read from the environment: ANALISIS_EMBEDDING_MODEL and
+    ANALISIS_EMBEDDING_INT8.
+
+    Returns:
+        Shared EmbeddingEncoder instance
+    """
+    global _shared_encoder
+    if _shared_encoder is None:
+        with _shared_lock:
+            if _shared_encoder is None:
+                _shared_encoder = EmbeddingEncoder(
+                    model_name=os.environ.get("ANALISIS_EMBEDDING_MODEL", DEFAULT_ENCODER),
+                    quantize=os.environ.get("ANALISIS_EMBEDDING_INT8", "0") == "1"
+                )
+    return _shared_encoder
+
+
+def candidate_phrases(sentence_tokens: Iterable[List[str]], stopwords: Iterable[str], max_ngram: int = 2,
+                      max_candidates: int = 200) -> List[str]:
+    """
+    Collect the most frequent candidate n-grams of a document.
+
+    Args:
+        sentence_tokens: Word tokens of each sentence
+        stopwords: Words that may not appear in a candidate
+        max_ngram: Longest candidate length in words
+        max_candidates: Maximum number of candidates returned
+
+    Returns:
+        Lowercased candidate phrases, most frequent first
+    """
+    stopwords = set(stopwords)
+    counts = Counter()
+    for tokens in sentence_tokens:
+        words = [token.lower() for token in tokens]
+        valid = [len(word) > 2 and word[0].isalpha() and word not in stopwords for word in words]
+        for size in range(1, max_ngram + 1):
+            for start in range(len(words) - size + 1):
+                if all(valid[start:start + size]):
+                    counts[" ".join(words[start:start + size])] += 1
+    return [phrase for phrase, _ in counts.most_common(max_candidates)]
+
+
+def rank_candidates(document_vector, candidates: List[str], candidate_vectors, num_keywords: int,
+                    diversity: float = 0.3) -> List[Tuple[str, float]]:
+    """
+    Select keywords by Maximal Marginal Relevance over cosine similarities.
+
+    Args:
+        document_vector: Normalized document embedding
+        candidates: Candidate phrases
+        candidate_vectors: Normalized embeddings of the candidates
+        num_keywords: Number of keywords to return
+        diversity: 0 ranks by relevance only; higher values penalize near-duplicates
+
+    Returns:
+        List of (keyword, similarity to the document) tuples
+    """
+    import numpy as np
+
+    if not candidates:
+        return []
+    relevance = candidate_vectors @ document_vector
+    similarity = candidate_vectors @ candidate_vectors.T
+
+    selected = [int(np.argmax(relevance))]
+    remaining = set(range(len(candidates))) - set(selected)
+    while remaining and len(selected) < num_keywords:
+        indices = np.array(sorted(remaining))
+        redundancy = similarity[np.ix_(indices, selected)].max(axis=1)
+        best = int(indices[np.argmax((1 - diversity) * relevance[indices] - diversity * redundancy)])
+        selected.append(best)
+        remaining.remove(best)
+    return [(candidates[i], float(relevance[i])) for i in selected]
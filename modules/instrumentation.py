@@ -0,0 +1,188 @@
+"""
+Instrumentation Module for Analisis Siaran Pers.
+Lightweight stage timers and counters for extraction and analysis. Each
+document is measured in a Profile (shown in the debug panel and logged as
+structured JSON), and process-wide totals are exported in the Prometheus
+text format.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_profile: ContextVar[Optional["Profile"]] = ContextVar("analisis_profile", default=None)
+
+
+class Profile:
+    """Stage timings and counters collected while processing one document."""
+
+    def __init__(self, name: str = ""):
+        """
+        Initialize an empty profile.
+
+        Args:
+            name: Label of the measured work, e.g. the document name
+        """
+        self.name = name
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        entry = self.stages.setdefault(stage, {"seconds": 0.0, "calls": 0})
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+
+    def add_count(self, counter: str, value: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def merge(self, other: Dict) -> None:
+        """Add the stages and counters of another profile (as returned by ``to_dict``)."""
+        for stage, entry in other.get("stages", {}).items():
+            own = self.stages.setdefault(stage, {"seconds": 0.0, "calls": 0})
+            own["seconds"] += entry["seconds"]
+            own["calls"] += entry["calls"]
+        for counter, value in other.get("counters", {}).items():
+            self.add_count(counter, value)
+
+    def to_dict(self) -> Dict:
+        """Return the profile as a JSON-serializable dictionary."""
+        return {"name": self.name, "stages": self.stages, "counters": self.counters}
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value (backslash, double quote and newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Process-wide totals of stage timings and counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = Profile("total")
+
+    def record(self, profile: Dict) -> None:
+        """Add a finished profile (as returned by ``Profile.to_dict``) to the totals."""
+        with self._lock:
+            self._totals.merge(profile)
+
+    def snapshot(self) -> Dict:
+        """Return a copy of the current totals."""
+        with self._lock:
+            return json.loads(json.dumps(self._totals.to_dict()))
+
+    def render_prometheus(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """
+        Render the totals in the Prometheus text exposition format.
+
+        Args:
+            gauges: Extra point-in-time values, e.g. cache sizes and hit counts
+
+        Returns:
+            Metrics text
+        """
+        totals = self.snapshot()
+        lines = [
+            "# HELP analisis_stage_seconds_total Time spent per processing stage.",
+            "# TYPE analisis_stage_seconds_total counter",
+        ]
+        for stage, entry in sorted(totals["stages"].items()):
+            lines.append(f'analisis_stage_seconds_total{{stage="{_label(stage)}"}} {entry["seconds"]:.6f}')
+        lines += [
+            "# HELP analisis_stage_calls_total Number of times each processing stage ran.",
+            "# TYPE analisis_stage_calls_total counter",
+        ]
+        for stage, entry in sorted(totals["stages"].items()):
+            lines.append(f'analisis_stage_calls_total{{stage="{_label(stage)}"}} {entry["calls"]}')
+        lines += [
+            "# HELP analisis_events_total Processing counters (tokens, pages, cache hits).",
+            "# TYPE analisis_events_total counter",
+        ]
+        for counter, value in sorted(totals["counters"].items()):
+            lines.append(f'analisis_events_total{{name="{_label(counter)}"}} {value}')
+        if gauges:
+            lines.append("# TYPE analisis_gauge gauge")
+            for name, value in sorted(gauges.items()):
+                lines.append(f'analisis_gauge{{name="{_label(name)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a block and add it to the active profile, if any.
+
+    Args:
+        name: Stage name, e.g. "extract.pdf" or "analyze.keywords"
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_time(name, time.perf_counter() - started)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add to a counter of the active profile, if any."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.add_count(name, value)
+
+
+@contextmanager
+def profile(name: str = "", log: bool = True) -> Iterator[Profile]:
+    """
+    Collect stage timings and counters for a block of work.
+
+    Profiles nest: the stages of an inner profile are also added to the outer one.
+    A finished outermost profile is added to the process-wide registry.
+
+    Args:
+        name: Label of the measured work
+        log: Log the finished outermost profile as a structured JSON line
+
+    Yields:
+        The active Profile
+    """
+    outer = _current_profile.get()
+    current = Profile(name)
+    token = _current_profile.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        _current_profile.reset(token)
+        current.add_time("total", time.perf_counter() - started)
+        data = current.to_dict()
+        if outer is not None:
+            outer.merge({"stages": {k: v for k, v in data["stages"].items() if k != "total"},
+                         "counters": data["counters"]})
+        else:
+            registry.record(data)
+        if log and outer is None:
+            logger.info(json.dumps({"event": "profile", **data}, ensure_ascii=False))
+
+
+def cache_gauges() -> Dict[str, float]:
+    """Return current cache statistics of this process as Prometheus gauges."""
+    from .result_cache import get_result_cache
+
+    gauges = {f"result_cache_{key}": value for key, value in get_result_cache().stats().items()}
+    from . import keyword_extractor
+    if keyword_extractor._shared_extractor is not None:
+        stats = keyword_extractor._shared_extractor.stemmer.stats()
+        gauges.update({f"stem_cache_{key}": value for key, value in stats.items()})
+    return gauges
@@ -3,32 +3,218 @@ Keyword Extractor Module for Analisis Siaran Pers.
 Handles the extraction of keywords, key phrases, and quotes from text.
 """
 
+import itertools
+import os
 import re
-import nltk
-import streamlit as st
-from typing import List, Dict, Tuple, Optional
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
-
-# Download NLTK resources
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from .analysis_context import AnalysisContext, SegmentCache
+from .corpus_model import CorpusTfidfModel
+from .gazetteer import Gazetteer
+from .instrumentation import count, stage
+from .stemming import CachedStemmer, StemTable
+from .term_matrix import TermMatrix
+
+# nltk, scipy dan Sastrawi diimpor saat pertama kali dibutuhkan agar
+# aplikasi dapat menampilkan halaman pertama tanpa menunggu pustaka NLP dimuat.
+
+# Data NLTK dibundel bersama aplikasi; tidak ada unduhan saat runtime.
+# Siapkan dengan: python -m nltk.downloader -d nltk_data punkt punkt_tab stopwords
+NLTK_DATA_DIR = os.environ.get(
+    "ANALISIS_NLTK_DATA",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nltk_data")
+)
+
+_nltk_ready = False
+
+# Versi logika analisis; naikkan jika hasil analyze_text berubah agar cache lama tidak dipakai
+ANALYSIS_VERSION = "5"
+
+# Panjang teks minimum (karakter) agar dapat dianalisis
+MIN_TEXT_LENGTH = 50
+
+# Pola token TF-IDF (sama dengan bawaan scikit-learn: kata minimal dua karakter)
+TERM_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# Metode pemilihan frasa kunci: "keywords" (kalimat dengan kata kunci terbanyak) atau "lexrank"
+KEYPHRASE_METHODS = ("keywords", "lexrank")
+
+# Metode ekstraksi kata kunci: "tfidf" atau "embedding" (gaya KeyBERT, butuh sentence-transformers)
+KEYWORD_METHODS = ("tfidf", "embedding")
+
+# Pola kutipan: petik ganda dan petik ganda lengkung
+QUOTE_PATTERN = re.compile(r'"([^"]*)"|\u201c([^\u201d]*)\u201d')
+
+# Pola kutipan petik tunggal (lurus dan lengkung). Tanda petik pembuka/penutup harus berada di batas
+# kata, dan apostrof di antara dua huruf (Jum'at, Qur'an) tidak dianggap tanda petik. Kutipan tidak
+# boleh melintasi petik ganda.
+SINGLE_QUOTE_PATTERN = re.compile(
+    r"(?<!\w)'((?:[^'\"\u201c\u201d]|(?<=\w)'(?=\w))*)'(?!\w)"
+    r"|(?<!\w)\u2018((?:[^\u2019\"\u201c\u201d]|(?<=\w)\u2019(?=\w))*)\u2019(?!\w)"
+)
+
+# Petunjuk kategori entitas berdasarkan isi kalimat
+ORGANIZATION_HINTS = ("pt ", "perusahaan", "grup", "kelompok")
+LOCATION_HINTS = ("kota", "provinsi", "kabupaten", "desa")
+
+# Teks contoh untuk memanaskan stemmer, tokenizer, dan TF-IDF saat server mulai
+WARMUP_TEXT = (
+    "Kementerian Komunikasi dan Informatika meluncurkan program literasi digital "
+    "nasional di Jakarta. \"Program ini akan menjangkau seluruh provinsi di Indonesia "
+    "pada tahun depan,\" kata Menteri dalam konferensi pers. Perusahaan teknologi "
+    "PT Telekomunikasi Indonesia turut mendukung pelaksanaan kegiatan tersebut."
+)
+
+_shared_extractor: Optional["KeywordExtractor"] = None
+_shared_lock = threading.Lock()
+_warmup_done = threading.Event()
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def ensure_nltk_data() -> None:
+    """
+    Point NLTK at the bundled data directory and check the required resources.
+    
+    Raises:
+        LookupError: If the punkt tokenizer or stopwords corpus is not installed
+    """
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    
+    import nltk
+    if os.path.isdir(NLTK_DATA_DIR) and NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+    
+    missing = []
+    for resources in (("tokenizers/punkt_tab", "tokenizers/punkt"), ("corpora/stopwords",)):
+        for resource in resources:
+            try:
+                nltk.data.find(resource)
+                break
+            except LookupError:
+                continue
+        else:
+            missing.append(resources[0])
+    
+    if missing:
+        raise LookupError(
+            f"Data NLTK tidak ditemukan: {', '.join(missing)}. Jalankan "
+            f"'python -m nltk.downloader -d {NLTK_DATA_DIR} punkt punkt_tab stopwords' saat build."
+        )
+    _nltk_ready = True
+
+
+def _scan_quotes(segment: str) -> List[Tuple[int, str]]:
+    """
+    Find quoted statements of at least three words in one segment.
+    
+    Args:
+        segment: Segment text
+        
+    Returns:
+        List of (start offset within the segment, quote) tuples
+    """
+    found = []
+    # Petik ganda dipindai lebih dulu; petik tunggal dipindai terpisah agar apostrof tidak merusaknya
+    matches = itertools.chain(QUOTE_PATTERN.finditer(segment), SINGLE_QUOTE_PATTERN.finditer(segment))
+    for match in matches:
+        # Hanya satu grup yang terisi untuk setiap jenis tanda petik
+        group = match.lastindex
+        raw = match.group(group)
+        quote = raw.strip()
+        
+        # Filter out short quotes (less than 3 words)
+        if len(quote.split()) < 3:
+            continue
+        found.append((match.start(group) + len(raw) - len(raw.lstrip()), quote))
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def _token_spans(sentence: str, words: List[str]) -> List[Tuple[int, int]]:
+    """Locate word tokens in their sentence, in order; tokens rewritten by the tokenizer get (-1, -1)."""
+    spans = []
+    cursor = 0
+    for word in words:
+        start = sentence.find(word, cursor)
+        if start < 0:
+            spans.append((-1, -1))
+            continue
+        spans.append((start, start + len(word)))
+        cursor = start + len(word)
+    return spans
+
+
+def _first_occurrences(terms: Iterable[str], sentences: List[str],
+                       sentence_spans: List[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Locate the first whole-word occurrence (ignoring case) of each term, sentence by sentence.
+    
+    Args:
+        terms: Keywords; words of a multi-word keyword may be separated by any whitespace
+        sentences: Sentences in document order
+        sentence_spans: (start, end) character offsets of each sentence in the document
+        
+    Returns:
+        [start, end] document offsets of each term, [-1, -1] if it was not found
+    """
+    found = []
+    for term in terms:
+        pattern = re.compile(r"(?<!\w)" + r"\s+".join(map(re.escape, term.split())) + r"(?!\w)", re.IGNORECASE)
+        span = [-1, -1]
+        for sentence, (sentence_start, _) in zip(sentences, sentence_spans):
+            match = pattern.search(sentence)
+            if match:
+                span = [sentence_start + match.start(), sentence_start + match.end()]
+                break
+        found.append(span)
+    return found
 
 
 class KeywordExtractor:
     """Class to handle keyword and quote extraction operations."""
     
-    def __init__(self):
-        """Initialize the KeywordExtractor with necessary resources."""
-        # Initialize Indonesian stemmer
+    def __init__(self, stem_cache_size: int = 50000, stem_table_path: Optional[str] = None,
+                 gazetteer: Optional[Gazetteer] = None, corpus_model: Optional[CorpusTfidfModel] = None,
+                 segment_cache_size: int = 20000, keyphrase_method: str = "keywords",
+                 keyword_method: str = "tfidf"):
+        """
+        Initialize the KeywordExtractor with necessary resources.
+        
+        Args:
+            stem_cache_size: Maximum number of stems kept in the in-memory LRU cache
+            stem_table_path: Optional pre-built SQLite stem table shared across processes
+            gazetteer: Optional gazetteer of known organisations, places and officials
+            corpus_model: Optional archive-wide IDF model used to score keywords
+            segment_cache_size: Maximum number of per-segment results kept for
+                incremental re-analysis of revised drafts (0 disables it)
+            keyphrase_method: Default key phrase ranker, "keywords" or "lexrank"
+            keyword_method: Default keyword extractor, "tfidf" or "embedding"
+        """
+        if keyphrase_method not in KEYPHRASE_METHODS:
+            raise ValueError(f"Metode frasa kunci tidak dikenal: {keyphrase_method}")
+        if keyword_method not in KEYWORD_METHODS:
+            raise ValueError(f"Metode kata kunci tidak dikenal: {keyword_method}")
+        
+        ensure_nltk_data()
+        from nltk.corpus import stopwords
+        from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+        
+        self.gazetteer = gazetteer
+        self.corpus_model = corpus_model
+        self.segment_cache = SegmentCache(segment_cache_size)
+        self.keyphrase_method = keyphrase_method
+        self.keyword_method = keyword_method
+        
+        # Initialize Indonesian stemmer behind a memoizing cache
         factory = StemmerFactory()
-        self.stemmer = factory.create_stemmer()
+        stem_table = StemTable(stem_table_path, read_only=True) if stem_table_path else None
+        # Cache bawaan Sastrawi tidak terbatas; LRU CachedStemmer menjadi satu-satunya cache
+        sastrawi = factory.create_stemmer()
+        self.stemmer = CachedStemmer(getattr(sastrawi, "delegatedStemmer", sastrawi),
+                                     capacity=stem_cache_size, table=stem_table)
         
         # Indonesian stopwords from NLTK + custom additions
         self.stopwords = set(stopwords.words('indonesian'))
@@ -45,6 +231,30 @@ class KeywordExtractor:
         }
         self.stopwords.update(custom_stopwords)
     
+    def cache_signature(self, keyword_method: Optional[str] = None) -> Dict:
+        """
+        Describe the configuration that affects analysis results, for use in cache keys.
+        
+        Args:
+            keyword_method: Keyword method of the analysis (defaults to the extractor's keyword_method)
+        
+        Returns:
+            Dictionary of version and resource identifiers
+        """
+        keyword_method = keyword_method or self.keyword_method
+        signature = {
+            "version": ANALYSIS_VERSION,
+            "gazetteer": self.gazetteer.fingerprint() if self.gazetteer else None,
+            "corpus": self.corpus_model.fingerprint() if self.corpus_model and self.corpus_model.n_docs else None,
+            "keyphrase_method": self.keyphrase_method,
+            "keyword_method": keyword_method
+        }
+        if keyword_method == "embedding":
+            from .embedding_keywords import get_shared_encoder
+            encoder = get_shared_encoder()
+            signature["encoder"] = [encoder.model_name, encoder.quantize]
+        return signature
+    
     def preprocess_text(self, text: str) -> str:
         """
         Preprocess text by removing special characters, converting to lowercase,
@@ -56,6 +266,18 @@ class KeywordExtractor:
         Returns:
             Preprocessed text
         """
+        return " ".join(stem for _, stem in self.stem_tokens(text))
+    
+    def stem_tokens(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Tokenize, filter stopwords and stem text, keeping the surface form of each token.
+        
+        Args:
+            text: Text to process
+            
+        Returns:
+            List of (word, stem) tuples
+        """
         # Convert to lowercase
         text = text.lower()
         
@@ -64,212 +286,651 @@ class KeywordExtractor:
         text = re.sub(r'\d+', ' ', text)
         
         # Tokenize
+        from nltk.tokenize import word_tokenize
         words = word_tokenize(text)
         
         # Remove stopwords and stem
-        filtered_words = [self.stemmer.stem(word) for word in words if word not in self.stopwords and len(word) > 2]
+        with stage("analyze.stemming"):
+            stems = [(word, self.stemmer.stem(word)) for word in words if word not in self.stopwords and len(word) > 2]
+        count("stemmed_tokens", len(stems))
+        return stems
+    
+    def build_context(self, text: str) -> AnalysisContext:
+        """
+        Segment and tokenize text once so every extraction stage can reuse it.
         
-        return " ".join(filtered_words)
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            AnalysisContext for the text
+        """
+        return AnalysisContext.build(text, self.segment_cache)
     
-    def extract_keywords_tfidf(self, text: str, num_keywords: int = 10) -> List[Tuple[str, float]]:
+    def extract_keywords(self, text: str, num_keywords: int = 10, context: Optional[AnalysisContext] = None,
+                         method: Optional[str] = None) -> List[Tuple[str, float]]:
         """
-        Extract keywords using TF-IDF method.
+        Extract keywords with the selected method.
         
         Args:
             text: Text to extract keywords from
             num_keywords: Number of keywords to extract
+            context: Pre-built analysis context for the text (built if omitted)
+            method: "tfidf" or "embedding" (defaults to the extractor's keyword_method)
             
         Returns:
             List of (keyword, score) tuples
+            
+        Raises:
+            ValueError: If the method is unknown
+        """
+        method = method or self.keyword_method
+        if method == "tfidf":
+            return self.extract_keywords_tfidf(text, num_keywords=num_keywords, context=context)
+        if method == "embedding":
+            return self.extract_keywords_embedding(text, num_keywords=num_keywords, context=context)
+        raise ValueError(f"Metode kata kunci tidak dikenal: {method}")
+    
+    def extract_keywords_embedding(self, text: str, num_keywords: int = 10,
+                                   context: Optional[AnalysisContext] = None, diversity: float = 0.3,
+                                   max_sentences: int = 128) -> List[Tuple[str, float]]:
         """
-        # Preprocess text
-        processed_text = self.preprocess_text(text)
+        Extract keywords KeyBERT-style with the shared sentence encoder.
         
-        # Split text into sentences
-        sentences = sent_tokenize(text)
+        Candidate uni- and bigrams are ranked by cosine similarity to the
+        document embedding (the mean of its sentence embeddings) with Maximal
+        Marginal Relevance. Sentences and candidates are encoded in one batch,
+        and embeddings already seen in earlier documents come from the
+        encoder's cache.
+        
+        Args:
+            text: Text to extract keywords from
+            num_keywords: Number of keywords to extract
+            context: Pre-built analysis context for the text (built if omitted)
+            diversity: MMR diversity, 0 ranks by relevance only
+            max_sentences: Leading sentences used for the document embedding
+            
+        Returns:
+            List of (keyword, similarity) tuples
+            
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        import numpy as np
+        from .embedding_keywords import candidate_phrases, get_shared_encoder, rank_candidates
         
-        # If there are too few sentences, create artificial ones
-        if len(sentences) < 2:
-            # Split into chunks of ~100 characters
-            chunks = [text[i:i+100] for i in range(0, len(text), 100)]
-            sentences = chunks if chunks else ["dummy text"]
+        context = context or self.build_context(text)
+        cache_key = ("embedding", num_keywords)
+        if cache_key in context.cache:
+            return context.cache[cache_key]
         
-        # Vectorize text using TF-IDF
-        vectorizer = TfidfVectorizer(max_features=num_keywords * 2)
-        tfidf_matrix = vectorizer.fit_transform(sentences)
+        candidates = candidate_phrases(context.sentence_tokens, self.stopwords)
+        sentences = context.sentences[:max_sentences] or [text]
+        vectors = get_shared_encoder().encode(sentences + candidates)
         
-        # Get feature names
-        feature_names = vectorizer.get_feature_names_out()
+        document_vector = vectors[:len(sentences)].mean(axis=0)
+        norm = np.linalg.norm(document_vector)
+        if norm:
+            document_vector = document_vector / norm
         
-        # Calculate average TF-IDF scores across sentences
-        avg_scores = tfidf_matrix.mean(axis=0).A1
+        keywords = rank_candidates(document_vector, candidates, vectors[len(sentences):], num_keywords, diversity)
+        context.cache[cache_key] = keywords
+        return keywords
+    
+    def extract_keywords_tfidf(self, text: str, num_keywords: int = 10,
+                               context: Optional[AnalysisContext] = None) -> List[Tuple[str, float]]:
+        """
+        Extract keywords using TF-IDF method.
         
-        # Get top keywords
-        top_indices = avg_scores.argsort()[-num_keywords:][::-1]
-        keywords = [(feature_names[i], avg_scores[i]) for i in top_indices]
+        Args:
+            text: Text to extract keywords from
+            num_keywords: Number of keywords to extract
+            context: Pre-built analysis context for the text (built if omitted)
+            
+        Returns:
+            List of (keyword, score) tuples
+        """
+        context = context or self.build_context(text)
+        
+        # Gunakan hasil yang sudah dihitung untuk dokumen ini jika ada
+        cache_key = ("tfidf", num_keywords)
+        if cache_key in context.cache:
+            return context.cache[cache_key]
+        
+        # Skor terhadap IDF korpus jika model arsip tersedia (tanpa fitting ulang)
+        if self.corpus_model is not None and self.corpus_model.n_docs:
+            keywords = self._extract_keywords_corpus(context, num_keywords)
+            context.cache[cache_key] = keywords
+            return keywords
+        
+        # Sentence-term matrix (or ~100 character chunks for very short texts)
+        if len(context.sentences) >= 2:
+            matrix = self._term_matrix(context)
+        else:
+            matrix = TermMatrix.from_counts(
+                [Counter(TERM_PATTERN.findall(document.lower())) for document in context.tfidf_documents]
+            )
         
+        keywords = matrix.rank_tfidf(num_keywords)
+        context.cache[cache_key] = keywords
         return keywords
     
-    def extract_keyphrases(self, text: str, num_phrases: int = 5) -> List[str]:
+    def _term_matrix(self, context: AnalysisContext) -> TermMatrix:
+        """
+        Return the sentence-term count matrix of a document, built once per context.
+        
+        Term counts of unchanged sentences come from the segment cache.
+        
+        Args:
+            context: Analysis context of the document
+            
+        Returns:
+            TermMatrix with one row per sentence
+        """
+        if "term_matrix" not in context.cache:
+            context.cache["term_matrix"] = TermMatrix.from_counts(self._sentence_counts(context))
+        return context.cache["term_matrix"]
+    
+    def _sentence_counts(self, context: AnalysisContext) -> List[Counter]:
+        """Return the term counts of each sentence, served from the segment cache when unchanged."""
+        return [
+            self.segment_cache.get_or_compute(
+                "terms", sentence, lambda: Counter(TERM_PATTERN.findall(sentence.lower()))
+            )
+            for sentence in context.sentences
+        ]
+    
+    def _context_stems(self, context: AnalysisContext) -> List[Tuple[str, str]]:
+        """Return the (word, stem) pairs of a document, stemmed per segment through the segment cache."""
+        if "stems" not in context.cache:
+            context.cache["stems"] = [
+                pair
+                for _, segment in context.segments()
+                for pair in self.segment_cache.get_or_compute("stems", segment, lambda: self.stem_tokens(segment))
+            ]
+        return context.cache["stems"]
+    
+    def _extract_keywords_corpus(self, context: AnalysisContext, num_keywords: int) -> List[Tuple[str, float]]:
         """
-        Extract key phrases from text.
+        Score the document's stemmed terms against the corpus model.
+        
+        Args:
+            context: Analysis context of the document
+            num_keywords: Number of keywords to extract
+            
+        Returns:
+            List of (keyword, score) tuples, using the most frequent surface form of each stem
+        """
+        return self._rank_stems(self._context_stems(context), num_keywords)
+    
+    def _rank_stems(self, stemmed: List[Tuple[str, str]], num_keywords: int) -> List[Tuple[str, float]]:
+        """Rank (word, stem) pairs against the corpus model, reporting each stem by its most frequent word."""
+        # Tampilkan bentuk kata yang paling sering muncul untuk setiap stem
+        surface_forms = defaultdict(Counter)
+        for word, stem in stemmed:
+            surface_forms[stem][word] += 1
+        
+        top_terms = self.corpus_model.top_terms([stem for _, stem in stemmed], num_keywords)
+        return [(surface_forms[stem].most_common(1)[0][0], score) for stem, score in top_terms]
+    
+    def extract_keyphrases(self, text: str, num_phrases: int = 5,
+                           context: Optional[AnalysisContext] = None, method: Optional[str] = None) -> List[str]:
+        """
+        Extract key phrases (key sentences) from text.
+        
+        Both rankers work on the shared sentence-term sparse matrix:
+        "keywords" scores each sentence by how many of the top 20 keywords it
+        contains as whole words (one matrix-vector product), "lexrank" ranks
+        sentences by centrality in their TF-IDF cosine similarity graph.
+        Ties keep document order.
         
         Args:
             text: Text to extract key phrases from
             num_phrases: Number of key phrases to extract
+            context: Pre-built analysis context for the text (built if omitted)
+            method: "keywords" or "lexrank" (defaults to the extractor's keyphrase_method)
             
         Returns:
             List of key phrases
+            
+        Raises:
+            ValueError: If the method is unknown
         """
-        # Split into sentences
-        sentences = sent_tokenize(text)
-        
-        # Calculate sentence scores based on keyword presence
-        keywords = [kw for kw, _ in self.extract_keywords_tfidf(text, num_keywords=20)]
-        sentence_scores = []
+        context = context or self.build_context(text)
+        return [context.sentences[i] for i in self._keyphrase_indices(text, context, num_phrases, method)]
+    
+    def _keyphrase_indices(self, text: str, context: AnalysisContext, num_phrases: int,
+                           method: Optional[str] = None) -> List[int]:
+        """Return the sentence indices of the key phrases of a document (see ``extract_keyphrases``)."""
+        if not context.sentences:
+            return []
+        
+        return self._select_keyphrases(
+            self._term_matrix(context), num_phrases,
+            lambda: self.extract_keywords_tfidf(text, num_keywords=20, context=context), method
+        )
+    
+    def _select_keyphrases(self, matrix: TermMatrix, num_phrases: int, top_keywords,
+                           method: Optional[str] = None) -> List[int]:
+        """
+        Pick the key sentences of a sentence-term matrix.
         
-        for sentence in sentences:
-            score = 0
-            for keyword in keywords:
-                if keyword.lower() in sentence.lower():
-                    score += 1
-            sentence_scores.append((sentence, score))
+        Args:
+            matrix: Sentence-term matrix, one row per sentence
+            num_phrases: Number of key phrases to select
+            top_keywords: Function returning the top 20 (keyword, score) tuples, used by "keywords"
+            method: "keywords" or "lexrank" (defaults to the extractor's keyphrase_method)
+            
+        Returns:
+            Row (sentence) indices of the key phrases, best first
+            
+        Raises:
+            ValueError: If the method is unknown
+        """
+        import numpy as np
         
-        # Sort sentences by score
-        sentence_scores.sort(key=lambda x: x[1], reverse=True)
+        method = method or self.keyphrase_method
+        if method == "keywords":
+            scores = matrix.presence_scores([keyword for keyword, _ in top_keywords()])
+        elif method == "lexrank":
+            scores = matrix.lexrank_scores(exclude=self.stopwords)
+        else:
+            raise ValueError(f"Metode frasa kunci tidak dikenal: {method}")
         
-        # Return top phrases
-        return [sentence for sentence, _ in sentence_scores[:num_phrases]]
+        order = np.argsort(-scores, kind="stable")[:num_phrases]
+        return [int(i) for i in order]
     
-    def extract_quotes(self, text: str) -> List[Dict[str, str]]:
+    def extract_quotes(self, text: str, context: Optional[AnalysisContext] = None) -> List[Dict]:
         """
-        Extract quotes from text using regex patterns.
+        Extract quotes from text with two regex scans per segment.
+        
+        Straight and curly double quotes (“ ”) are matched first, then single
+        quotes (‘ ’ or ') that sit at word boundaries, so apostrophes such as
+        Jum'at do not open a quote. Matches of
+        unchanged segments come from the segment cache. Each match offset is
+        mapped to its sentence through the context's sorted sentence
+        boundaries, and repeated quotes are reported once.
         
         Args:
             text: Text to extract quotes from
+            context: Pre-built analysis context for the text (built if omitted)
             
         Returns:
-            List of dictionaries containing quote and context
-        """
-        quotes = []
-        
-        # Pattern untuk kutipan dengan tanda petik ganda
-        pattern_double = r'"([^"]*)"'
-        matches_double = re.findall(pattern_double, text)
-        
-        # Pattern untuk kutipan dengan tanda petik tunggal dan backtick
-        pattern_single = r"'([^']*)'|\"([^\"]*)\""
-        matches_single = re.findall(pattern_single, text)
-        
-        # Flatten single quote matches (could be in different groups)
-        flattened_single = []
-        for match in matches_single:
-            for group in match:
-                if group:
-                    flattened_single.append(group)
-        
-        # Combine quotes and filter out short ones (less than 3 words)
-        all_quotes = matches_double + flattened_single
-        filtered_quotes = [q for q in all_quotes if len(q.split()) >= 3]
-        
-        # Extract context for each quote (the sentence containing the quote)
-        for quote in filtered_quotes:
-            quote_pattern = re.escape(quote)
-            for sentence in sent_tokenize(text):
-                if re.search(quote_pattern, sentence):
-                    quotes.append({
-                        "quote": quote,
-                        "context": sentence
-                    })
-                    break
-        
-        return quotes
-    
-    def extract_named_entities(self, text: str) -> Dict[str, List[str]]:
+            List of dictionaries containing quote, context, and start/end offsets
+        """
+        context = context or self.build_context(text)
+        quotes = {}
+        matches = (
+            (segment_start + start, quote)
+            for segment_start, segment in context.segments()
+            for start, quote in self.segment_cache.get_or_compute("quotes", segment, lambda: _scan_quotes(segment))
+        )
+        
+        for start, quote in matches:
+            # Filter out duplicates
+            if quote in quotes:
+                continue
+            
+            end = start + len(quote)
+            first = max(context.sentence_index_at(start), 0)
+            last = max(context.sentence_index_at(end - 1), first)
+            
+            # Context is the sentence (or sentences) containing the quote
+            if context.sentence_spans:
+                context_text = text[context.sentence_spans[first][0]:context.sentence_spans[last][1]]
+            else:
+                context_text = text
+            
+            quotes[quote] = {
+                "quote": quote,
+                "context": context_text,
+                "start": start,
+                "end": end
+            }
+        
+        return list(quotes.values())
+
+    def extract_named_entities(self, text: str,
+                               context: Optional[AnalysisContext] = None) -> Dict[str, List[str]]:
         """
         Extract potential named entities from text.
         This is a simplified approach as we don't have a full NER model for Indonesian.
         
+        Each sentence is scanned once: runs of capitalized tokens become one
+        entity span and scanning resumes after the span, so sub-entities are not
+        re-emitted. Known names from the gazetteer take precedence over the
+        sentence-level hint heuristic.
+        
         Args:
             text: Text to extract named entities from
+            context: Pre-built analysis context for the text (built if omitted)
             
         Returns:
             Dictionary of entity types and their instances
         """
-        entities = {
-            "organizations": [],
-            "people": [],
-            "locations": []
-        }
+        context = context or self.build_context(text)
+        return {entity_type: list(found) for entity_type, found in self._entity_spans(context).items()}
+    
+    def _entity_spans(self, context: AnalysisContext) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Collect the entities of a document with the offsets of their first occurrence.
         
-        # Simple pattern matching for capital words not at the start of sentences
-        sentences = sent_tokenize(text)
-        for sentence in sentences:
-            words = word_tokenize(sentence)
-            for i, word in enumerate(words):
-                # Skip first word of sentence
-                if i == 0:
-                    continue
-                    
-                # Check if word starts with capital letter and is not a stopword
-                if word and word[0].isupper() and word.lower() not in self.stopwords:
-                    # Check if it's part of a multiple-word entity
-                    entity = word
-                    j = i + 1
-                    while j < len(words) and words[j][0].isupper() if words[j] else False:
-                        entity += " " + words[j]
-                        j += 1
-                    
-                    # Simple heuristic categorization
-                    if any(hint in sentence.lower() for hint in ["pt ", "perusahaan", "grup", "kelompok"]):
-                        if entity not in entities["organizations"]:
-                            entities["organizations"].append(entity)
-                    elif any(hint in sentence.lower() for hint in ["kota", "provinsi", "kabupaten", "desa"]):
-                        if entity not in entities["locations"]:
-                            entities["locations"].append(entity)
-                    else:
-                        if entity not in entities["people"]:
-                            entities["people"].append(entity)
+        Args:
+            context: Analysis context of the document
+            
+        Returns:
+            Mapping of entity type to {entity: [start, end]} in order of appearance
+        """
+        # Dict sebagai set yang mempertahankan urutan kemunculan
+        entities = {entity_type: {} for entity_type in ("organizations", "people", "locations")}
+        
+        for sentence, lowered, words, (sentence_start, _) in zip(
+            context.sentences, context.lower_sentences, context.sentence_tokens, context.sentence_spans
+        ):
+            found = self.segment_cache.get_or_compute(
+                "entities", sentence, lambda: self._sentence_entities(sentence, lowered, words)
+            )
+            for entity_type, entity, start, end in found:
+                if entity not in entities[entity_type]:
+                    span = [sentence_start + start, sentence_start + end] if start >= 0 else [-1, -1]
+                    entities[entity_type][entity] = span
         
         return entities
     
-    def analyze_text(self, text: str) -> Dict:
+    def _sentence_entities(self, sentence: str, lowered: str, words: List[str]) -> List[Tuple[str, str, int, int]]:
+        """
+        Scan one tokenized sentence for entities.
+        
+        Args:
+            sentence: Sentence text
+            lowered: Lowercased sentence
+            words: Word tokens of the sentence
+            
+        Returns:
+            List of (entity_type, entity, start, end) tuples in order of appearance, with
+            offsets relative to the sentence ((-1, -1) if a token could not be located)
+        """
+        # Simple heuristic categorization, computed once per sentence
+        if any(hint in lowered for hint in ORGANIZATION_HINTS):
+            sentence_type = "organizations"
+        elif any(hint in lowered for hint in LOCATION_HINTS):
+            sentence_type = "locations"
+        else:
+            sentence_type = "people"
+        
+        spans = _token_spans(sentence, words)
+        
+        def entity(entity_type: str, start: int, end: int) -> Tuple[str, str, int, int]:
+            first, last = spans[start][0], spans[end - 1][1]
+            if first < 0 or last < 0:
+                first = last = -1
+            return entity_type, " ".join(words[start:end]), first, last
+        
+        found = []
+        i = 0
+        while i < len(words):
+            # Known entities from the gazetteer, including at sentence start
+            known = self.gazetteer.longest_match(words, i) if self.gazetteer else None
+            if known:
+                end, entity_type = known
+                found.append(entity(entity_type, i, end))
+                i = end
+                continue
+            
+            # Capital words not at the start of sentences and not stopwords
+            word = words[i]
+            if i > 0 and word[0].isupper() and word.lower() not in self.stopwords:
+                end = i + 1
+                while end < len(words) and words[end][0].isupper():
+                    end += 1
+                found.append(entity(sentence_type, i, end))
+                i = end
+                continue
+            
+            i += 1
+        
+        return found
+
+    def analyze_text(self, text: str, keyword_method: Optional[str] = None) -> Dict:
         """
         Perform comprehensive text analysis including keywords, phrases, quotes, and entities.
         
+        The text is segmented and tokenized once; all stages share the same context.
+        
         Args:
             text: Text to analyze
+            keyword_method: "tfidf" or "embedding" (defaults to the extractor's keyword_method)
             
         Returns:
-            Dictionary containing analysis results
+            Dictionary containing analysis results. Quotes carry their own
+            offsets; "offsets" holds the [start, end] character offsets of each
+            keyword (first occurrence), key phrase and entity (first occurrence,
+            per type), in the order of the corresponding lists.
+            
+        Raises:
+            ValueError: If the text is shorter than MIN_TEXT_LENGTH characters
         """
-        if not text or len(text.strip()) < 50:
-            st.error("Teks terlalu pendek untuk dianalisis.")
-            return {}
+        if not text or len(text.strip()) < MIN_TEXT_LENGTH:
+            raise ValueError("Teks terlalu pendek untuk dianalisis.")
         
+        stem_hits, stem_misses = self.stemmer.hits + self.stemmer.table_hits, self.stemmer.misses
+        segment_hits, segment_misses = self.segment_cache.hits, self.segment_cache.misses
+        
+        with stage("analyze.context"):
+            context = self.build_context(text)
+        count("sentences", len(context.sentences))
+        count("tokens", sum(len(tokens) for tokens in context.sentence_tokens))
         analysis = {}
+        offsets = {}
         
         # Extract keywords
-        analysis["keywords"] = self.extract_keywords_tfidf(text, num_keywords=15)
+        with stage("analyze.keywords"):
+            analysis["keywords"] = self.extract_keywords(text, num_keywords=15, context=context, method=keyword_method)
+            offsets["keywords"] = _first_occurrences(
+                [keyword for keyword, _ in analysis["keywords"]], context.sentences, context.sentence_spans
+            )
         
         # Extract key phrases
-        analysis["key_phrases"] = self.extract_keyphrases(text, num_phrases=5)
+        with stage("analyze.key_phrases"):
+            indices = self._keyphrase_indices(text, context, 5)
+            analysis["key_phrases"] = [context.sentences[i] for i in indices]
+            offsets["key_phrases"] = [list(context.sentence_spans[i]) for i in indices]
         
         # Extract quotes
-        analysis["quotes"] = self.extract_quotes(text)
+        with stage("analyze.quotes"):
+            analysis["quotes"] = self.extract_quotes(text, context=context)
         
         # Extract entities
-        analysis["entities"] = self.extract_named_entities(text)
+        with stage("analyze.entities"):
+            entities = self._entity_spans(context)
+            analysis["entities"] = {entity_type: list(found) for entity_type, found in entities.items()}
+            offsets["entities"] = {entity_type: list(found.values()) for entity_type, found in entities.items()}
+        
+        analysis["offsets"] = offsets
+        
+        # Selisih penghitung cache stemmer (perkiraan jika dipakai bersamaan oleh beberapa thread)
+        count("stem_cache_hits", self.stemmer.hits + self.stemmer.table_hits - stem_hits)
+        count("stem_cache_misses", self.stemmer.misses - stem_misses)
+        count("segment_cache_hits", self.segment_cache.hits - segment_hits)
+        count("segment_cache_misses", self.segment_cache.misses - segment_misses)
+        return analysis
+    
+    def analyze_chunks(self, chunks: Iterable[Tuple[int, str]], keyword_method: Optional[str] = None) -> Dict:
+        """
+        Analyze a long document chunk by chunk without tokenizing all of it at once.
+        
+        Chunks must be cut at segment boundaries (see ``large_document.iter_text_chunks``).
+        Only one chunk's tokens are held at a time; the per-sentence term counts,
+        sentences, quotes and entities are merged, so for TF-IDF keywords the
+        result equals ``analyze_text`` on the whole text. Embedding keywords are
+        computed on the first chunk only.
+        
+        Args:
+            chunks: (character offset, text) of each chunk, in document order
+            keyword_method: "tfidf" or "embedding" (defaults to the extractor's keyword_method)
+            
+        Returns:
+            Dictionary containing analysis results, like ``analyze_text``
+            
+        Raises:
+            ValueError: If the text is shorter than MIN_TEXT_LENGTH characters
+        """
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        second = next(chunks, None)
+        if first is None:
+            raise ValueError("Teks terlalu pendek untuk dianalisis.")
+        if second is None:
+            # Dokumen satu potong dianalisis seperti biasa
+            return self.analyze_text(first[1], keyword_method=keyword_method)
+        
+        method = keyword_method or self.keyword_method
+        if method not in KEYWORD_METHODS:
+            raise ValueError(f"Metode kata kunci tidak dikenal: {method}")
+        segment_hits, segment_misses = self.segment_cache.hits, self.segment_cache.misses
+        
+        sentences: List[str] = []
+        sentence_spans: List[Tuple[int, int]] = []
+        counts: List[Counter] = []
+        stemmed: List[Tuple[str, str]] = []
+        quotes: Dict[str, Dict] = {}
+        entities = {entity_type: {} for entity_type in ("organizations", "people", "locations")}
+        use_corpus = self.corpus_model is not None and self.corpus_model.n_docs
+        keywords = None
+        length = 0
+        
+        for offset, chunk in (first, second, *chunks):
+            length += len(chunk.strip())
+            with stage("analyze.context"):
+                context = self.build_context(chunk)
+            count("chunks")
+            count("sentences", len(context.sentences))
+            count("tokens", sum(len(tokens) for tokens in context.sentence_tokens))
+            
+            with stage("analyze.keywords"):
+                sentences.extend(context.sentences)
+                sentence_spans.extend((start + offset, end + offset) for start, end in context.sentence_spans)
+                counts.extend(self._sentence_counts(context))
+                if use_corpus:
+                    stemmed.extend(self._context_stems(context))
+                if method == "embedding" and keywords is None:
+                    keywords = self.extract_keywords_embedding(chunk, num_keywords=15, context=context)
+            
+            with stage("analyze.quotes"):
+                for quote in self.extract_quotes(chunk, context=context):
+                    if quote["quote"] not in quotes:
+                        quotes[quote["quote"]] = dict(quote, start=quote["start"] + offset,
+                                                      end=quote["end"] + offset)
+            
+            with stage("analyze.entities"):
+                for entity_type, found in self._entity_spans(context).items():
+                    for entity, (start, end) in found.items():
+                        if entity not in entities[entity_type]:
+                            entities[entity_type][entity] = [start + offset, end + offset] if start >= 0 else [-1, -1]
+        
+        if length < MIN_TEXT_LENGTH:
+            raise ValueError("Teks terlalu pendek untuk dianalisis.")
+        
+        matrix = TermMatrix.from_counts(counts)
+        ranked = {}
         
+        def top_keywords(num_keywords: int) -> List[Tuple[str, float]]:
+            if num_keywords not in ranked:
+                ranked[num_keywords] = (self._rank_stems(stemmed, num_keywords) if use_corpus
+                                        else matrix.rank_tfidf(num_keywords))
+            return ranked[num_keywords]
+        
+        analysis = {}
+        offsets = {}
+        with stage("analyze.keywords"):
+            analysis["keywords"] = keywords if method == "embedding" else top_keywords(15)
+            offsets["keywords"] = _first_occurrences([keyword for keyword, _ in analysis["keywords"]],
+                                                     sentences, sentence_spans)
+        with stage("analyze.key_phrases"):
+            indices = self._select_keyphrases(matrix, 5, lambda: top_keywords(20))
+            analysis["key_phrases"] = [sentences[i] for i in indices]
+            offsets["key_phrases"] = [list(sentence_spans[i]) for i in indices]
+        analysis["quotes"] = list(quotes.values())
+        analysis["entities"] = {entity_type: list(found) for entity_type, found in entities.items()}
+        offsets["entities"] = {entity_type: list(found.values()) for entity_type, found in entities.items()}
+        analysis["offsets"] = offsets
+        
+        count("segment_cache_hits", self.segment_cache.hits - segment_hits)
+        count("segment_cache_misses", self.segment_cache.misses - segment_misses)
         return analysis
 
 
+def get_shared_extractor() -> KeywordExtractor:
+    """
+    Return the process-wide KeywordExtractor, creating it on first use.
+
+    The stemmer dictionary and stopword set are loaded once and shared by
+    every Streamlit session running in this process. Optional resources are
+    read from the environment: ANALISIS_STEM_TABLE (pre-built stem table),
+    ANALISIS_GAZETTEER (gazetteer file of known entities),
+    ANALISIS_CORPUS_MODEL (archive IDF model used to score keywords),
+    ANALISIS_KEYPHRASE_METHOD ("keywords" or "lexrank") and
+    ANALISIS_KEYWORD_METHOD ("tfidf" or "embedding").
+
+    Returns:
+        Shared KeywordExtractor instance
+    """
+    global _shared_extractor
+    if _shared_extractor is None:
+        with _shared_lock:
+            if _shared_extractor is None:
+                gazetteer_path = os.environ.get("ANALISIS_GAZETTEER")
+                corpus_path = os.environ.get("ANALISIS_CORPUS_MODEL")
+                _shared_extractor = KeywordExtractor(
+                    stem_table_path=os.environ.get("ANALISIS_STEM_TABLE") or None,
+                    gazetteer=Gazetteer.from_file(gazetteer_path) if gazetteer_path else None,
+                    corpus_model=CorpusTfidfModel.load(corpus_path) if corpus_path else None,
+                    keyphrase_method=os.environ.get("ANALISIS_KEYPHRASE_METHOD", "keywords"),
+                    keyword_method=os.environ.get("ANALISIS_KEYWORD_METHOD", "tfidf")
+                )
+    return _shared_extractor
+
+
+def _run_warm_up() -> None:
+    """Build the shared extractor and run one analysis to load lazy resources."""
+    try:
+        get_shared_extractor().analyze_text(WARMUP_TEXT)
+    finally:
+        _warmup_done.set()
+
+
+def warm_up(background: bool = False) -> None:
+    """
+    Warm up the shared extractor so the first real request does not pay setup cost.
+
+    Safe to call on every script rerun: only the first call does any work.
+
+    Args:
+        background: Run the warm-up in a daemon thread instead of blocking
+    """
+    global _warmup_thread
+    if _warmup_done.is_set():
+        return
+
+    with _shared_lock:
+        if _warmup_thread is not None:
+            thread = _warmup_thread
+        else:
+            thread = threading.Thread(target=_run_warm_up, name="keyword-extractor-warmup", daemon=True)
+            _warmup_thread = thread
+            thread.start()
+
+    if not background:
+        thread.join()
+
+
 # Fungsi untuk testing modul secara mandiri
 def test_keyword_extractor():
+    import streamlit as st
     st.title("Test Keyword Extractor")
     
-    # Initialize the extractor
-    extractor = KeywordExtractor()
+    # Gunakan extractor bersama agar tidak dibangun ulang setiap rerun
+    extractor = get_shared_extractor()
     
     # Get sample text input
     sample_text = st.text_area(
@@ -279,7 +940,7 @@ def test_keyword_extractor():
     )
     
     if st.button("Analisis Teks"):
-        if len(sample_text.strip()) < 50:
+        if len(sample_text.strip()) < MIN_TEXT_LENGTH:
             st.error("Teks terlalu pendek. Mohon masukkan teks yang lebih panjang.")
         else:
             with st.spinner("Menganalisis teks..."):
@@ -0,0 +1,361 @@
+"""
+Large Document Module for Analisis Siaran Pers.
+Memory-bounded handling of very large uploads: the upload is spilled to a
+temporary file, extracted page by page (DOCX paragraph by paragraph, TXT
+block by block) into a text file on disk, and analyzed in segment-aligned chunks. Only a bounded
+preview of the text is kept in memory and in the Streamlit session.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+import weakref
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+from .analysis_context import SEGMENT_BOUNDARY
+from .document_processor import (
+    MAX_PDF_PAGES, DocumentError, DocumentProcessor, EmptyDocumentError, check_extension, check_upload_size,
+    content_size, env_number
+)
+from .instrumentation import count, stage
+
+# Unggahan di atas ukuran ini (MB) diproses dalam mode dokumen besar
+LARGE_DOCUMENT_MB = env_number("ANALISIS_LARGE_DOCUMENT_MB", 10.0, float)
+
+# Jumlah karakter teks yang disimpan di memori untuk ditampilkan
+PREVIEW_CHARS = env_number("ANALISIS_PREVIEW_CHARS", 20000)
+
+# Perkiraan panjang potongan teks (karakter) per langkah analisis
+CHUNK_CHARS = env_number("ANALISIS_CHUNK_CHARS", 200000)
+
+# File teks sementara yang tidak dipakai lebih lama dari ini (jam) dihapus oleh sweep_stale_text_files
+TEXT_FILE_TTL_HOURS = env_number("ANALISIS_TEXT_FILE_TTL_HOURS", 24.0, float)
+
+# Awalan nama file teks sementara, agar file yang tertinggal dapat dikenali dan dibersihkan
+TEXT_FILE_PREFIX = "analisis-teks-"
+
+# Jeda minimum (detik) antara dua pembersihan folder sementara
+SWEEP_INTERVAL = 600
+
+COPY_BUFFER_BYTES = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+_last_sweep = 0.0
+_sweep_lock = threading.Lock()
+
+
+def _remove_quietly(path: str) -> None:
+    """Remove a file that may already be gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def sweep_stale_text_files(max_age_hours: Optional[float] = None, force: bool = False) -> int:
+    """
+    Remove temporary text files of large documents that were not used for a while.
+
+    Files are normally removed when their LargeDocument is discarded or
+    garbage-collected with its session; this sweep catches files left by
+    processes that exited without cleaning up. It runs at most once per
+    SWEEP_INTERVAL unless ``force`` is set.
+
+    Args:
+        max_age_hours: Age after the last use (defaults to ANALISIS_TEXT_FILE_TTL_HOURS; 0 disables the sweep)
+        force: Sweep even if the last sweep was recent
+
+    Returns:
+        Number of files removed
+    """
+    global _last_sweep
+    max_age_hours = TEXT_FILE_TTL_HOURS if max_age_hours is None else max_age_hours
+    if max_age_hours <= 0:
+        return 0
+    with _sweep_lock:
+        now = time.time()
+        if not force and now - _last_sweep < SWEEP_INTERVAL:
+            return 0
+        _last_sweep = now
+
+    directory = tempfile.gettempdir()
+    removed = 0
+    for entry in os.scandir(directory):
+        if not (entry.name.startswith(TEXT_FILE_PREFIX) and entry.name.endswith(".txt")):
+            continue
+        try:
+            if entry.is_file(follow_symlinks=False) and now - entry.stat().st_mtime > max_age_hours * 3600:
+                os.remove(entry.path)
+                removed += 1
+        except OSError as e:
+            # File milik pengguna lain atau sudah dihapus proses lain
+            logger.debug("File sementara %s tidak dapat dihapus: %s", entry.path, e)
+    return removed
+
+
+def is_large(size: int) -> bool:
+    """Return True if a document of ``size`` bytes should be handled in large-document mode."""
+    return size > LARGE_DOCUMENT_MB * 1024 * 1024
+
+
+def spill_to_disk(source, suffix: str = "") -> str:
+    """
+    Copy an upload to a temporary file in fixed-size blocks.
+
+    Args:
+        source: Binary file object (read from the start) or bytes
+        suffix: File name suffix, e.g. ".pdf"
+
+    Returns:
+        Path of the temporary file; the caller removes it
+
+    Raises:
+        DocumentError: If the content exceeds ANALISIS_MAX_UPLOAD_MB
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        check_upload_size(len(source))
+        blocks = iter([bytes(source)])
+    else:
+        source.seek(0)
+        blocks = iter(lambda: source.read(COPY_BUFFER_BYTES), b"")
+
+    handle = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        with handle:
+            written = 0
+            for block in blocks:
+                written += len(block)
+                check_upload_size(written)
+                handle.write(block)
+        return handle.name
+    except BaseException:
+        os.remove(handle.name)
+        raise
+
+
+def _iter_pages(source, extension: str,
+                progress_callback: Optional[Callable[[int, int], None]] = None) -> Iterator[str]:
+    """Yield the text of a document in pieces, with the same output as ``extract_text_from_bytes``."""
+    if extension == "pdf":
+        try:
+            reader = DocumentProcessor.open_pdf(source)
+            total = len(reader.pages)
+            if MAX_PDF_PAGES and total > MAX_PDF_PAGES:
+                count("pages_skipped", total - MAX_PDF_PAGES)
+                total = MAX_PDF_PAGES
+            for done, page_text in enumerate(DocumentProcessor.iter_pdf_pages(reader, (0, total)), 1):
+                count("pages")
+                if progress_callback:
+                    progress_callback(done, total)
+                yield page_text + "\n\n"
+        except Exception as e:
+            raise DocumentError(f"Error saat mengekstrak teks dari PDF: {e}") from e
+    elif extension in ["docx", "doc"]:
+        yield from DocumentProcessor.iter_word_text(source)
+    elif extension == "txt":
+        try:
+            yield from DocumentProcessor.iter_txt_text(source)
+        except Exception as e:
+            raise DocumentError(f"Error saat mengekstrak teks dari TXT: {e}") from e
+    else:
+        raise DocumentError(f"Format file tidak didukung: {extension}")
+
+
+def _last_boundary(text: str) -> Optional[int]:
+    """Return the end of the last segment boundary that is followed by text, or None."""
+    cut = None
+    for match in SEGMENT_BOUNDARY.finditer(text):
+        # Batas di ujung buffer bisa masih berlanjut di potongan berikutnya
+        if match.end() < len(text):
+            cut = match.end()
+    return cut
+
+
+def chunk_text(pieces: Iterable[str], chunk_chars: int = CHUNK_CHARS) -> Iterator[Tuple[int, str]]:
+    """
+    Regroup a stream of text pieces into chunks cut at segment boundaries.
+
+    Chunks end where ``split_segments`` would start a new segment, so
+    analyzing the chunks separately yields the same segments and sentences as
+    the whole text. A chunk is yielded as soon as enough text has arrived, so
+    analysis can start before the rest of the document is extracted. A
+    segment longer than four chunks is cut without a boundary.
+
+    Args:
+        pieces: Text in document order, e.g. PDF pages or file reads
+        chunk_chars: Approximate chunk length in characters
+
+    Yields:
+        (character offset, chunk text) in document order
+    """
+    offset = 0
+    buffer = ""
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= chunk_chars:
+            window = buffer[:chunk_chars * 4]
+            cut = _last_boundary(window)
+            if cut is None:
+                if len(buffer) < chunk_chars * 4:
+                    break
+                cut = len(window)
+            yield offset, buffer[:cut]
+            offset += cut
+            buffer = buffer[cut:]
+    if buffer:
+        yield offset, buffer
+
+
+def iter_text_chunks(path: str, chunk_chars: int = CHUNK_CHARS) -> Iterator[Tuple[int, str]]:
+    """
+    Read a UTF-8 text file in chunks cut at segment boundaries (see ``chunk_text``).
+
+    Args:
+        path: Path of the text file
+        chunk_chars: Approximate chunk length in characters
+
+    Yields:
+        (character offset, chunk text) in document order
+    """
+    with open(path, encoding="utf-8", newline="") as handle:
+        yield from chunk_text(iter(lambda: handle.read(chunk_chars), ""), chunk_chars)
+
+
+def stream_document_chunks(name: str, source, progress_callback: Optional[Callable[[int, int], None]] = None,
+                           chunk_chars: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    """
+    Extract a document and yield segment-aligned chunks while extraction is still running.
+
+    PDF pages come from ``DocumentProcessor.iter_pdf_pages`` one at a time,
+    so the first chunks can be analyzed before the last pages are read, and
+    neither the whole text nor a copy of the upload is held in memory.
+
+    Args:
+        name: File name (its extension selects the extractor)
+        source: Document as bytes, a file path, or a binary file object
+        progress_callback: Called with (pages_done, total_pages) while a PDF is extracted
+        chunk_chars: Approximate chunk length (defaults to ANALISIS_CHUNK_CHARS)
+
+    Yields:
+        (character offset, chunk text) in document order
+
+    Raises:
+        DocumentError: If the format is not supported, the file is too large or extraction fails
+    """
+    extension = name.split(".")[-1].lower()
+    check_upload_size(content_size(source))
+    # Tanpa stage(): waktu di antara potongan dipakai oleh analisis, bukan ekstraksi
+    yield from chunk_text(_iter_pages(source, extension, progress_callback), chunk_chars or CHUNK_CHARS)
+
+
+class LargeDocument:
+    """
+    Extracted text of a large upload, kept in a temporary file with an in-memory preview.
+
+    The file is removed by ``discard`` or when the object is garbage-collected
+    (e.g. with an expired Streamlit session); ``sweep_stale_text_files`` removes
+    files left behind by processes that did not exit cleanly.
+    """
+
+    def __init__(self, name: str, text_path: str, characters: int, words: int, preview: str, key: str,
+                 source_size: int = 0):
+        """
+        Initialize the document. Use ``LargeDocument.extract`` to create one from an upload.
+
+        Args:
+            name: Original file name
+            text_path: Path of the UTF-8 text file holding the extracted text
+            characters: Length of the extracted text
+            words: Number of whitespace-separated words
+            preview: First PREVIEW_CHARS characters of the text
+            key: Content hash of the extracted text
+            source_size: Size in bytes of the uploaded file
+        """
+        self.name = name
+        self.text_path = text_path
+        self.characters = characters
+        self.words = words
+        self.preview = preview
+        self.key = key
+        self.source_size = source_size
+        # File teks dihapus saat dokumen dibuang, termasuk saat session berakhir dan objeknya dikumpulkan
+        self._finalizer = weakref.finalize(self, _remove_quietly, text_path)
+
+    @classmethod
+    def extract(cls, name: str, source,
+                progress_callback: Optional[Callable[[int, int], None]] = None) -> "LargeDocument":
+        """
+        Spill an upload to disk and extract its text into a temporary text file.
+
+        Args:
+            name: Original file name (its extension selects the extractor)
+            source: Binary file object, bytes, or a path to the document
+            progress_callback: Called with (pages_done, total_pages) while a PDF is extracted
+
+        Returns:
+            LargeDocument
+
+        Raises:
+            DocumentError: If the format is not supported, the file is too large or extraction fails
+            EmptyDocumentError: If the document contains no text
+        """
+        extension = check_extension(name)
+        source_size = content_size(source)
+        check_upload_size(source_size)
+        sweep_stale_text_files()
+        spilled = None
+        if not isinstance(source, (str, os.PathLike)):
+            spilled = source = spill_to_disk(source, f".{extension}")
+
+        digest = hashlib.blake2b(digest_size=20)
+        preview = []
+        preview_length = characters = words = 0
+        joined = True
+        has_text = False
+        text_file = tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="", prefix=TEXT_FILE_PREFIX,
+                                                suffix=".txt", delete=False)
+        try:
+            with text_file, stage(f"extract.{extension}"):
+                for piece in _iter_pages(os.fspath(source), extension, progress_callback):
+                    if not piece:
+                        continue
+                    text_file.write(piece)
+                    digest.update(piece.encode("utf-8"))
+                    characters += len(piece)
+                    has_text = has_text or bool(piece.strip())
+                    # Kata yang terpotong di antara dua bagian dihitung sekali
+                    words += len(piece.split()) - (not joined and not piece[0].isspace() and bool(piece.split()))
+                    joined = piece[-1].isspace()
+                    if preview_length < PREVIEW_CHARS:
+                        preview.append(piece[:PREVIEW_CHARS - preview_length])
+                        preview_length += len(preview[-1])
+            count("characters", characters)
+            if not has_text:
+                raise EmptyDocumentError("Tidak ada teks yang dapat diekstrak dari dokumen.")
+        except BaseException:
+            os.remove(text_file.name)
+            raise
+        finally:
+            if spilled:
+                os.remove(spilled)
+
+        return cls(name, text_file.name, characters, words, "".join(preview), digest.hexdigest(), source_size)
+
+    @property
+    def truncated(self) -> bool:
+        """True if the preview is shorter than the text."""
+        return self.characters > len(self.preview)
+
+    def chunks(self, chunk_chars: int = CHUNK_CHARS) -> Iterator[Tuple[int, str]]:
+        """Yield (character offset, text) chunks cut at segment boundaries."""
+        # Tandai file sebagai masih dipakai agar tidak dihapus oleh sweep_stale_text_files
+        os.utime(self.text_path)
+        return iter_text_chunks(self.text_path, chunk_chars)
+
+    def discard(self) -> None:
+        """Remove the temporary text file."""
+        self._finalizer()
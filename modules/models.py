@@ -0,0 +1,261 @@
+"""
+Result Models Module for Analisis Siaran Pers.
+Compact typed records for analysis results (keywords, key phrases, quotes
+and entities, each with character offsets) and a columnar Arrow/Parquet
+export for archive-scale result sets.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class Keyword:
+    """Keyword with its score and first occurrence in the text (-1 if not found)."""
+    __slots__ = ("text", "score", "start", "end")
+    text: str
+    score: float
+    start: int
+    end: int
+
+
+@dataclass
+class KeyPhrase:
+    """Key sentence with its character offsets."""
+    __slots__ = ("text", "start", "end")
+    text: str
+    start: int
+    end: int
+
+
+@dataclass
+class Quote:
+    """Quoted statement with its surrounding sentence and character offsets."""
+    __slots__ = ("text", "context", "start", "end")
+    text: str
+    context: str
+    start: int
+    end: int
+
+
+@dataclass
+class Entity:
+    """Named entity with its type and first occurrence in the text."""
+    __slots__ = ("text", "entity_type", "start", "end")
+    text: str
+    entity_type: str
+    start: int
+    end: int
+
+
+def _spans(offsets, count: int) -> List[Tuple[int, int]]:
+    """Return ``count`` (start, end) pairs from analysis offsets, (-1, -1) where they are missing."""
+    offsets = list(offsets or [])
+    return [tuple(offsets[i]) if i < len(offsets) else (-1, -1) for i in range(count)]
+
+
+@dataclass
+class AnalysisResult:
+    """Typed analysis result of one document."""
+    __slots__ = ("keywords", "key_phrases", "quotes", "entities")
+    keywords: List[Keyword]
+    key_phrases: List[KeyPhrase]
+    quotes: List[Quote]
+    entities: List[Entity]
+
+    @classmethod
+    def from_analysis(cls, analysis: Dict) -> "AnalysisResult":
+        """
+        Build a typed result from the dictionary returned by ``KeywordExtractor.analyze_text``.
+
+        Character offsets come from the analysis itself (its "offsets" entry and
+        the offsets of each quote), so the text is not needed; items without
+        recorded offsets get -1.
+
+        Args:
+            analysis: Analysis dictionary
+
+        Returns:
+            AnalysisResult
+        """
+        offsets = analysis.get("offsets", {})
+        found_keywords = analysis.get("keywords", [])
+        keywords = [Keyword(keyword, float(score), *span) for (keyword, score), span
+                    in zip(found_keywords, _spans(offsets.get("keywords"), len(found_keywords)))]
+        found_phrases = analysis.get("key_phrases", [])
+        key_phrases = [KeyPhrase(phrase, *span) for phrase, span
+                       in zip(found_phrases, _spans(offsets.get("key_phrases"), len(found_phrases)))]
+        quotes = [Quote(quote["quote"], quote["context"], quote.get("start", -1), quote.get("end", -1))
+                  for quote in analysis.get("quotes", [])]
+        entity_offsets = offsets.get("entities", {})
+        entities = [Entity(entity, entity_type, *span)
+                    for entity_type, found in analysis.get("entities", {}).items()
+                    for entity, span in zip(found, _spans(entity_offsets.get(entity_type), len(found)))]
+        return cls(keywords, key_phrases, quotes, entities)
+
+    def to_dict(self) -> Dict:
+        """Convert back to the dictionary layout returned by ``analyze_text``."""
+        entities: Dict[str, List[str]] = {"organizations": [], "people": [], "locations": []}
+        entity_offsets: Dict[str, List[List[int]]] = {"organizations": [], "people": [], "locations": []}
+        for entity in self.entities:
+            entities.setdefault(entity.entity_type, []).append(entity.text)
+            entity_offsets.setdefault(entity.entity_type, []).append([entity.start, entity.end])
+        return {
+            "keywords": [(keyword.text, keyword.score) for keyword in self.keywords],
+            "key_phrases": [phrase.text for phrase in self.key_phrases],
+            "quotes": [{"quote": quote.text, "context": quote.context, "start": quote.start, "end": quote.end}
+                       for quote in self.quotes],
+            "entities": entities,
+            "offsets": {
+                "keywords": [[keyword.start, keyword.end] for keyword in self.keywords],
+                "key_phrases": [[phrase.start, phrase.end] for phrase in self.key_phrases],
+                "entities": entity_offsets
+            }
+        }
+
+    def keywords_frame(self):
+        """Return the keywords as a pandas DataFrame built column by column."""
+        import pandas as pd
+        return pd.DataFrame({
+            "keyword": [keyword.text for keyword in self.keywords],
+            "score": [keyword.score for keyword in self.keywords],
+            "start": [keyword.start for keyword in self.keywords],
+            "end": [keyword.end for keyword in self.keywords]
+        })
+
+
+# Kolom setiap tabel ekspor; doc_id menghubungkan baris dengan dokumennya
+TABLE_COLUMNS = {
+    "keywords": ("doc_id", "rank", "keyword", "score", "start", "end"),
+    "key_phrases": ("doc_id", "rank", "phrase", "start", "end"),
+    "quotes": ("doc_id", "quote", "context", "start", "end"),
+    "entities": ("doc_id", "entity", "entity_type", "start", "end"),
+}
+
+
+def _schema(columns: Tuple[str, ...]):
+    """Return a fixed Arrow schema so every row group of a table has the same column types."""
+    import pyarrow as pa
+    types = {"rank": pa.int32(), "score": pa.float64(), "start": pa.int64(), "end": pa.int64()}
+    return pa.schema([(name, types.get(name, pa.string())) for name in columns])
+
+
+class ResultTableWriter:
+    """
+    Stream analysis results of many documents into columnar Arrow/Parquet tables.
+
+    One file is written per table (keywords, key_phrases, quotes, entities).
+    Rows are buffered column by column and flushed as row groups, so memory
+    stays bounded regardless of archive size. Requires ``pyarrow``.
+
+    Example:
+        with ResultTableWriter("hasil/") as writer:
+            for doc_id, result in results:
+                writer.add(doc_id, result)
+    """
+
+    def __init__(self, directory: str, file_format: str = "parquet", batch_size: int = 1000):
+        """
+        Initialize the writer.
+
+        Args:
+            directory: Output folder
+            file_format: "parquet" or "arrow" (Arrow IPC file)
+            batch_size: Number of documents buffered before a row group is written
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Ekspor kolumnar membutuhkan paket 'pyarrow'.") from e
+        if file_format not in ("parquet", "arrow"):
+            raise ValueError(f"Format tidak dikenal: {file_format}")
+
+        self.directory = directory
+        self.file_format = file_format
+        self.batch_size = batch_size
+        self._buffers = {table: {column: [] for column in columns} for table, columns in TABLE_COLUMNS.items()}
+        self._writers: Dict[str, object] = {}
+        self._pending_docs = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, doc_id: str, result: AnalysisResult) -> None:
+        """Append the rows of one document."""
+        buffers = self._buffers
+        for rank, keyword in enumerate(result.keywords, 1):
+            self._append(buffers["keywords"], doc_id, rank, keyword.text, keyword.score, keyword.start, keyword.end)
+        for rank, phrase in enumerate(result.key_phrases, 1):
+            self._append(buffers["key_phrases"], doc_id, rank, phrase.text, phrase.start, phrase.end)
+        for quote in result.quotes:
+            self._append(buffers["quotes"], doc_id, quote.text, quote.context, quote.start, quote.end)
+        for entity in result.entities:
+            self._append(buffers["entities"], doc_id, entity.text, entity.entity_type, entity.start, entity.end)
+
+        self._pending_docs += 1
+        if self._pending_docs >= self.batch_size:
+            self.flush()
+
+    @staticmethod
+    def _append(buffer: Dict[str, list], *values) -> None:
+        for column, value in zip(buffer, values):
+            buffer[column].append(value)
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group per table."""
+        for table_name, buffer in self._buffers.items():
+            writer = self._writers.get(table_name)
+            if writer is None:
+                writer = self._open_writer(table_name)
+                self._writers[table_name] = writer
+            if buffer["doc_id"]:
+                writer.write_table(self._table(buffer))
+            for column in buffer.values():
+                column.clear()
+        self._pending_docs = 0
+
+    @staticmethod
+    def _table(buffer: Dict[str, list]):
+        import pyarrow as pa
+        return pa.table(buffer, schema=_schema(tuple(buffer)))
+
+    def _open_writer(self, table_name: str):
+        import pyarrow as pa
+        path = os.path.join(self.directory, f"{table_name}.{self.file_format}")
+        schema = _schema(TABLE_COLUMNS[table_name])
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(path, schema)
+        return pa.ipc.new_file(path, schema)
+
+    def close(self) -> None:
+        """Flush remaining rows and close all files."""
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    def __enter__(self) -> "ResultTableWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def export_results(results: Iterable[Tuple[str, AnalysisResult]], directory: str,
+                   file_format: str = "parquet", batch_size: int = 1000) -> Optional[str]:
+    """
+    Export many documents' results to columnar tables.
+
+    Args:
+        results: Iterable of (doc_id, AnalysisResult)
+        directory: Output folder
+        file_format: "parquet" or "arrow"
+        batch_size: Number of documents per row group
+
+    Returns:
+        The output directory
+    """
+    with ResultTableWriter(directory, file_format, batch_size) as writer:
+        for doc_id, result in results:
+            writer.add(doc_id, result)
+    return directory
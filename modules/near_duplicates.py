@@ -0,0 +1,216 @@
+"""
+Near-Duplicate Module for Analisis Siaran Pers.
+Clusters syndicated reprints of the same story with MinHash signatures over
+word shingles and banded locality-sensitive hashing, so each story is
+analyzed once and reported with its reach across outlets.
+"""
+
+import re
+import zlib
+from typing import Dict, Iterable, List, Tuple
+
+# Bilangan prima terbesar di bawah 2^32: a * x + b tetap muat dalam uint64
+MERSENNE_PRIME = 4294967291
+
+# Basis hash bergulir untuk menggabungkan hash kata menjadi hash shingle
+SHINGLE_BASE = 1000003
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def shingle_hashes(text: str, size: int = 5):
+    """
+    Hash the overlapping word n-grams of a text.
+
+    Each word is hashed once; n-gram hashes are combined from the word hashes
+    with a vectorized polynomial rolling hash instead of joining strings.
+
+    Args:
+        text: Article text
+        size: Words per shingle (shorter texts yield one shingle)
+
+    Returns:
+        numpy uint64 array of unique shingle hashes below MERSENNE_PRIME
+    """
+    import numpy as np
+
+    words = WORD_PATTERN.findall(text.lower())
+    word_hashes = np.fromiter((zlib.crc32(word.encode("utf-8")) for word in words), dtype=np.uint64,
+                              count=len(words)) % np.uint64(MERSENNE_PRIME)
+    size = max(1, min(size, len(words)))
+    count = len(words) - size + 1
+    base, prime = np.uint64(SHINGLE_BASE), np.uint64(MERSENNE_PRIME)
+    shingles = np.zeros(max(count, 0), dtype=np.uint64)
+    for offset in range(size):
+        shingles = (shingles * base + word_hashes[offset:offset + count]) % prime
+    return np.unique(shingles)
+
+
+def lsh_parameters(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Choose the (bands, rows) split of a signature whose S-curve midpoint is closest to a threshold.
+
+    Args:
+        num_perm: Signature length
+        threshold: Target Jaccard similarity
+
+    Returns:
+        (bands, rows) with bands * rows <= num_perm
+    """
+    candidates = [(num_perm // rows, rows) for rows in range(1, num_perm + 1)]
+    return min(candidates, key=lambda pair: abs((1 / pair[0]) ** (1 / pair[1]) - threshold))
+
+
+def article_text(article: Dict) -> str:
+    """Return the text of a NewsAPI-style article used for duplicate detection."""
+    return " ".join(article.get(field) or "" for field in ("title", "description", "content"))
+
+
+class NearDuplicateIndex:
+    """Incremental MinHash LSH index that groups near-duplicate documents into clusters."""
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        Initialize an empty index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of two documents in one cluster
+            num_perm: MinHash signature length (more is more accurate and slower)
+            shingle_size: Words per shingle
+            seed: Seed of the hash permutations (indexes must share it to be comparable)
+        """
+        import numpy as np
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = lsh_parameters(num_perm, threshold)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self.signatures: List = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        # Union-find: setiap dokumen menunjuk ke dokumen induk klasternya
+        self._parent: List[int] = []
+
+    def signature(self, text: str):
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Document text
+
+        Returns:
+            numpy uint64 array of length ``num_perm``
+        """
+        import numpy as np
+
+        hashes = shingle_hashes(text, self.shingle_size)
+        if not len(hashes):
+            return np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint64)
+        # Semua permutasi untuk semua shingle dalam satu operasi matriks
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    def similarity(self, first: int, second: int) -> float:
+        """Estimated Jaccard similarity of two indexed documents."""
+        return float((self.signatures[first] == self.signatures[second]).mean())
+
+    def _find(self, index: int) -> int:
+        while self._parent[index] != index:
+            self._parent[index] = self._parent[self._parent[index]]
+            index = self._parent[index]
+        return index
+
+    def add(self, text: str) -> int:
+        """
+        Index a document and merge it into the cluster of any near-duplicate.
+
+        Only documents sharing an LSH band are compared, and a candidate joins
+        the cluster only if its estimated similarity reaches the threshold.
+        Documents without words are not bucketed and stay in their own cluster.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Position of the document in the index
+        """
+        signature = self.signature(text)
+        index = len(self.signatures)
+        self.signatures.append(signature)
+        self._parent.append(index)
+        # Teks kosong memiliki tanda tangan yang sama persis; jangan gabungkan satu sama lain
+        if not WORD_PATTERN.search(text):
+            return index
+
+        candidates = set()
+        for band, buckets in enumerate(self._buckets):
+            key = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = buckets.setdefault(key, [])
+            candidates.update(bucket)
+            bucket.append(index)
+
+        for candidate in candidates:
+            if self.similarity(index, candidate) >= self.threshold:
+                root, other = self._find(index), self._find(candidate)
+                if root != other:
+                    self._parent[max(root, other)] = min(root, other)
+        return index
+
+    def clusters(self) -> List[List[int]]:
+        """
+        Return the clusters of indexed documents.
+
+        Returns:
+            Lists of document positions, ordered by their first document
+        """
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(self._parent)):
+            groups.setdefault(self._find(index), []).append(index)
+        return list(groups.values())
+
+
+def deduplicate_articles(articles: Iterable[Dict], threshold: float = 0.7, num_perm: int = 128,
+                         shingle_size: int = 5) -> List[Dict]:
+    """
+    Collapse near-duplicate articles to one representative per story.
+
+    The representative is the article with the longest text (the fullest
+    copy of the story). It is returned as a copy with "reach" (number of
+    articles in the cluster), "outlets" (distinct source names) and
+    "duplicates" (URLs of the other copies).
+
+    Args:
+        articles: Articles in the NewsAPI layout
+        threshold: Minimum estimated Jaccard similarity of reprints
+        num_perm: MinHash signature length
+        shingle_size: Words per shingle
+
+    Returns:
+        Representatives in the order their stories first appeared
+    """
+    articles = list(articles)
+    index = NearDuplicateIndex(threshold, num_perm, shingle_size)
+    texts = [article_text(article) for article in articles]
+    for text in texts:
+        index.add(text)
+
+    representatives = []
+    for members in index.clusters():
+        best = max(members, key=lambda member: (len(texts[member]), -member))
+        outlets = {}
+        for member in members:
+            source = articles[member].get("source")
+            name = source.get("name") if isinstance(source, dict) else source
+            if name:
+                outlets[name] = None
+        representatives.append(dict(
+            articles[best],
+            reach=len(members),
+            outlets=list(outlets),
+            duplicates=[articles[member].get("url") for member in members if member != best]
+        ))
+    return representatives
@@ -0,0 +1,264 @@
+"""
+News Archive Module for Analisis Siaran Pers.
+Local store of fetched and imported news articles with an SQLite FTS5
+index over stemmed text, so related coverage of a release can be looked up
+offline with bm25 ranking instead of a live NewsAPI search.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from .stemming import TOKEN_PATTERN
+
+# Kata awal kutipan yang dicari sebagai frasa (kutipan panjang jarang dimuat utuh)
+MAX_QUOTE_TERMS = 8
+
+_shared_archive: Optional["NewsArchive"] = None
+_shared_lock = threading.Lock()
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY,
+        url TEXT UNIQUE NOT NULL,
+        digest TEXT NOT NULL,
+        source TEXT,
+        published_at TEXT,
+        payload TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS articles_published ON articles (published_at)",
+    # Indeks hanya menyimpan teks hasil stemming; artikel asli ada di tabel articles
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(title, body)",
+)
+
+
+def _article_digest(article: Dict) -> str:
+    """Hash the searchable fields of an article to detect changed re-fetches."""
+    fields = [article.get(field) or "" for field in ("title", "description", "content")]
+    return hashlib.blake2b("\x1f".join(fields).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class NewsArchive:
+    """SQLite store of news articles with a full-text index over stemmed title and body."""
+
+    def __init__(self, path: str, stemmer=None, stopwords: Iterable[str] = ()):
+        """
+        Open (or create) an archive.
+
+        Args:
+            path: Path to the SQLite database file
+            stemmer: Object with a ``stem(word)`` method (defaults to the shared extractor's stemmer)
+            stopwords: Words left out of the index and of queries
+        """
+        self.path = path
+        self._stemmer = stemmer
+        self.stopwords = set(stopwords)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the current process."""
+        # Koneksi SQLite tidak boleh dipakai lintas proses setelah fork
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    @property
+    def stemmer(self):
+        if self._stemmer is None:
+            from .keyword_extractor import get_shared_extractor
+            self._stemmer = get_shared_extractor().stemmer
+        return self._stemmer
+
+    def stem_terms(self, text: str) -> List[str]:
+        """
+        Tokenize and stem text the same way for indexing and querying.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Stems of the non-stopword tokens, in order
+        """
+        stem = self.stemmer.stem
+        return [stem(word) for word in TOKEN_PATTERN.findall(text.lower()) if word not in self.stopwords]
+
+    def add_articles(self, articles: Iterable[Dict]) -> int:
+        """
+        Insert new articles and re-index changed ones; unchanged re-fetches are skipped.
+
+        Args:
+            articles: Articles in the NewsAPI layout (url, title, description, content,
+                source, publishedAt); articles without a URL are ignored
+
+        Returns:
+            Number of articles inserted or updated
+        """
+        changed = 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for article in articles:
+                    url = article.get("url")
+                    if not url:
+                        continue
+                    digest = _article_digest(article)
+                    row = conn.execute("SELECT id, digest FROM articles WHERE url = ?", (url,)).fetchone()
+                    if row and row[1] == digest:
+                        continue
+
+                    source = article.get("source")
+                    values = (digest, source.get("name") if isinstance(source, dict) else source,
+                              article.get("publishedAt"), json.dumps(article, ensure_ascii=False))
+                    if row:
+                        article_id = row[0]
+                        conn.execute("UPDATE articles SET digest = ?, source = ?, published_at = ?, payload = ? "
+                                     "WHERE id = ?", (*values, article_id))
+                        conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (article_id,))
+                    else:
+                        article_id = conn.execute(
+                            "INSERT INTO articles (url, digest, source, published_at, payload) VALUES (?, ?, ?, ?, ?)",
+                            (url, *values)
+                        ).lastrowid
+
+                    body = " ".join(article.get(field) or "" for field in ("description", "content"))
+                    conn.execute("INSERT INTO articles_fts (rowid, title, body) VALUES (?, ?, ?)", (
+                        article_id,
+                        " ".join(self.stem_terms(article.get("title") or "")),
+                        " ".join(self.stem_terms(body))
+                    ))
+                    changed += 1
+        return changed
+
+    def build_query(self, keywords: Iterable[str], quotes: Iterable[str] = ()) -> str:
+        """
+        Build an FTS5 query matching any keyword or the opening words of any quote.
+
+        Multi-word keywords and quotes become phrase queries over their stems.
+
+        Args:
+            keywords: Keywords or key phrases
+            quotes: Quotes to look for
+
+        Returns:
+            FTS5 MATCH expression, or an empty string if nothing is searchable
+        """
+        phrases = [self.stem_terms(keyword) for keyword in keywords]
+        phrases += [self.stem_terms(quote)[:MAX_QUOTE_TERMS] for quote in quotes]
+        # Token hanya berisi huruf, sehingga aman diapit tanda petik FTS5
+        unique = dict.fromkeys(" ".join(terms) for terms in phrases if terms)
+        return " OR ".join(f'"{phrase}"' for phrase in unique)
+
+    def search(self, keywords: Iterable[str], quotes: Iterable[str] = (), limit: int = 10,
+               since: Optional[str] = None) -> List[Dict]:
+        """
+        Find archived articles related to a release, best bm25 match first.
+
+        Title matches weigh three times as much as body matches.
+
+        Args:
+            keywords: Keywords or key phrases of the release
+            quotes: Quotes of the release
+            limit: Maximum number of articles
+            since: Only articles published at or after this ISO timestamp
+
+        Returns:
+            Articles in the NewsAPI layout, each with an added "archive_score"
+        """
+        query = self.build_query(keywords, quotes)
+        if not query:
+            return []
+
+        sql = ("SELECT a.payload, bm25(articles_fts, 3.0, 1.0) AS rank FROM articles_fts "
+               "JOIN articles a ON a.id = articles_fts.rowid WHERE articles_fts MATCH ?")
+        params: List = [query]
+        if since:
+            sql += " AND a.published_at >= ?"
+            params.append(since)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        # bm25 FTS5 bernilai negatif: makin kecil makin relevan
+        return [dict(json.loads(payload), archive_score=-rank) for payload, rank in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def get_shared_archive() -> Optional[NewsArchive]:
+    """
+    Return the process-wide NewsArchive, or None if no archive is configured.
+
+    The database path is read from ANALISIS_NEWS_ARCHIVE; stemming and
+    stopwords come from the shared KeywordExtractor.
+
+    Returns:
+        Shared NewsArchive instance or None
+    """
+    global _shared_archive
+    path = os.environ.get("ANALISIS_NEWS_ARCHIVE")
+    if not path:
+        return None
+    if _shared_archive is None:
+        with _shared_lock:
+            if _shared_archive is None:
+                from .keyword_extractor import get_shared_extractor
+                extractor = get_shared_extractor()
+                _shared_archive = NewsArchive(path, extractor.stemmer, extractor.stopwords)
+    return _shared_archive
+
+
+def iter_article_file(path: str) -> Iterable[Dict]:
+    """
+    Read articles from a NewsAPI response (JSON with "articles"), a JSON list or JSON Lines.
+
+    Args:
+        path: Path of the file
+
+    Yields:
+        Article dictionaries
+    """
+    with open(path, encoding="utf-8") as handle:
+        if path.endswith(".jsonl"):
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        payload = json.load(handle)
+    yield from payload.get("articles", []) if isinstance(payload, dict) else payload
+
+
+# Mengimpor artikel ke arsip:
+# python -m modules.news_archive <arsip.db> <berkas.json|berkas.jsonl>...
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Penggunaan: python -m modules.news_archive <arsip.db> <berkas.json|berkas.jsonl>...")
+        sys.exit(1)
+
+    from .keyword_extractor import get_shared_extractor
+
+    extractor = get_shared_extractor()
+    archive = NewsArchive(sys.argv[1], extractor.stemmer, extractor.stopwords)
+    added = sum(archive.add_articles(iter_article_file(path)) for path in sys.argv[2:])
+    print(f"{added} artikel ditambahkan atau diperbarui; arsip berisi {len(archive)} artikel")
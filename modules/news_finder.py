@@ -3,58 +3,228 @@ News Finder Module for Analisis Siaran Pers.
 Handles searching for news articles based on keywords.
 """
 
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
 import requests
-import streamlit as st
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# NewsAPI membatasi pageSize maksimum 100 per halaman
+MAX_PAGE_SIZE = 100
+
+# Jendela waktu bawaan fetch_news agar arsip lama tidak menutupi liputan terbaru
+DEFAULT_WINDOW_DAYS = 30
+
+logger = logging.getLogger(__name__)
+
 
 class NewsFinder:
     """Class to handle news search operations."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = "https://newsapi.org/v2/everything",
+                 timeout: float = 10.0, max_retries: int = 3, backoff_factor: float = 0.5,
+                 cache_ttl: float = 900.0, cache_size: int = 256, max_workers: int = 4, archive=None):
+        """
+        Initialize the news client.
+        
+        Args:
+            api_key: NewsAPI key (empty to search the local archive only)
+            base_url: Search endpoint (override to point at a local stub server)
+            timeout: Request timeout in seconds
+            max_retries: Retries for connection errors, 429 and 5xx responses
+            backoff_factor: Exponential backoff base in seconds (Retry-After is honored)
+            cache_ttl: Seconds a cached response stays valid (0 disables caching)
+            cache_size: Maximum number of cached responses (least recently used are dropped)
+            max_workers: Maximum concurrent requests in ``search_many``
+            archive: Optional NewsArchive; fetched articles are stored in it and
+                ``fetch_news`` answers from it first
+        """
         self.api_key = api_key
-        self.base_url = "https://newsapi.org/v2/everything"
+        self.archive = archive
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.max_workers = max_workers
+        
+        # Satu session dengan pool koneksi dan retry untuk semua permintaan
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Pesan galat terakhir, untuk ditampilkan oleh lapisan UI
+        self.last_error: Optional[str] = None
     
-    def search_news(self, keywords: List[str], language: str = "id", page_size: int = 5) -> List[Dict]:
+    @staticmethod
+    def normalize_query(keywords: List[str]) -> str:
         """
-        Search for news articles based on keywords.
+        Build a canonical OR query so equivalent keyword lists share cache entries.
         
         Args:
-            keywords: List of keywords to search for
-            language: Language of the articles (default is Indonesian)
-            page_size: Number of articles to return
+            keywords: List of keywords or quoted phrases
             
         Returns:
-            List of news articles as dictionaries
+            Query string with unique, case-folded, sorted terms
         """
-        query = " OR ".join(keywords)
+        terms = sorted({kw.strip().lower() for kw in keywords if kw and kw.strip()})
+        return " OR ".join(terms)
+    
+    def _get_page(self, query: str, language: str, page: int, page_size: int,
+                  since: Optional[str] = None) -> Dict:
+        """Fetch one result page, using the bounded TTL cache when possible."""
+        cache_key = (query, language, page, page_size, since)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > now:
+                self._cache.move_to_end(cache_key)
+                return cached[1]
+        
         params = {
             "q": query,
             "language": language,
             "pageSize": page_size,
+            "page": page,
             "apiKey": self.api_key
         }
+        if since:
+            params["from"] = since
+        response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        payload = response.json()
+        
+        if self.cache_ttl > 0 and self.cache_size > 0:
+            with self._cache_lock:
+                self._cache[cache_key] = (now + self.cache_ttl, payload)
+                self._cache.move_to_end(cache_key)
+                # Buang entri kedaluwarsa dan entri paling lama tidak dipakai agar cache tidak tumbuh terus
+                expired = [key for key, (expires, _) in self._cache.items() if expires <= now]
+                for key in expired:
+                    del self._cache[key]
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return payload
+    
+    def search_news(self, keywords: List[str], language: str = "id", page_size: int = 5,
+                    max_results: Optional[int] = None, since: Optional[str] = None) -> List[Dict]:
+        """
+        Search for news articles based on keywords.
+        
+        Args:
+            keywords: List of keywords to search for
+            language: Language of the articles (default is Indonesian)
+            page_size: Number of articles per page
+            max_results: Total result budget; further pages are fetched until it is
+                reached (defaults to a single page of ``page_size`` articles)
+            since: Only articles published at or after this ISO timestamp
+                
+        Returns:
+            List of news articles as dictionaries
+        """
+        query = self.normalize_query(keywords)
+        max_results = max_results or page_size
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        articles: List[Dict] = []
+        page = 1
         
-        response = requests.get(self.base_url, params=params)
+        try:
+            while len(articles) < max_results:
+                payload = self._get_page(query, language, page, page_size, since)
+                batch = payload.get("articles", [])
+                articles.extend(batch)
+                
+                # Berhenti jika halaman terakhir sudah tercapai
+                if len(batch) < page_size or len(articles) >= payload.get("totalResults", 0):
+                    break
+                page += 1
+        except requests.RequestException as e:
+            response = getattr(e, "response", None)
+            if response is not None:
+                self.last_error = f"Error fetching news: {response.status_code} - {response.text}"
+            else:
+                self.last_error = f"Error fetching news: {e}"
+            logger.error(self.last_error)
+        
+        # Simpan hasil ke arsip lokal agar pencarian berikutnya tidak perlu API
+        if self.archive is not None and articles:
+            self.archive.add_articles(articles)
+        
+        return articles[:max_results]
+    
+    def search_many(self, queries: List[List[str]], language: str = "id", page_size: int = 5,
+                    max_results: Optional[int] = None, since: Optional[str] = None) -> List[List[Dict]]:
+        """
+        Run several searches concurrently over the shared connection pool.
         
-        if response.status_code == 200:
-            articles = response.json().get("articles", [])
-            return articles
-        else:
-            st.error(f"Error fetching news: {response.status_code} - {response.text}")
+        Args:
+            queries: List of keyword lists, one per search
+            language: Language of the articles
+            page_size: Number of articles per page
+            max_results: Result budget per query
+            since: Only articles published at or after this ISO timestamp
+            
+        Returns:
+            List of article lists, in the same order as ``queries``
+        """
+        if not queries:
             return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as executor:
+            return list(executor.map(
+                lambda keywords: self.search_news(keywords, language, page_size, max_results, since),
+                queries
+            ))
     
-    def fetch_news(self, keywords: List[str], quotes: List[str], max_results: int = 5) -> List[Dict]:
+    def fetch_news(self, keywords: List[str], quotes: List[str], max_results: int = 5,
+                   max_quote_queries: int = 5, deduplicate: bool = False,
+                   since: Optional[str] = None) -> List[Dict]:
         """
         Fetch news articles based on keywords and quotes.
         
+        Only articles published since ``since`` are returned, both from the
+        archive and from NewsAPI. With an archive, the local index is searched
+        first and NewsAPI is only called when it returns fewer than
+        ``max_results`` recent articles (never without an API key). The keyword
+        query and exact-phrase queries for the first quotes are sent
+        concurrently and merged, dropping duplicate articles by URL.
+        
         Args:
             keywords: List of keywords to search for
             quotes: List of quotes to include in search
             max_results: Maximum number of articles to return
+            max_quote_queries: Maximum number of quotes searched as exact phrases
+            deduplicate: Collapse near-duplicate reprints to one article per story,
+                with "reach", "outlets" and "duplicates" (may return fewer articles)
+            since: ISO date or timestamp of the earliest article, typically the
+                release date (defaults to the last ``DEFAULT_WINDOW_DAYS`` days;
+                an empty string searches all dates)
             
         Returns:
             List of news articles as dictionaries
         """
+        self.last_error = None
+        if deduplicate:
+            from .near_duplicates import deduplicate_articles
+            articles = self.fetch_news(keywords, quotes, max_results, max_quote_queries, since=since)
+            return deduplicate_articles(articles)
+        
         # Filter out empty keywords
         valid_keywords = [kw for kw in keywords if kw and len(kw) > 2]
         
@@ -69,13 +239,43 @@ class NewsFinder:
         
         # If still no valid keywords, return empty result
         if not valid_keywords:
-            st.warning("Tidak ada kata kunci yang valid untuk pencarian berita.")
+            self.last_error = "Tidak ada kata kunci yang valid untuk pencarian berita."
+            logger.warning(self.last_error)
             return []
         
+        if since is None:
+            since = (datetime.now(timezone.utc) - timedelta(days=DEFAULT_WINDOW_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        
+        quotes = [quote for quote in quotes[:max_quote_queries] if quote.strip()]
+        local = []
+        if self.archive is not None:
+            local = self.archive.search(valid_keywords, quotes, limit=max_results, since=since)
+            if len(local) >= max_results or not self.api_key:
+                return local
+        
+        # Satu kueri kata kunci ditambah kueri frasa persis untuk kutipan
+        queries = [valid_keywords]
+        queries.extend([f'"{quote.strip()}"'] for quote in quotes)
+        
         # Search news with the valid keywords
         try:
-            articles = self.search_news(valid_keywords, page_size=max_results)
-            return articles
+            results = self.search_many(queries, page_size=min(max_results, MAX_PAGE_SIZE),
+                                       max_results=max_results, since=since)
         except Exception as e:
-            st.error(f"Error saat mencari berita: {str(e)}")
-            return []
+            self.last_error = f"Error saat mencari berita: {str(e)}"
+            logger.error(self.last_error)
+            return local
+        
+        # Hasil arsip diperingkat ulang setelah artikel baru masuk, lalu ditambah sisa hasil API
+        if self.archive is not None:
+            local = self.archive.search(valid_keywords, quotes, limit=max_results, since=since)
+        
+        articles = []
+        seen_urls = set()
+        for article in (article for batch in [local, *results] for article in batch):
+            url = article.get("url")
+            if url and url in seen_urls:
+                continue
+            seen_urls.add(url)
+            articles.append(article)
+        return articles[:max_results]
@@ -0,0 +1,222 @@
+"""
+Quote Tracker Module for Analisis Siaran Pers.
+Reports which media carried the quotes of a release. All quotes are compiled
+into one word-level Aho-Corasick automaton for exact pickups and an inverted
+index of word shingles for truncated or lightly edited pickups, so every
+article is scanned once regardless of the number of quotes.
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+from .near_duplicates import article_text
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split text into normalized words, ignoring case, punctuation and quote styles.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        (lowercased words, (start, end) character offsets of each word)
+    """
+    matches = list(WORD_PATTERN.finditer(text))
+    return [match.group().lower() for match in matches], [match.span() for match in matches]
+
+
+class WordAutomaton:
+    """Aho-Corasick automaton over word sequences."""
+
+    def __init__(self, patterns: Iterable[List[str]]):
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Word sequences; a pattern's id is its position
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self.lengths: List[int] = []
+
+        for pattern_id, words in enumerate(patterns):
+            self.lengths.append(len(words))
+            node = 0
+            for word in words:
+                child = self._goto[node].get(word)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][word] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = child
+            if words:
+                self._output[node].append(pattern_id)
+
+        # Tautan gagal dihitung per tingkat (BFS) dari akar
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for word, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, words: List[str]) -> Iterable[Tuple[int, int]]:
+        """
+        Find all pattern occurrences in one pass.
+
+        Args:
+            words: Word sequence to scan
+
+        Yields:
+            (start word index, pattern id) of each occurrence
+        """
+        node = 0
+        for position, word in enumerate(words):
+            while node and word not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(word, 0)
+            for pattern_id in self._output[node]:
+                yield position - self.lengths[pattern_id] + 1, pattern_id
+
+
+class QuotePickupMatcher:
+    """Matches the quotes of a release against many articles at once."""
+
+    def __init__(self, quotes: List[str], min_words: int = 4, shingle_size: int = 4,
+                 min_containment: float = 0.5):
+        """
+        Compile the quotes.
+
+        Args:
+            quotes: Quotes of the release
+            min_words: Quotes with fewer words are ignored (they match too often by chance)
+            shingle_size: Words per shingle in the fuzzy index
+            min_containment: Share of a quote's shingles an article must contain for a fuzzy hit
+        """
+        self.quotes = quotes
+        self.shingle_size = shingle_size
+        self.min_containment = min_containment
+
+        self._quote_ids: List[int] = []
+        patterns = []
+        for quote_id, quote in enumerate(quotes):
+            words = tokenize(quote)[0]
+            if len(words) >= min_words:
+                self._quote_ids.append(quote_id)
+                patterns.append(words)
+        self._automaton = WordAutomaton(patterns)
+
+        # Indeks terbalik shingle -> kutipan untuk pemuatan yang terpotong atau disunting
+        self._shingle_index: Dict[Tuple[str, ...], List[int]] = {}
+        self._shingle_counts: List[int] = []
+        for pattern_id, words in enumerate(patterns):
+            shingles = self._shingles(words)
+            self._shingle_counts.append(len(shingles))
+            for shingle in shingles:
+                self._shingle_index.setdefault(shingle, []).append(pattern_id)
+
+    def _shingles(self, words: List[str]) -> set:
+        size = self.shingle_size
+        return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+    def match(self, text: str) -> List[Dict]:
+        """
+        Find the quotes carried by one text.
+
+        Args:
+            text: Article text
+
+        Returns:
+            One hit per quote found: {"quote_index", "quote", "match" ("exact" or
+            "fuzzy"), "score" (share of the quote found), "start", "end"}
+        """
+        words, spans = tokenize(text)
+        hits: Dict[int, Dict] = {}
+
+        for start, pattern_id in self._automaton.find(words):
+            if pattern_id not in hits:
+                end = start + self._automaton.lengths[pattern_id] - 1
+                hits[pattern_id] = {"match": "exact", "score": 1.0, "start": spans[start][0], "end": spans[end][1]}
+
+        # Posisi pertama setiap shingle artikel; setiap shingle dicari sekali di indeks
+        size = self.shingle_size
+        positions: Dict[Tuple[str, ...], int] = {}
+        for i in range(len(words) - size + 1):
+            positions.setdefault(tuple(words[i:i + size]), i)
+
+        found: Dict[int, List[int]] = {}
+        for shingle, position in positions.items():
+            for pattern_id in self._shingle_index.get(shingle, ()):
+                if pattern_id not in hits:
+                    found.setdefault(pattern_id, []).append(position)
+
+        for pattern_id, starts in found.items():
+            score = len(starts) / self._shingle_counts[pattern_id]
+            if score >= self.min_containment:
+                hits[pattern_id] = {"match": "fuzzy", "score": score, "start": spans[min(starts)][0],
+                                    "end": spans[max(starts) + size - 1][1]}
+
+        return [
+            {"quote_index": self._quote_ids[pattern_id], "quote": self.quotes[self._quote_ids[pattern_id]], **hit}
+            for pattern_id, hit in sorted(hits.items())
+        ]
+
+    def scan(self, articles: Iterable[Dict]) -> List[Dict]:
+        """
+        Match every article once against all quotes.
+
+        Args:
+            articles: Articles in the NewsAPI layout
+
+        Returns:
+            Hits as returned by ``match``, each with the article's "url", "title", "outlet"
+            and "published_at"
+        """
+        hits = []
+        for article in articles:
+            source = article.get("source")
+            outlet = source.get("name") if isinstance(source, dict) else source
+            for hit in self.match(article_text(article)):
+                hit.update(url=article.get("url"), title=article.get("title"), outlet=outlet,
+                           published_at=article.get("publishedAt"))
+                hits.append(hit)
+        return hits
+
+
+def track_quote_pickup(quotes: List[str], articles: Iterable[Dict], min_words: int = 4,
+                       min_containment: float = 0.5) -> List[Dict]:
+    """
+    Report which outlets carried each quote of a release.
+
+    Args:
+        quotes: Quotes of the release (e.g. the "quote" values of ``extract_quotes``)
+        articles: Articles in the NewsAPI layout
+        min_words: Quotes with fewer words are not tracked
+        min_containment: Share of a quote an article must contain for a fuzzy hit
+
+    Returns:
+        One entry per quote, in release order: {"quote", "outlets" (distinct
+        outlet names), "exact" (number of exact pickups), "fuzzy" (number of
+        partial pickups), "hits" (article hits)}
+    """
+    matcher = QuotePickupMatcher(quotes, min_words=min_words, min_containment=min_containment)
+    report = [{"quote": quote, "outlets": [], "exact": 0, "fuzzy": 0, "hits": []} for quote in quotes]
+    for hit in matcher.scan(articles):
+        entry = report[hit["quote_index"]]
+        entry["hits"].append(hit)
+        entry[hit["match"]] += 1
+        if hit["outlet"] and hit["outlet"] not in entry["outlets"]:
+            entry["outlets"].append(hit["outlet"])
+    return report
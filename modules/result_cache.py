@@ -0,0 +1,284 @@
+"""
+Result Cache Module for Analisis Siaran Pers.
+Content-addressed cache for extraction and analysis results with an
+in-memory LRU tier and a size-bounded on-disk tier shared across processes.
+Disk entries are JSON, so a planted cache file can never execute code.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Cache per pengguna, bukan folder temp bersama yang bisa dibuat lebih dulu oleh pengguna lain
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "analisis-siaran-pers"
+)
+
+ENTRY_SUFFIX = ".json"
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+_shared_cache: Optional["ResultCache"] = None
+_shared_lock = threading.Lock()
+
+
+def content_key(content, *parts: Any) -> str:
+    """
+    Build a cache key from document content and the parameters that produced a result.
+
+    Args:
+        content: Bytes-like object, str, or binary file object (hashed in chunks)
+        *parts: JSON-serializable values such as stage name, version and parameters
+
+    Returns:
+        Hex BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(content, str):
+        digest.update(content.encode("utf-8"))
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        digest.update(content)
+    else:
+        content.seek(0)
+        for chunk in iter(lambda: content.read(1024 * 1024), b""):
+            digest.update(chunk)
+        content.seek(0)
+    digest.update(json.dumps(parts, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _private_directory(directory: str) -> bool:
+    """
+    Create a cache folder readable only by the current user, or check an existing one.
+
+    Args:
+        directory: Folder path
+
+    Returns:
+        True if the folder belongs to the current user and no one else can write to it
+    """
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        info = os.stat(directory)
+    except OSError:
+        return False
+    if not hasattr(os, "getuid"):
+        return True
+    return info.st_uid == os.getuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class ResultCache:
+    """Two-tier (memory LRU + disk) cache of JSON-serializable results keyed by content hash."""
+
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIR, memory_items: int = 64,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Folder for the disk tier, or None to keep results in memory only.
+                The disk tier is disabled if the folder belongs to another user or
+                is writable by others.
+            memory_items: Maximum number of results kept in the memory tier
+            max_disk_bytes: Size limit of the disk tier; oldest entries are evicted first
+        """
+        self.directory = directory
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory and not _private_directory(directory):
+            logger.warning("Cache disk %s dinonaktifkan: folder milik pengguna lain atau dapat ditulis "
+                           "pengguna lain", directory)
+            self.directory = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{ENTRY_SUFFIX}")
+
+    def _remember(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a result.
+
+        Args:
+            key: Key from ``content_key``
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or ``default``
+        """
+        with self._lock:
+            value = self._memory.get(key, _MISSING)
+            if value is not _MISSING:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    value = json.load(handle)
+                # Perbarui waktu akses agar entri yang sering dipakai tidak tergusur
+                os.utime(path)
+            except (OSError, ValueError):
+                value = _MISSING
+            if value is not _MISSING:
+                self._remember(key, value)
+                with self._lock:
+                    self.disk_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a result in both tiers.
+
+        Values that cannot be encoded as JSON are kept in the memory tier only.
+        Tuples are stored as lists, so a disk hit returns lists.
+        """
+        self._remember(key, value)
+        if not self.directory:
+            return
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # Tulis ke file sementara lalu ganti nama agar proses lain tidak membaca file setengah jadi
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       should_cache: Callable[[Any], bool] = bool) -> Any:
+        """
+        Return the cached result for a key, computing and storing it on a miss.
+
+        Args:
+            key: Key from ``content_key``
+            compute: Function producing the result
+            should_cache: Predicate deciding whether a computed result is stored
+
+        Returns:
+            Cached or freshly computed result
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            if should_cache(value):
+                self.put(key, value)
+        return value
+
+    def _evict(self) -> None:
+        """Delete the least recently used files until the disk tier fits its size limit."""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(ENTRY_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total <= self.max_disk_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters."""
+        with self._lock:
+            return {
+                "memory_items": len(self._memory),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+    def discard(self, key: Optional[str]) -> None:
+        """Remove a single result from both tiers, if present."""
+        if not key:
+            return
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove all cached results from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.directory:
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if name.endswith(ENTRY_SUFFIX):
+                        os.remove(os.path.join(root, name))
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Return the process-wide result cache.
+
+    The disk tier lives in ANALISIS_CACHE_DIR (default: a folder in the
+    user's cache directory, created with mode 0700) and is limited to
+    ANALISIS_CACHE_MAX_MB megabytes. Set ANALISIS_CACHE_DIR to an empty
+    string to disable the disk tier.
+
+    Returns:
+        Shared ResultCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = ResultCache(
+                    directory=os.environ.get("ANALISIS_CACHE_DIR", DEFAULT_CACHE_DIR) or None,
+                    max_disk_bytes=int(os.environ.get("ANALISIS_CACHE_MAX_MB", "512")) * 1024 * 1024
+                )
+    return _shared_cache
@@ -0,0 +1,243 @@
+"""
+Sentiment Analyzer Module for Analisis Siaran Pers.
+Scores the sentiment of Indonesian news articles and quote contexts with a
+transformer model, batching inputs of similar length on CPU.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Model klasifikasi sentimen Bahasa Indonesia (positive / neutral / negative)
+DEFAULT_MODEL = "w11wo/indonesian-roberta-base-sentiment-classifier"
+
+# Model dimuat sekali per proses dan dipakai bersama oleh semua instance
+_models: Dict[Tuple[str, str, bool], Tuple[object, object]] = {}
+_models_lock = threading.Lock()
+
+_shared_analyzer: Optional["SentimentAnalyzer"] = None
+_shared_lock = threading.Lock()
+
+
+def _load_model(model_name: str, backend: str, quantize: bool) -> Tuple[object, object]:
+    """
+    Load (or reuse) a tokenizer and model for the given configuration.
+
+    Args:
+        model_name: Hugging Face model name or local path
+        backend: "torch" or "onnx"
+        quantize: Apply dynamic int8 quantization (torch) or load a quantized ONNX export
+
+    Returns:
+        Tuple of (tokenizer, model)
+    """
+    key = (model_name, backend, quantize)
+    with _models_lock:
+        if key in _models:
+            return _models[key]
+
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        if backend == "onnx":
+            try:
+                from optimum.onnxruntime import ORTModelForSequenceClassification
+            except ImportError as e:
+                raise ImportError(
+                    "Backend ONNX membutuhkan paket 'optimum[onnxruntime]'."
+                ) from e
+            model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            if quantize:
+                from optimum.onnxruntime import ORTQuantizer
+                from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+                quantized_dir = tempfile.mkdtemp(prefix="sentiment-int8-")
+                quantizer = ORTQuantizer.from_pretrained(model)
+                quantizer.quantize(
+                    save_dir=quantized_dir,
+                    quantization_config=AutoQuantizationConfig.avx2(is_static=False)
+                )
+                model = ORTModelForSequenceClassification.from_pretrained(quantized_dir)
+        elif backend == "torch":
+            import torch
+            from transformers import AutoModelForSequenceClassification
+            model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            model.eval()
+            if quantize:
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        else:
+            raise ValueError(f"Backend tidak dikenal: {backend}")
+
+        _models[key] = (tokenizer, model)
+        return tokenizer, model
+
+
+class SentimentAnalyzer:
+    """Class to handle batched sentiment scoring of Indonesian text."""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, backend: str = "torch", quantize: bool = False,
+                 batch_size: int = 32, max_length: int = 256, cache_size: int = 10000):
+        """
+        Initialize the analyzer. The model is loaded lazily on first use.
+
+        Args:
+            model_name: Hugging Face model name or local path
+            backend: "torch" (default) or "onnx" (requires optimum[onnxruntime])
+            quantize: Use an int8-quantized model for faster CPU inference
+            batch_size: Number of texts per inference batch
+            max_length: Maximum tokens per text; longer texts are truncated
+            cache_size: Maximum number of results kept in the text-hash cache
+        """
+        self.model_name = model_name
+        self.backend = backend
+        self.quantize = quantize
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _text_key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _predict(self, texts: List[str]) -> List[Dict]:
+        """
+        Run the model over texts in length-sorted, dynamically padded batches.
+
+        Args:
+            texts: Texts to score (no cache lookup)
+
+        Returns:
+            Sentiment dictionaries in the same order as ``texts``
+        """
+        tokenizer, model = _load_model(self.model_name, self.backend, self.quantize)
+        id2label = model.config.id2label
+
+        # Tokenisasi tanpa padding, lalu urutkan menurut panjang agar padding minimal
+        encoded = tokenizer(texts, truncation=True, max_length=self.max_length)
+        order = sorted(range(len(texts)), key=lambda i: len(encoded["input_ids"][i]))
+        results: List[Optional[Dict]] = [None] * len(texts)
+
+        import torch
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                indices = order[start:start + self.batch_size]
+                batch = tokenizer.pad(
+                    {name: [values[i] for i in indices] for name, values in encoded.items()},
+                    return_tensors="pt"
+                )
+                logits = model(**batch).logits
+                probabilities = torch.softmax(logits, dim=-1).tolist()
+
+                for i, probs in zip(indices, probabilities):
+                    scores = {id2label[label_id].lower(): prob for label_id, prob in enumerate(probs)}
+                    label = max(scores, key=scores.get)
+                    results[i] = {"label": label, "score": scores[label], "scores": scores}
+
+        return results
+
+    def analyze(self, texts: List[str]) -> List[Dict]:
+        """
+        Score the sentiment of several texts.
+
+        Results are cached by text hash, so repeated texts (e.g. syndicated
+        articles or re-analyzed quotes) are only scored once.
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            List of dictionaries with "label", "score" and per-label "scores"
+        """
+        keys = [self._text_key(text) for text in texts]
+        results: Dict[str, Dict] = {}
+        pending: Dict[str, str] = {}
+
+        with self._cache_lock:
+            for key, text in zip(keys, texts):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    results[key] = cached
+                elif text.strip():
+                    pending[key] = text
+
+        if pending:
+            predictions = self._predict(list(pending.values()))
+            with self._cache_lock:
+                for key, prediction in zip(pending, predictions):
+                    results[key] = prediction
+                    self._cache[key] = prediction
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        neutral = {"label": "neutral", "score": 0.0, "scores": {}}
+        return [results.get(key, neutral) for key in keys]
+
+    def analyze_text(self, text: str) -> Dict:
+        """Score the sentiment of a single text."""
+        return self.analyze([text])[0]
+
+    def analyze_articles(self, articles: List[Dict], deduplicate: bool = False) -> List[Dict]:
+        """
+        Add a "sentiment" entry to news articles (as returned by NewsFinder).
+
+        Args:
+            articles: Article dictionaries with "title" and "description"
+            deduplicate: Collapse syndicated near-duplicates first and score one
+                representative per story (with "reach", "outlets" and "duplicates")
+
+        Returns:
+            The same articles with sentiment added, or the scored representatives
+        """
+        if deduplicate:
+            from .near_duplicates import deduplicate_articles
+            articles = deduplicate_articles(articles)
+        texts = [
+            ". ".join(part for part in (article.get("title"), article.get("description")) if part)
+            for article in articles
+        ]
+        for article, sentiment in zip(articles, self.analyze(texts)):
+            article["sentiment"] = sentiment
+        return articles
+
+    def analyze_quotes(self, quotes: List[Dict]) -> List[Dict]:
+        """
+        Add a "sentiment" entry to quotes (as returned by KeywordExtractor.extract_quotes).
+
+        Args:
+            quotes: Quote dictionaries with "quote" and "context"
+
+        Returns:
+            The same quotes with sentiment of their context added
+        """
+        texts = [quote.get("context") or quote.get("quote", "") for quote in quotes]
+        for quote, sentiment in zip(quotes, self.analyze(texts)):
+            quote["sentiment"] = sentiment
+        return quotes
+
+
+def get_shared_sentiment_analyzer() -> SentimentAnalyzer:
+    """
+    Return the process-wide SentimentAnalyzer.
+
+    Configuration is read from the environment: ANALISIS_SENTIMENT_MODEL,
+    ANALISIS_SENTIMENT_BACKEND ("torch" or "onnx") and ANALISIS_SENTIMENT_INT8.
+
+    Returns:
+        Shared SentimentAnalyzer instance
+    """
+    global _shared_analyzer
+    if _shared_analyzer is None:
+        with _shared_lock:
+            if _shared_analyzer is None:
+                _shared_analyzer = SentimentAnalyzer(
+                    model_name=os.environ.get("ANALISIS_SENTIMENT_MODEL", DEFAULT_MODEL),
+                    backend=os.environ.get("ANALISIS_SENTIMENT_BACKEND", "torch"),
+                    quantize=os.environ.get("ANALISIS_SENTIMENT_INT8", "0") == "1"
+                )
+    return _shared_analyzer
@@ -0,0 +1,187 @@
+"""
+Analysis Server Module for Analisis Siaran Pers.
+Small HTTP worker service over the headless analysis API. Each instance runs
+a pool of warmed worker processes; run several instances behind a load
+balancer to scale horizontally.
+
+Endpoints:
+    GET  /health                      -> {"status": "ok", ...}
+    GET  /metrics                     -> stage timings and counters (Prometheus text format)
+    POST /analyze?filename=<name>     -> body is the raw document bytes
+    POST /analyze/text                -> body is {"text": "..."} as JSON
+
+Both POST endpoints accept an optional keyword method ("tfidf" or
+"embedding"): ``&method=`` on /analyze, ``"method"`` in the JSON body of
+/analyze/text.
+
+Usage:
+    python -m modules.server --host 0.0.0.0 --port 8600 --workers 4
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from .analysis_service import analyze_document, analyze_text, init_worker
+from .document_processor import MAX_UPLOAD_MB
+from .instrumentation import registry
+
+logger = logging.getLogger(__name__)
+
+# Ukuran maksimum body permintaan (byte), dari batas unggahan yang sama; 0 = tanpa batas
+MAX_BODY_BYTES = int(MAX_UPLOAD_MB * 1024 * 1024)
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """HTTP server that dispatches analysis jobs to a bounded process pool."""
+
+    daemon_threads = True
+
+    def __init__(self, address, workers: Optional[int] = None, max_queue: Optional[int] = None):
+        """
+        Initialize the server.
+
+        Args:
+            address: (host, port) to bind
+            workers: Number of analysis worker processes (defaults to the CPU count)
+            max_queue: Maximum queued plus running jobs before answering 503
+        """
+        super().__init__(address, AnalysisRequestHandler)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue or self.workers * 4
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        self.slots = threading.BoundedSemaphore(self.max_queue)
+        self.active = 0
+        self._active_lock = threading.Lock()
+
+    def submit(self, fn, *args) -> Optional[Dict]:
+        """
+        Run a job in the worker pool, or return None if the queue is full.
+
+        A full queue is reported as 503 so the load balancer can retry on
+        another instance instead of piling work onto this one.
+        """
+        if not self.slots.acquire(blocking=False):
+            return None
+        with self._active_lock:
+            self.active += 1
+        try:
+            result = self.executor.submit(fn, *args).result()
+            # Profil dihitung di proses worker; kumpulkan totalnya di proses server
+            registry.record(result.get("profile", {}))
+            return result
+        finally:
+            with self._active_lock:
+                self.active -= 1
+            self.slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for the analysis endpoints."""
+
+    server: AnalysisServer
+
+    def _send_json(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> Optional[bytes]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_json(400, {"status": "error", "error": "Body permintaan kosong."})
+            return None
+        if MAX_BODY_BYTES and length > MAX_BODY_BYTES:
+            self._send_json(413, {"status": "error", "error": "Dokumen melebihi batas ukuran."})
+            return None
+        return self.rfile.read(length)
+
+    def _send_result(self, result: Optional[Dict]) -> None:
+        if result is None:
+            self._send_json(503, {"status": "error", "error": "Server sedang penuh, coba lagi."})
+        else:
+            self._send_json(200 if result["status"] == "ok" else 422, result)
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path == "/health":
+            self._send_json(200, {
+                "status": "ok",
+                "workers": self.server.workers,
+                "active": self.server.active,
+                "max_queue": self.server.max_queue
+            })
+        elif urlparse(self.path).path == "/metrics":
+            body = registry.render_prometheus({"active_jobs": self.server.active}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json(404, {"status": "error", "error": "Endpoint tidak ditemukan."})
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/analyze":
+            query = parse_qs(url.query)
+            filename = query.get("filename", [""])[0]
+            method = query.get("method", [None])[0]
+            if not filename:
+                self._send_json(400, {"status": "error", "error": "Parameter filename wajib diisi."})
+                return
+            content = self._read_body()
+            if content is not None:
+                self._send_result(self.server.submit(analyze_document, filename, content, True, False, method))
+        elif url.path == "/analyze/text":
+            body = self._read_body()
+            if body is None:
+                return
+            try:
+                payload = json.loads(body.decode("utf-8"))
+                text = payload["text"]
+                method = payload.get("method")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                self._send_json(400, {"status": "error", "error": "Body harus berupa JSON {\"text\": ...}."})
+                return
+            self._send_result(self.server.submit(analyze_text, text, True, method))
+        else:
+            self._send_json(404, {"status": "error", "error": "Endpoint tidak ditemukan."})
+
+    def log_message(self, format: str, *args) -> None:
+        logger.info("%s - %s", self.address_string(), format % args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Layanan HTTP analisis siaran pers")
+    parser.add_argument("--host", default="127.0.0.1", help="Alamat yang didengarkan")
+    parser.add_argument("--port", type=int, default=8600, help="Port yang didengarkan")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker")
+    parser.add_argument("--max-queue", type=int, default=None, help="Batas pekerjaan dalam antrean")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    server = AnalysisServer((args.host, args.port), workers=args.workers, max_queue=args.max_queue)
+    logger.info("Mendengarkan di http://%s:%s dengan %s worker", args.host, args.port, server.workers)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Stemming Cache Module for Analisis Siaran Pers.
+Provides a memoizing layer in front of the Sastrawi stemmer and an optional
+SQLite-backed stem table that can be pre-built from a corpus.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+# Token yang sama dengan hasil preprocess_text (huruf kecil, tanpa angka/tanda baca)
+TOKEN_PATTERN = re.compile(r"[^\W\d_]{3,}")
+
+
+class StemTable:
+    """Persistent word -> stem table stored in SQLite."""
+
+    def __init__(self, path: str, read_only: bool = False):
+        """
+        Open (or create) a stem table.
+
+        Args:
+            path: Path to the SQLite database file
+            read_only: Open the table read-only so many worker processes can share it
+        """
+        self.path = path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the current process."""
+        # Koneksi SQLite tidak boleh dipakai lintas proses setelah fork
+        if self._conn is None or self._pid != os.getpid():
+            if self.read_only:
+                conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            else:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS stems (word TEXT PRIMARY KEY, stem TEXT NOT NULL)")
+                conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, word: str) -> Optional[str]:
+        """Look up the stored stem of a word, or None if it is not in the table."""
+        with self._lock:
+            row = self._connection().execute("SELECT stem FROM stems WHERE word = ?", (word,)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        """Insert or replace several word -> stem pairs."""
+        if self.read_only or not items:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO stems (word, stem) VALUES (?, ?)", items.items())
+            conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM stems").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @classmethod
+    def build(cls, path: str, texts: Iterable[str], stemmer, batch_size: int = 5000) -> "StemTable":
+        """
+        Pre-build a stem table from a corpus of texts.
+
+        Args:
+            path: Path to the SQLite database file to create or extend
+            texts: Iterable of raw documents
+            stemmer: Object with a ``stem(word)`` method (e.g. Sastrawi stemmer)
+            batch_size: Number of new words to stem before writing to disk
+
+        Returns:
+            The populated StemTable
+        """
+        table = cls(path)
+        seen = set()
+        pending: Dict[str, str] = {}
+        for text in texts:
+            for word in TOKEN_PATTERN.findall(text.lower()):
+                if word in seen:
+                    continue
+                seen.add(word)
+                pending[word] = stemmer.stem(word)
+                if len(pending) >= batch_size:
+                    table.put_many(pending)
+                    pending = {}
+        table.put_many(pending)
+        return table
+
+
+class CachedStemmer:
+    """Bounded LRU cache in front of a stemmer, optionally backed by a StemTable."""
+
+    def __init__(self, stemmer, capacity: int = 50000, table: Optional[StemTable] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            stemmer: Object with a ``stem(word)`` method
+            capacity: Maximum number of entries kept in memory
+            table: Optional persistent stem table consulted before the stemmer
+        """
+        self.stemmer = stemmer
+        self.capacity = capacity
+        self.table = table
+        self.hits = 0
+        self.misses = 0
+        self.table_hits = 0
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stem(self, word: str) -> str:
+        """
+        Return the stem of a word, using the cache when possible.
+
+        Args:
+            word: Word to stem
+
+        Returns:
+            Stemmed word
+        """
+        with self._lock:
+            stem = self._cache.get(word)
+            if stem is not None:
+                self._cache.move_to_end(word)
+                self.hits += 1
+                return stem
+            self.misses += 1
+
+        stem = self.table.get(word) if self.table is not None else None
+        if stem is not None:
+            self.table_hits += 1
+        else:
+            stem = self.stemmer.stem(word)
+
+        with self._lock:
+            self._cache[word] = stem
+            if len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+        return stem
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "table_hits": self.table_hits,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.table_hits = 0
+
+
+# Membangun tabel stem dari folder korpus: python -m modules.stemming <folder> <tabel.sqlite>
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+    if len(sys.argv) != 3:
+        print("Penggunaan: python -m modules.stemming <folder_korpus> <tabel.sqlite>")
+        sys.exit(1)
+
+    corpus_dir, table_path = sys.argv[1], sys.argv[2]
+    files = sorted(Path(corpus_dir).rglob("*.txt"))
+    corpus = (path.read_text(encoding="utf-8", errors="replace") for path in files)
+    built = StemTable.build(table_path, corpus, StemmerFactory().create_stemmer())
+    print(f"{len(built)} kata tersimpan di {table_path} dari {len(files)} dokumen")
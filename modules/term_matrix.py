@@ -0,0 +1,163 @@
+"""
+Term Matrix Module for Analisis Siaran Pers.
+Sparse sentence-term count matrix shared by keyword ranking and key phrase
+selection, with vectorized TF-IDF scoring and a LexRank sentence ranker.
+"""
+
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+
+class TermMatrix:
+    """Sparse sentence-by-term count matrix and its (alphabetical) vocabulary."""
+
+    def __init__(self, matrix, terms: List[str]):
+        """
+        Initialize the matrix. Use ``TermMatrix.from_counts`` to build one.
+
+        Args:
+            matrix: scipy.sparse CSR matrix of term counts, one row per sentence
+            terms: Term of each column, sorted alphabetically
+        """
+        self.matrix = matrix
+        self.terms = terms
+        self.index = {term: column for column, term in enumerate(terms)}
+
+    @classmethod
+    def from_counts(cls, counts: List[Counter]) -> "TermMatrix":
+        """
+        Build the matrix from per-sentence term counts.
+
+        Args:
+            counts: Term counts of each sentence
+
+        Returns:
+            TermMatrix
+        """
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        terms = sorted(set().union(*counts)) if counts else []
+        index = {term: column for column, term in enumerate(terms)}
+        indptr = [0]
+        indices: List[int] = []
+        data: List[int] = []
+        for sentence_counts in counts:
+            indices.extend(index[term] for term in sentence_counts)
+            data.extend(sentence_counts.values())
+            indptr.append(len(indices))
+        matrix = csr_matrix(
+            (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(counts), len(terms))
+        )
+        return cls(matrix, terms)
+
+    @staticmethod
+    def _tfidf(matrix):
+        """Return the smoothed-idf, L2-normalized TF-IDF weights of a count matrix."""
+        import numpy as np
+        from scipy.sparse import diags
+
+        n_docs = matrix.shape[0]
+        doc_freq = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+        weighted = matrix @ diags(idf)
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return (diags(1.0 / norms) @ weighted).tocsr()
+
+    def rank_tfidf(self, num_keywords: int) -> List[Tuple[str, float]]:
+        """
+        Rank terms by their mean TF-IDF weight over the sentences.
+
+        Mirrors scikit-learn's TfidfVectorizer defaults: the vocabulary is
+        limited to the ``2 * num_keywords`` most frequent terms, idf is smoothed
+        (``ln((1 + n) / (1 + df)) + 1``) and each sentence vector is
+        L2-normalized. Ties are broken alphabetically.
+
+        Args:
+            num_keywords: Number of keywords to return
+
+        Returns:
+            List of (keyword, score) tuples, highest score first
+        """
+        import numpy as np
+
+        n_docs, n_terms = self.matrix.shape
+        if not n_docs or not n_terms:
+            return []
+
+        # Kosakata: istilah paling sering; kolom sudah urut abjad sehingga menjadi pemecah seri
+        totals = np.asarray(self.matrix.sum(axis=0)).ravel()
+        columns = np.lexsort((np.arange(n_terms), -totals))[:num_keywords * 2]
+        weights = self._tfidf(self.matrix[:, columns].tocsr())
+        scores = np.asarray(weights.sum(axis=0)).ravel() / n_docs
+
+        ranked = np.lexsort((columns, -np.round(scores, 12)))[:num_keywords]
+        return [(self.terms[columns[i]], float(scores[i])) for i in ranked]
+
+    def presence_scores(self, terms: Iterable[str]):
+        """
+        Count how many of the given terms occur (as whole tokens) in each sentence.
+
+        Args:
+            terms: Terms to look for
+
+        Returns:
+            numpy array with one score per sentence
+        """
+        import numpy as np
+
+        weights = np.zeros(len(self.terms))
+        for term in terms:
+            column = self.index.get(term)
+            if column is not None:
+                weights[column] = 1.0
+        return self.matrix.sign() @ weights
+
+    def lexrank_scores(self, exclude: Iterable[str] = (), threshold: float = 0.1, damping: float = 0.85,
+                       max_iterations: int = 100, tolerance: float = 1e-6):
+        """
+        Score sentences by LexRank centrality over their TF-IDF cosine similarity graph.
+
+        Args:
+            exclude: Terms ignored when comparing sentences (e.g. stopwords)
+            threshold: Minimum cosine similarity for an edge
+            damping: PageRank damping factor
+            max_iterations: Maximum power-iteration steps
+            tolerance: L1 change at which the iteration stops
+
+        Returns:
+            numpy array with one score per sentence
+        """
+        import numpy as np
+        from scipy.sparse import diags
+
+        n_docs = self.matrix.shape[0]
+        if n_docs == 0:
+            return np.zeros(0)
+
+        excluded = set(exclude)
+        columns = [column for column, term in enumerate(self.terms) if term not in excluded]
+        vectors = self._tfidf(self.matrix[:, columns].tocsr())
+
+        # Graf kemiripan kosinus tanpa sisi ke diri sendiri dan sisi di bawah ambang
+        similarity = (vectors @ vectors.T).tocsr()
+        similarity = similarity - diags(similarity.diagonal())
+        similarity.data[similarity.data < threshold] = 0
+        similarity.eliminate_zeros()
+
+        degree = np.asarray(similarity.sum(axis=1)).ravel()
+        dangling = degree == 0
+        degree[dangling] = 1.0
+        transition = (diags(1.0 / degree) @ similarity).T.tocsr()
+
+        scores = np.full(n_docs, 1.0 / n_docs)
+        for _ in range(max_iterations):
+            # Kalimat tanpa tetangga membagi bobotnya rata ke semua kalimat
+            updated = (1 - damping) / n_docs + damping * (transition @ scores + scores[dangling].sum() / n_docs)
+            converged = np.abs(updated - scores).sum() < tolerance
+            scores = updated
+            if converged:
+                break
+        return scores
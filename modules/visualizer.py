@@ -0,0 +1,454 @@
+"""
+Visualizer Module for Analisis Siaran Pers.
+Pre-aggregated metrics for the report dashboard: keyword frequencies per
+day, article sentiment per outlet and day, and quote pickups per day are
+rolled up incrementally as results arrive and kept as columnar tables.
+Figures are built from these rollups, cached by the hash of their input and
+downsampled for long time ranges, so a rerun never touches raw results.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_shared_visualizer: Optional["Visualizer"] = None
+_shared_lock = threading.Lock()
+
+# Jumlah file bagian per rollup sebelum digabung kembali menjadi satu file
+COMPACT_PARTS = 32
+
+
+class Rollup:
+    """Columnar table of additive measures keyed by dimension columns, updated in place."""
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[str, ...]):
+        """
+        Initialize an empty rollup.
+
+        Args:
+            keys: Dimension columns, e.g. ("day", "keyword")
+            values: Additive measure columns, e.g. ("count",)
+        """
+        self.keys = keys
+        self.values = values
+        self.columns: Dict[str, List] = {name: [] for name in keys + values}
+        self._rows: Dict[Tuple, int] = {}
+        self.version = 0
+        # Keadaan terakhir yang tersimpan ke disk, agar penyimpanan hanya menulis perubahan
+        self.saved_version = 0
+        self.saved_rows = 0
+        self.saved_rows_changed = False
+        self._frame = None
+        self._frame_version = -1
+
+    def add(self, key: Tuple, *amounts: float) -> None:
+        """
+        Add measures to the row of a key, creating the row if needed.
+
+        Args:
+            key: Values of the dimension columns
+            *amounts: Amount added to each measure column
+        """
+        row = self._rows.get(key)
+        if row is None:
+            self._rows[key] = len(self._rows)
+            for name, value in zip(self.keys, key):
+                self.columns[name].append(value)
+            for name, amount in zip(self.values, amounts):
+                self.columns[name].append(amount)
+        else:
+            for name, amount in zip(self.values, amounts):
+                self.columns[name][row] += amount
+            if row < self.saved_rows:
+                self.saved_rows_changed = True
+        self.version += 1
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def frame(self):
+        """Return the rollup as a pandas DataFrame (rebuilt only after changes), "day" parsed as dates."""
+        import pandas as pd
+
+        if self._frame_version != self.version:
+            frame = pd.DataFrame(self.columns, columns=list(self.keys + self.values))
+            if "day" in frame:
+                frame["day"] = pd.to_datetime(frame["day"])
+            self._frame = frame
+            self._frame_version = self.version
+        return self._frame
+
+    def to_arrow(self, start: int = 0):
+        """Return the rollup, from row ``start`` on, as a pyarrow Table."""
+        import pyarrow as pa
+        return pa.table({name: self.columns[name][start:] for name in self.keys + self.values})
+
+    def load_arrow(self, *tables) -> None:
+        """Replace the contents with tables written by ``to_arrow``, concatenated in order."""
+        self.columns = {name: [value for table in tables for value in table.column(name).to_pylist()]
+                        for name in self.keys + self.values}
+        self._rows = {key: row for row, key in enumerate(zip(*(self.columns[name] for name in self.keys)))}
+        self.version += 1
+
+
+def _day(timestamp: Optional[str]) -> str:
+    """Return the ISO day of an ISO timestamp, or today if it is missing."""
+    return timestamp[:10] if timestamp else date.today().isoformat()
+
+
+class MetricsStore:
+    """Incrementally maintained rollups behind the report dashboard."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the store, loading saved rollups if present.
+
+        Args:
+            directory: Folder for the Parquet files of the rollups (None keeps them in memory only)
+        """
+        self.directory = directory
+        self.keywords = Rollup(("day", "keyword"), ("count", "score"))
+        self.sentiment = Rollup(("day", "outlet", "label"), ("articles", "reach"))
+        self.quotes = Rollup(("day", "quote"), ("exact", "fuzzy"))
+        self.ingested = Rollup(("kind", "id"), ("times",))
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        if directory and os.path.isdir(directory):
+            self._load()
+
+    @property
+    def rollups(self) -> Dict[str, Rollup]:
+        return {"keywords": self.keywords, "sentiment": self.sentiment, "quotes": self.quotes,
+                "ingested": self.ingested}
+
+    def _claim(self, kind: str, item_id: str) -> bool:
+        """Record an input as ingested; False if it was already counted."""
+        if (kind, item_id) in self.ingested._rows:
+            return False
+        self.ingested.add((kind, item_id), 1)
+        return True
+
+    def add_release(self, release_id: str, analysis: Dict, day: Optional[str] = None) -> bool:
+        """
+        Count the keywords of an analyzed release.
+
+        Args:
+            release_id: Stable id of the release (e.g. its analysis key); repeats are ignored
+            analysis: Result of ``analyze_text``
+            day: ISO day of the release (defaults to today)
+
+        Returns:
+            True if the release was added
+        """
+        with self._lock:
+            if not self._claim("release", release_id):
+                return False
+            day = day or _day(None)
+            for keyword, score in analysis.get("keywords", []):
+                self.keywords.add((day, keyword), 1, float(score))
+        self._save()
+        return True
+
+    def add_articles(self, articles: Iterable[Dict]) -> int:
+        """
+        Count scored articles per day, outlet and sentiment label.
+
+        Articles without a "sentiment" entry or already counted (by URL) are skipped.
+
+        Args:
+            articles: Articles in the NewsAPI layout with "sentiment", optionally with "reach"
+
+        Returns:
+            Number of articles added
+        """
+        added = 0
+        with self._lock:
+            for article in articles:
+                sentiment = article.get("sentiment")
+                if not sentiment or not self._claim("article", article.get("url") or article.get("title", "")):
+                    continue
+                source = article.get("source")
+                outlet = (source.get("name") if isinstance(source, dict) else source) or "Tidak diketahui"
+                self.sentiment.add((_day(article.get("publishedAt")), outlet, sentiment["label"]),
+                                   1, article.get("reach", 1))
+                added += 1
+        if added:
+            self._save()
+        return added
+
+    def add_quote_hits(self, hits: Iterable[Dict]) -> int:
+        """
+        Count quote pickups per day.
+
+        Args:
+            hits: Hits from ``QuotePickupMatcher.scan``; repeats of a (url, quote) pair are skipped
+
+        Returns:
+            Number of hits added
+        """
+        added = 0
+        with self._lock:
+            for hit in hits:
+                if not self._claim("quote", f"{hit.get('url')}\x1f{hit['quote']}"):
+                    continue
+                exact = hit["match"] == "exact"
+                self.quotes.add((_day(hit.get("published_at")), hit["quote"]), int(exact), int(not exact))
+                added += 1
+        if added:
+            self._save()
+        return added
+
+    def _parts(self, name: str) -> List[Tuple[int, str]]:
+        """Return the (first row, path) of each part file of a rollup, in row order."""
+        prefix = f"{name}.part-"
+        parts = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith(prefix) and filename.endswith(".parquet"):
+                start = filename[len(prefix):-len(".parquet")]
+                if start.isdigit():
+                    parts.append((int(start), os.path.join(self.directory, filename)))
+        return sorted(parts)
+
+    def _save(self) -> None:
+        """
+        Write the changes since the last save to Parquet files (atomically).
+
+        Unchanged rollups are skipped. A rollup that only gained rows, such as
+        the ever-growing ``ingested`` table, gets a part file holding just the
+        new rows; one whose saved rows changed, or that has COMPACT_PARTS
+        parts, is rewritten as a single file and its parts are removed.
+        """
+        if not self.directory:
+            return
+        import pyarrow.parquet as pq
+
+        with self._save_lock:
+            os.makedirs(self.directory, exist_ok=True)
+            for name, rollup in self.rollups.items():
+                parts = self._parts(name)
+                with self._lock:
+                    if rollup.version == rollup.saved_version:
+                        continue
+                    compact = rollup.saved_rows_changed or len(parts) >= COMPACT_PARTS
+                    start = 0 if compact else rollup.saved_rows
+                    table = rollup.to_arrow(start)
+                    rollup.saved_version, rollup.saved_rows = rollup.version, len(rollup)
+                    rollup.saved_rows_changed = False
+                if compact:
+                    path = os.path.join(self.directory, f"{name}.parquet")
+                else:
+                    path = os.path.join(self.directory, f"{name}.part-{start:012d}.parquet")
+                try:
+                    pq.write_table(table, f"{path}.tmp")
+                    os.replace(f"{path}.tmp", path)
+                except OSError:
+                    # Tulis ulang seluruh rollup pada penyimpanan berikutnya
+                    with self._lock:
+                        rollup.saved_version = -1
+                        rollup.saved_rows_changed = True
+                    raise
+                if compact:
+                    for _, part_path in parts:
+                        os.remove(part_path)
+
+    def _load(self) -> None:
+        import pyarrow.parquet as pq
+
+        for name, rollup in self.rollups.items():
+            path = os.path.join(self.directory, f"{name}.parquet")
+            tables = [pq.read_table(path)] if os.path.exists(path) else []
+            rows = sum(table.num_rows for table in tables)
+            for start, part_path in self._parts(name):
+                # Bagian yang sudah tercakup file utama (penggabungan terputus) dilewati
+                if start != rows:
+                    continue
+                table = pq.read_table(part_path)
+                tables.append(table)
+                rows += table.num_rows
+            if tables:
+                rollup.load_arrow(*tables)
+            rollup.saved_version, rollup.saved_rows = rollup.version, len(rollup)
+
+
+def downsample(frame, value_columns: List[str], group_columns: List[str] = (), max_points: int = 120):
+    """
+    Merge daily rows into equal multi-day buckets when a range spans more than ``max_points`` days.
+
+    Args:
+        frame: DataFrame with a datetime "day" column
+        value_columns: Additive columns summed per bucket
+        group_columns: Columns kept as separate series
+        max_points: Maximum number of points per series
+
+    Returns:
+        The frame unchanged, or one row per bucket and group labelled with the bucket's first day
+    """
+    import pandas as pd
+
+    if frame.empty:
+        return frame
+    first = frame["day"].min()
+    span = (frame["day"].max() - first).days + 1
+    if span <= max_points:
+        return frame
+    width = -(-span // max_points)
+    buckets = first + pd.to_timedelta((frame["day"] - first).dt.days // width * width, unit="D")
+    return frame.assign(day=buckets).groupby(["day", *group_columns], as_index=False)[value_columns].sum()
+
+
+def _frame_digest(frame, *params) -> str:
+    """Hash the contents of a DataFrame and the figure parameters."""
+    import pandas as pd
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    digest.update(json.dumps([list(frame.columns), *params], default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class Visualizer:
+    """Builds dashboard figures from a MetricsStore, caching them by the hash of their input."""
+
+    def __init__(self, store: Optional[MetricsStore] = None, cache_size: int = 64, max_points: int = 120):
+        """
+        Initialize the visualizer.
+
+        Args:
+            store: Metrics store to read (a new in-memory store if omitted)
+            cache_size: Maximum number of cached figures
+            max_points: Maximum points per time series before downsampling
+        """
+        self.store = store or MetricsStore()
+        self.cache_size = cache_size
+        self.max_points = max_points
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, object]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cached(self, name: str, frame, params: Tuple, build):
+        """Return the cached figure for this input, building it on a miss."""
+        key = _frame_digest(frame, name, *params)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+        figure = build()
+        with self._cache_lock:
+            self._cache[key] = figure
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return figure
+
+    @staticmethod
+    def _between(frame, start: Optional[str], end: Optional[str]):
+        if start:
+            frame = frame[frame["day"] >= start]
+        if end:
+            frame = frame[frame["day"] <= end]
+        return frame
+
+    def keyword_trend_figure(self, top_n: int = 10, start: Optional[str] = None, end: Optional[str] = None):
+        """
+        Line chart of how often the top keywords appeared in releases over time.
+
+        Args:
+            top_n: Number of keywords shown (most frequent in the range)
+            start: First ISO day shown
+            end: Last ISO day shown
+
+        Returns:
+            plotly Figure
+        """
+        with self.store._lock:
+            frame = self._between(self.store.keywords.frame(), start, end)
+        top = frame.groupby("keyword")["count"].sum().nlargest(top_n).index
+        frame = downsample(frame[frame["keyword"].isin(top)], ["count"], ["keyword"], self.max_points)
+
+        def build():
+            import plotly.express as px
+            return px.line(frame.sort_values("day"), x="day", y="count", color="keyword", markers=True,
+                           labels={"day": "Tanggal", "count": "Jumlah rilis", "keyword": "Kata kunci"},
+                           title="Tren Kata Kunci")
+
+        return self._cached("keyword_trend", frame, (top_n,), build)
+
+    def sentiment_by_outlet_figure(self, top_n: int = 15, start: Optional[str] = None,
+                                   end: Optional[str] = None, weight: str = "articles"):
+        """
+        Stacked bar chart of article sentiment per outlet.
+
+        Args:
+            top_n: Number of outlets shown (most articles in the range)
+            start: First ISO day counted
+            end: Last ISO day counted
+            weight: "articles" counts articles, "reach" counts syndicated copies
+
+        Returns:
+            plotly Figure
+        """
+        with self.store._lock:
+            frame = self._between(self.store.sentiment.frame(), start, end)
+        totals = frame.groupby(["outlet", "label"], as_index=False)[weight].sum()
+        top = totals.groupby("outlet")[weight].sum().nlargest(top_n).index
+        totals = totals[totals["outlet"].isin(top)]
+
+        def build():
+            import plotly.express as px
+            return px.bar(totals, x="outlet", y=weight, color="label", barmode="stack",
+                          category_orders={"outlet": list(top)},
+                          labels={"outlet": "Media", weight: "Jumlah artikel", "label": "Sentimen"},
+                          title="Sentimen per Media")
+
+        return self._cached("sentiment_by_outlet", totals, (top_n, weight), build)
+
+    def quote_pickup_figure(self, start: Optional[str] = None, end: Optional[str] = None,
+                            label_length: int = 40):
+        """
+        Stacked bar chart of quote pickups per day.
+
+        Args:
+            start: First ISO day shown
+            end: Last ISO day shown
+            label_length: Quotes are shortened to this many characters in the legend
+
+        Returns:
+            plotly Figure
+        """
+        with self.store._lock:
+            frame = self._between(self.store.quotes.frame(), start, end)
+        frame = frame.assign(pickups=frame["exact"] + frame["fuzzy"])
+        frame = downsample(frame, ["pickups", "exact", "fuzzy"], ["quote"], self.max_points)
+
+        def build():
+            import plotly.express as px
+            shown = frame.assign(quote=frame["quote"].str.slice(0, label_length))
+            return px.bar(shown.sort_values("day"), x="day", y="pickups", color="quote",
+                          hover_data=["exact", "fuzzy"],
+                          labels={"day": "Tanggal", "pickups": "Pemuatan", "quote": "Kutipan"},
+                          title="Pemuatan Kutipan per Hari")
+
+        return self._cached("quote_pickup", frame, (label_length,), build)
+
+
+def get_shared_visualizer() -> Visualizer:
+    """
+    Return the process-wide Visualizer over the shared MetricsStore.
+
+    Rollups are persisted to ANALISIS_METRICS_DIR when it is set (requires pyarrow).
+
+    Returns:
+        Shared Visualizer instance
+    """
+    global _shared_visualizer
+    if _shared_visualizer is None:
+        with _shared_lock:
+            if _shared_visualizer is None:
+                _shared_visualizer = Visualizer(MetricsStore(os.environ.get("ANALISIS_METRICS_DIR") or None))
+    return _shared_visualizer
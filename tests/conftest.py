@@ -0,0 +1,53 @@
+"""
+Shared fixtures for the Analisis Siaran Pers tests.
+NLTK data is read from ANALISIS_NLTK_DATA (or the bundled nltk_data folder);
+see "Data NLTK" in the README.
+"""
+
+import os
+import random
+import sys
+
+# Tes tidak memakai cache disk bersama agar hasilnya tidak bergantung pada proses lain
+os.environ["ANALISIS_CACHE_DIR"] = ""
+
+# Generator korpus sintetis dari benchmarks/ dipakai ulang untuk dokumen panjang
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import pytest
+from corpus import generate_release
+
+RELEASE_TEXT = (
+    "Jakarta - Kementerian Kesehatan meluncurkan program layanan kesehatan masyarakat di Kota Bandung. "
+    "Program ini menjangkau puskesmas di seluruh Jawa Barat dan melibatkan tenaga kesehatan setempat.\n\n"
+    "\"Kami ingin layanan kesehatan masyarakat menjangkau setiap desa tanpa kecuali,\" ujar Menteri "
+    "Kesehatan Budi Santoso dalam konferensi pers di Jakarta.\n\n"
+    "Direktur Utama PT Maju Jaya, Siti Rahmawati, menyambut baik program tersebut. \"Kolaborasi dengan "
+    "swasta mempercepat pemerataan layanan kesehatan di daerah,\" katanya.\n\n"
+    "Warga Desa Sukamaju berharap program layanan kesehatan berjalan berkelanjutan dan puskesmas "
+    "mendapat tambahan tenaga kesehatan."
+)
+
+
+def _make_article(url: str, outlet: str, content: str, title: str = "", description: str = "",
+                  published_at: str = "2026-10-01T08:00:00Z") -> dict:
+    """Build a news article in the NewsAPI layout."""
+    return {"url": url, "source": {"name": outlet}, "title": title, "description": description,
+            "content": content, "publishedAt": published_at}
+
+
+@pytest.fixture
+def release_text() -> str:
+    return RELEASE_TEXT
+
+
+@pytest.fixture
+def make_article():
+    """Factory for news articles in the NewsAPI layout."""
+    return _make_article
+
+
+@pytest.fixture(scope="session")
+def long_release_text() -> str:
+    """A reproducible synthetic release of about 4000 words."""
+    return generate_release(random.Random(7), words=4000)
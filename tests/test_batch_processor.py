@@ -0,0 +1,43 @@
+"""Tests for batch analysis feeding the report metrics."""
+
+import os
+
+from modules import analysis_service, batch_processor
+from modules.batch_processor import analyze_batch
+from modules.visualizer import MetricsStore
+
+
+def test_batch_results_feed_metrics_store(release_text):
+    results = list(analyze_batch([("rilis.txt", release_text.encode("utf-8"))], workers=1))
+    assert len(results) == 1
+    result = results[0]
+    assert result["status"] == "ok", result["error"]
+    assert result["analysis_key"]
+
+    # Sama seperti halaman Analisis Batch
+    store = MetricsStore()
+    assert store.add_release(result["analysis_key"], result["analysis"], "2024-05-01")
+    assert not store.add_release(result["analysis_key"], result["analysis"], "2024-05-01")
+    assert len(store.keywords) == len(result["analysis"]["keywords"])
+    assert set(store.keywords.frame()["keyword"]) == {keyword for keyword, _ in result["analysis"]["keywords"]}
+
+
+def _analyze_or_crash(name, content, *args):
+    # Meniru worker yang dimatikan sistem (mis. OOM killer) saat memproses satu dokumen
+    if name.startswith("rusak"):
+        os._exit(1)
+    return analysis_service.analyze_document(name, content, *args)
+
+
+def test_dead_worker_fails_only_its_document(release_text, monkeypatch):
+    monkeypatch.setattr(batch_processor, "analyze_document", _analyze_or_crash)
+    documents = [(f"rilis-{i}.txt", release_text.encode("utf-8")) for i in range(4)]
+    documents.insert(2, ("rusak.txt", b"isi"))
+
+    results = list(analyze_batch(documents, workers=2))
+
+    assert sorted(result["name"] for result in results) == sorted(name for name, _ in documents)
+    assert [result["index"] for result in results] == list(range(1, 6))
+    failed = [result for result in results if result["status"] != "ok"]
+    assert [(result["name"], result["stage"]) for result in failed] == [("rusak.txt", "worker")]
+    assert "worker berhenti" in failed[0]["error"]
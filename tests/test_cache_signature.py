@@ -0,0 +1,33 @@
+"""Tests for the content fingerprints used in analysis cache keys."""
+
+from modules.corpus_model import CorpusTfidfModel
+from modules.gazetteer import Gazetteer
+
+
+def test_gazetteer_fingerprint_tracks_entries_not_count():
+    first = Gazetteer.from_entries([("Bank Indonesia", "organizations"), ("Bandung", "locations")])
+    reordered = Gazetteer.from_entries([("Bandung", "locations"), ("Bank Indonesia", "organizations")])
+    edited = Gazetteer.from_entries([("Bank Indonesia", "organizations"), ("Surabaya", "locations")])
+
+    assert first.fingerprint() == reordered.fingerprint()
+    assert len(first) == len(edited)
+    assert first.fingerprint() != edited.fingerprint()
+
+    before = first.fingerprint()
+    first.add("Bandung", "organizations")
+    assert first.fingerprint() != before
+
+
+def test_corpus_fingerprint_tracks_vocabulary_not_size():
+    model = CorpusTfidfModel()
+    model.add_documents([["ekonomi", "tumbuh"], ["pangan"]])
+    other = CorpusTfidfModel()
+    other.add_documents([["kesehatan"], ["pangan", "desa"]])
+
+    assert model.n_docs == other.n_docs
+    assert model.fingerprint() != other.fingerprint()
+    assert model.fingerprint() == CorpusTfidfModel(dict(model.doc_freq), model.n_docs).fingerprint()
+
+    before = model.fingerprint()
+    model.add_documents([["ekonomi"]])
+    assert model.fingerprint() != before
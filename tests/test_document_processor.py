@@ -0,0 +1,86 @@
+"""
+Encoding detection, PDF and legacy .doc extraction, and numeric settings.
+"""
+
+import logging
+import os
+import stat
+import sys
+
+import pytest
+from corpus import to_pdf
+
+from modules.document_processor import DocumentError, DocumentProcessor, detect_encoding, env_number
+
+TEXT = "Kementerian Kesehatan meluncurkan program “layanan” baru.\n"
+
+
+@pytest.mark.parametrize("encoding, expected", [
+    ("utf-8", "utf-8"),
+    ("cp1252", "cp1252"),
+    ("utf-16-le", "utf-16-le"),
+    ("utf-16-be", "utf-16-be"),
+])
+def test_detect_encoding_without_bom(encoding, expected):
+    content = (TEXT * 20).encode(encoding)
+    assert detect_encoding(content) == expected
+    assert content.decode(detect_encoding(content)) == TEXT * 20
+
+
+def test_detect_encoding_binary_with_nuls_falls_back_to_latin1():
+    assert detect_encoding(bytes(range(256)) * 4) == "latin-1"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shell script stands in for antiword")
+def test_doc_text_survives_large_antiword_stderr(tmp_path, monkeypatch):
+    # antiword palsu: stderr lebih besar dari buffer pipa, lalu keluar dengan galat
+    fake = tmp_path / "antiword"
+    fake.write_text("#!/bin/sh\necho 'baris pertama'\nhead -c 200000 /dev/zero | tr '\\0' 'x' >&2\n"
+                    "echo 'berkas rusak' >&2\nexit 1\n")
+    fake.chmod(fake.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+
+    lines = []
+    with pytest.raises(DocumentError, match="berkas rusak"):
+        for line in DocumentProcessor.iter_doc_text(b"bukan dokumen word"):
+            lines.append(line)
+    assert lines == ["baris pertama\n"]
+
+
+def test_pdf_is_parsed_once(release_text, monkeypatch):
+    import PyPDF2
+
+    opened = []
+    original = PyPDF2.PdfReader.__init__
+
+    def counting_init(self, *args, **kwargs):
+        opened.append(1)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PyPDF2.PdfReader, "__init__", counting_init)
+    pages = []
+
+    text = DocumentProcessor.extract_text_from_pdf(to_pdf(release_text * 4, lines_per_page=10), max_pages=2,
+                                                   progress_callback=lambda done, total: pages.append((done, total)))
+
+    assert len(opened) == 1
+    assert pages == [(1, 2), (2, 2)]
+    assert text.startswith("Jakarta - Kementerian Kesehatan")
+
+
+@pytest.mark.parametrize("raw, cast, expected, warns", [
+    ("", int, 7, False),
+    ("3", int, 3, False),
+    ("2.5", float, 2.5, False),
+    ("dua", int, 7, True),
+    ("2.5", int, 7, True),
+    ("-1", int, 7, True),
+    ("nan", float, 7, True),
+])
+def test_env_number_falls_back_on_invalid_values(raw, cast, expected, warns, monkeypatch, caplog):
+    monkeypatch.setenv("ANALISIS_UJI_ANGKA", raw)
+
+    with caplog.at_level(logging.WARNING, logger="modules.document_processor"):
+        assert env_number("ANALISIS_UJI_ANGKA", 7, cast) == expected
+
+    assert any("ANALISIS_UJI_ANGKA" in record.getMessage() for record in caplog.records) == warns
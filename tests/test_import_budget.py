@@ -0,0 +1,20 @@
+"""
+Import-time budgets of benchmarks/import_budget.py, checked per module.
+
+Set ANALISIS_IMPORT_BUDGET_SCALE to stretch the budgets on slow machines.
+"""
+
+import os
+
+import pytest
+from import_budget import BUDGETS_MS, measure
+
+SCALE = float(os.environ.get("ANALISIS_IMPORT_BUDGET_SCALE") or 1.0)
+
+
+@pytest.mark.parametrize("module, budget", sorted(BUDGETS_MS.items()))
+def test_import_stays_within_budget(module, budget):
+    elapsed, heavy = measure(module)
+
+    assert heavy == [], f"{module} memuat pustaka berat saat diimpor: {', '.join(heavy)}"
+    assert elapsed <= budget * SCALE, f"{module} diimpor dalam {elapsed:.1f} ms (anggaran {budget * SCALE:.0f} ms)"
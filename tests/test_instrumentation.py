@@ -0,0 +1,26 @@
+"""
+Stage metrics and their Prometheus rendering.
+"""
+
+import pytest
+
+from modules.document_processor import DocumentError, DocumentProcessor
+from modules.instrumentation import MetricsRegistry, profile
+
+
+def test_unsupported_extension_opens_no_stage():
+    with profile("unggahan", log=False) as current:
+        with pytest.raises(DocumentError, match="tidak didukung"):
+            DocumentProcessor.extract_text_from_bytes('x.a"b\nfoo', b"isi dokumen")
+
+    assert not any(name.startswith("extract") for name in current.stages)
+
+
+def test_prometheus_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.record({"stages": {'extract.a"b\\c\nfoo': {"seconds": 1.0, "calls": 1}}, "counters": {}})
+
+    text = registry.render_prometheus()
+
+    assert 'analisis_stage_calls_total{stage="extract.a\\"b\\\\c\\nfoo"} 1' in text
+    assert all(line.startswith(("#", "analisis_")) for line in text.splitlines())
@@ -0,0 +1,56 @@
+"""
+Quote extraction and result offsets of KeywordExtractor.
+"""
+
+import pytest
+
+from modules.keyword_extractor import KeywordExtractor
+from modules.models import AnalysisResult
+
+
+@pytest.fixture(scope="module")
+def extractor() -> KeywordExtractor:
+    return KeywordExtractor()
+
+
+def test_apostrophes_do_not_break_double_quotes(extractor):
+    text = ("Program diluncurkan pada hari Jum'at di masjid. \"Kami akan memperluas program ini ke "
+            "seluruh provinsi,\" kata Menteri. Ia menambahkan bahwa Qur'an dibagikan.")
+
+    quotes = extractor.extract_quotes(text)
+
+    assert [quote["quote"] for quote in quotes] == ["Kami akan memperluas program ini ke seluruh provinsi,"]
+    assert text[quotes[0]["start"]:quotes[0]["end"]] == quotes[0]["quote"]
+    assert quotes[0]["context"].startswith("\"Kami akan")
+
+
+def test_single_and_curly_quotes_at_word_boundaries(extractor):
+    text = ("Warga berkata 'kami siap ikut pengajian Jum'at ini' kepada petugas. "
+            "Ketua RT menambahkan ‘program ini sangat membantu warga’ saat ditemui. "
+            "Direktur menyebut “kolaborasi mempercepat pemerataan layanan” di Jakarta.")
+
+    quotes = [quote["quote"] for quote in extractor.extract_quotes(text)]
+
+    assert quotes == [
+        "kami siap ikut pengajian Jum'at ini",
+        "program ini sangat membantu warga",
+        "kolaborasi mempercepat pemerataan layanan",
+    ]
+
+
+def test_analysis_offsets_point_at_the_reported_items(extractor):
+    text = ("Pemerintah Kota Budimanjaya membuka layanan baru. Layanan ini dipimpin oleh Budi Santoso. "
+            "Warga menyambut LAYANAN tersebut.\n\nBudi Santoso mengatakan layanan akan diperluas ke desa. "
+            "Pemerintah Kota Budimanjaya membuka layanan baru.")
+
+    analysis = extractor.analyze_text(text)
+    result = AnalysisResult.from_analysis(analysis)
+
+    keywords = {keyword.text: keyword for keyword in result.keywords}
+    assert (keywords["layanan"].start, keywords["layanan"].end) == (text.index("layanan"), text.index("layanan") + 7)
+    for phrase, (start, end) in zip(analysis["key_phrases"], analysis["offsets"]["key_phrases"]):
+        assert text[start:end] == phrase
+    budi = next(entity for entity in result.entities if entity.text == "Budi Santoso")
+    assert budi.start == text.index("Budi Santoso")
+    for entity in result.entities:
+        assert text[entity.start:entity.end] == entity.text
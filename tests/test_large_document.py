@@ -0,0 +1,125 @@
+"""Tests for chunked and streamed analysis of large documents."""
+
+import gc
+import os
+import tempfile
+import time
+
+from corpus import to_pdf
+
+from modules import large_document
+from modules.analysis_context import split_segments
+from modules.analysis_service import analyze_document, analyze_text, compare_keyword_methods
+from modules.document_processor import DocumentProcessor
+from modules.keyword_extractor import get_shared_extractor
+from modules.large_document import LargeDocument, chunk_text, stream_document_chunks
+
+
+def _pieces(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_chunks_rebuild_text_and_end_at_segment_boundaries(long_release_text):
+    chunks = list(chunk_text(_pieces(long_release_text, 997), chunk_chars=2000))
+
+    assert len(chunks) > 3
+    assert "".join(chunk for _, chunk in chunks) == long_release_text
+    assert [offset for offset, _ in chunks] == [sum(len(c) for _, c in chunks[:i]) for i in range(len(chunks))]
+    segments = [(offset + start, offset + end) for offset, chunk in chunks for start, end in split_segments(chunk)]
+    assert segments == split_segments(long_release_text)
+
+
+def test_analyze_chunks_matches_analyze_text(long_release_text):
+    extractor = get_shared_extractor()
+    whole = extractor.analyze_text(long_release_text)
+    chunked = extractor.analyze_chunks(chunk_text(_pieces(long_release_text, 1500), chunk_chars=3000))
+
+    assert chunked["keywords"] == whole["keywords"]
+    assert chunked["key_phrases"] == whole["key_phrases"]
+    assert chunked["quotes"] == whole["quotes"]
+    assert chunked["entities"] == whole["entities"]
+    assert chunked["offsets"] == whole["offsets"]
+
+
+def test_pdf_chunks_arrive_before_all_pages_are_extracted(long_release_text):
+    pdf = to_pdf(long_release_text, lines_per_page=20)
+    total = DocumentProcessor.count_pdf_pages(pdf)
+    pages_done = []
+
+    chunks = stream_document_chunks("laporan.pdf", pdf, lambda done, _: pages_done.append(done), chunk_chars=2000)
+    next(chunks)
+    assert total > 5
+    assert pages_done[-1] < total
+    list(chunks)
+    assert pages_done[-1] == total
+
+
+def test_large_documents_are_analyzed_while_streaming(long_release_text, monkeypatch):
+    pdf = to_pdf(long_release_text, lines_per_page=20)
+    expected = analyze_text(DocumentProcessor.extract_text_from_bytes("laporan.pdf", pdf), use_cache=False)
+
+    monkeypatch.setattr(large_document, "LARGE_DOCUMENT_MB", 0)
+    monkeypatch.setattr(large_document, "CHUNK_CHARS", 3000)
+    streamed = analyze_document("laporan.pdf", pdf, use_cache=False)
+
+    assert streamed["status"] == "ok", streamed["error"]
+    assert streamed["profile"]["counters"]["chunks"] > 1
+    assert streamed["analysis"]["keywords"] == expected["analysis"]["keywords"]
+    assert streamed["analysis"]["quotes"] == expected["analysis"]["quotes"]
+    assert streamed["text_length"] > 0
+
+
+def test_typed_large_documents_stream_with_offsets(long_release_text, monkeypatch):
+    monkeypatch.setattr(large_document, "LARGE_DOCUMENT_MB", 0)
+    monkeypatch.setattr(large_document, "CHUNK_CHARS", 3000)
+    streamed = analyze_document("rilis.txt", long_release_text.encode("utf-8"), use_cache=False, typed=True)
+
+    assert streamed["status"] == "ok", streamed["error"]
+    assert streamed["profile"]["counters"]["chunks"] > 1
+    result = streamed["result"]
+    for phrase in result.key_phrases:
+        assert long_release_text[phrase.start:phrase.end] == phrase.text
+    for keyword in result.keywords:
+        assert long_release_text[keyword.start:keyword.end].lower() == keyword.text
+    for entity in result.entities:
+        assert long_release_text[entity.start:entity.end] == entity.text
+
+
+def test_keyword_comparison_covers_the_whole_large_document(long_release_text, monkeypatch):
+    monkeypatch.setattr(large_document, "PREVIEW_CHARS", 2000)
+    document = LargeDocument.extract("rilis.txt", long_release_text.encode("utf-8"))
+    try:
+        assert document.truncated
+        comparison = compare_keyword_methods(document, methods=("tfidf",))
+    finally:
+        document.discard()
+
+    expected = get_shared_extractor().analyze_text(long_release_text)["keywords"]
+    assert comparison["tfidf"]["error"] is None
+    assert comparison["tfidf"]["keywords"] == [(keyword, float(score)) for keyword, score in expected]
+
+
+def test_text_file_is_removed_with_the_document(long_release_text):
+    document = LargeDocument.extract("rilis.txt", long_release_text.encode("utf-8"))
+    path = document.text_path
+    assert os.path.exists(path)
+
+    # Session berakhir: objek dokumen dikumpulkan tanpa discard()
+    del document
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_sweep_removes_only_stale_text_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    stale = tmp_path / f"{large_document.TEXT_FILE_PREFIX}lama.txt"
+    fresh = tmp_path / f"{large_document.TEXT_FILE_PREFIX}baru.txt"
+    other = tmp_path / "lain.txt"
+    for path in (stale, fresh, other):
+        path.write_text("teks")
+    old = time.time() - 2 * 3600
+    os.utime(stale, (old, old))
+    os.utime(other, (old, old))
+
+    assert large_document.sweep_stale_text_files(max_age_hours=1, force=True) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([fresh.name, other.name])
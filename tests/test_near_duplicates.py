@@ -0,0 +1,46 @@
+"""
+Near-duplicate clustering of news articles.
+"""
+
+from modules.near_duplicates import NearDuplicateIndex, deduplicate_articles
+
+STORY = (
+    "Kementerian Kesehatan meluncurkan program layanan kesehatan masyarakat di Kota Bandung. "
+    "Program ini menjangkau puskesmas di seluruh Jawa Barat dan melibatkan tenaga kesehatan setempat. "
+    "Menteri Kesehatan berharap layanan kesehatan masyarakat menjangkau setiap desa tanpa kecuali "
+    "dan warga mendapat pemeriksaan gratis setiap bulan di puskesmas terdekat."
+)
+OTHER_STORY = (
+    "Bank Indonesia mempertahankan suku bunga acuan pada rapat dewan gubernur bulan ini. "
+    "Keputusan tersebut diambil untuk menjaga stabilitas nilai tukar rupiah di tengah ketidakpastian "
+    "pasar keuangan global dan inflasi yang masih berada dalam kisaran sasaran."
+)
+
+
+def test_reprints_form_one_cluster(make_article):
+    title = "Program kesehatan diluncurkan"
+    articles = [
+        make_article("https://a.id/1", "Harian A", STORY, title=title),
+        make_article("https://b.id/1", "Harian B", STORY + " Baca juga berita lainnya.", title=title),
+        make_article("https://c.id/1", "Harian C", OTHER_STORY, title="Suku bunga tetap"),
+        make_article("https://d.id/1", "Harian D", STORY.replace("Bandung", "Bogor"), title=title),
+    ]
+
+    stories = deduplicate_articles(articles)
+
+    assert [story["url"] for story in stories] == ["https://b.id/1", "https://c.id/1"]
+    assert stories[0]["reach"] == 3
+    assert stories[0]["outlets"] == ["Harian A", "Harian B", "Harian D"]
+    assert sorted(stories[0]["duplicates"]) == ["https://a.id/1", "https://d.id/1"]
+    assert stories[1]["reach"] == 1 and stories[1]["duplicates"] == []
+
+
+def test_empty_texts_stay_separate(make_article):
+    index = NearDuplicateIndex()
+    for text in ["", STORY, "  ", "...", STORY]:
+        index.add(text)
+
+    assert index.clusters() == [[0], [1, 4], [2], [3]]
+
+    empty = [make_article(f"https://kosong.id/{i}", "Harian E", "") for i in range(3)]
+    assert len(deduplicate_articles(empty)) == 3
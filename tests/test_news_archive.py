@@ -0,0 +1,98 @@
+"""
+Incremental indexing and bm25 search of the local news archive.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from modules.keyword_extractor import get_shared_extractor
+from modules.news_archive import NewsArchive
+from modules.news_finder import NewsFinder
+
+QUOTE = "Kami ingin layanan kesehatan menjangkau setiap desa tanpa kecuali"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    extractor = get_shared_extractor()
+    archive = NewsArchive(str(tmp_path / "arsip.db"), extractor.stemmer, extractor.stopwords)
+    yield archive
+    archive.close()
+
+
+def _recent(days: int) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_ingest_is_incremental_and_skips_unchanged_rows(archive, make_article):
+    first = [
+        make_article("https://a.id/1", "Harian A", "Puskesmas baru dibuka di Bandung.", title="Layanan kesehatan"),
+        make_article("https://b.id/1", "Harian B", "Harga beras naik menjelang akhir tahun.", title="Harga pangan"),
+    ]
+    assert archive.add_articles(first) == 2
+    assert archive.add_articles(first) == 0
+    assert archive.add_articles([*first, make_article("https://c.id/1", "Harian C", "Kereta cepat beroperasi.")]) == 1
+    assert archive.add_articles([{"title": "Tanpa URL", "content": "Artikel tanpa alamat."}]) == 0
+    assert len(archive) == 3
+
+
+def test_changed_article_is_reindexed(archive, make_article):
+    archive.add_articles([make_article("https://a.id/1", "Harian A", "Puskesmas baru dibuka di Bandung.")])
+    assert archive.search(["puskesmas"])
+
+    assert archive.add_articles([make_article("https://a.id/1", "Harian A", "Jembatan baru diresmikan di Bogor.")]) == 1
+
+    assert archive.search(["puskesmas"]) == []
+    [hit] = archive.search(["jembatan"])
+    assert hit["content"] == "Jembatan baru diresmikan di Bogor."
+    assert len(archive) == 1
+
+
+def test_quote_matches_as_phrase(archive, make_article):
+    archive.add_articles([
+        make_article("https://a.id/1", "Harian A", f"\"{QUOTE},\" ujar Menteri."),
+        # Kata yang sama dengan urutan berbeda bukan kutipan
+        make_article("https://b.id/1", "Harian B", "Setiap desa ingin kami menjangkau layanan kesehatan tanpa kecuali."),
+    ])
+
+    assert archive.build_query([], [QUOTE]).count('"') == 2
+    assert [hit["url"] for hit in archive.search([], [QUOTE])] == ["https://a.id/1"]
+
+
+def test_results_follow_bm25_with_title_weight(archive, make_article):
+    archive.add_articles([
+        make_article("https://a.id/1", "Harian A", "Cuaca cerah sepanjang pekan.", title="Prakiraan cuaca"),
+        make_article("https://b.id/1", "Harian B", "Pemerintah meresmikan puskesmas di desa.", title="Berita daerah"),
+        make_article("https://c.id/1", "Harian C", "Puskesmas keliling melayani warga.", title="Puskesmas keliling"),
+    ])
+
+    hits = archive.search(["puskesmas"])
+
+    assert [hit["url"] for hit in hits] == ["https://c.id/1", "https://b.id/1"]
+    assert hits[0]["archive_score"] > hits[1]["archive_score"] > 0
+    assert len(archive.search(["puskesmas"], limit=1)) == 1
+
+
+def test_since_drops_older_articles(archive, make_article):
+    archive.add_articles([
+        make_article("https://a.id/1", "Harian A", "Puskesmas baru dibuka.", published_at="2026-01-05T08:00:00Z"),
+        make_article("https://b.id/1", "Harian B", "Puskesmas baru diresmikan.", published_at="2026-10-02T08:00:00Z"),
+    ])
+
+    assert len(archive.search(["puskesmas"])) == 2
+    assert [hit["url"] for hit in archive.search(["puskesmas"], since="2026-10-01")] == ["https://b.id/1"]
+
+
+def test_finder_without_api_key_answers_from_recent_archive(archive, make_article):
+    archive.add_articles([
+        make_article("https://a.id/1", "Harian A", "Puskesmas baru dibuka.", published_at=_recent(400)),
+        make_article("https://b.id/1", "Harian B", "Puskesmas baru diresmikan.", published_at=_recent(2)),
+    ])
+    # Port tertutup: setiap panggilan API akan gagal
+    finder = NewsFinder("", base_url="http://127.0.0.1:9/v2/everything", archive=archive)
+
+    assert [a["url"] for a in finder.fetch_news(["puskesmas"], [])] == ["https://b.id/1"]
+    assert len(finder.fetch_news(["puskesmas"], [], since="")) == 2
+    assert finder.fetch_news(["jembatan"], []) == []
+    assert finder.last_error is None
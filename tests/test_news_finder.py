@@ -0,0 +1,106 @@
+"""
+NewsFinder behavior against a local stub of the NewsAPI endpoint.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from modules.news_finder import NewsFinder
+
+TOTAL_RESULTS = 5
+
+
+class StubNewsApi(BaseHTTPRequestHandler):
+    """Answers the first request with 429, then serves paged articles."""
+
+    requests_seen = []
+
+    def do_GET(self):
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        self.requests_seen.append(params)
+        if len(self.requests_seen) == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        page, page_size = int(params["page"]), int(params["pageSize"])
+        start = (page - 1) * page_size
+        articles = [
+            {"title": f"Berita {i}", "url": f"https://contoh.id/{i}", "description": params["q"]}
+            for i in range(start, min(start + page_size, TOTAL_RESULTS))
+        ]
+        body = json.dumps({"status": "ok", "totalResults": TOTAL_RESULTS, "articles": articles}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    StubNewsApi.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubNewsApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v2/everything"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retries_after_429_paginates_and_caches(stub_url):
+    finder = NewsFinder("kunci-uji", base_url=stub_url, backoff_factor=0)
+
+    articles = finder.search_news(["kesehatan"], page_size=2, max_results=10)
+
+    assert [a["title"] for a in articles] == [f"Berita {i}" for i in range(TOTAL_RESULTS)]
+    assert finder.last_error is None
+    # Satu 429 lalu tiga halaman
+    assert [r["page"] for r in StubNewsApi.requests_seen] == ["1", "1", "2", "3"]
+
+    again = finder.search_news(["kesehatan"], page_size=2, max_results=10)
+    assert again == articles
+    assert len(StubNewsApi.requests_seen) == 4
+
+
+def test_cache_is_bounded(stub_url):
+    finder = NewsFinder("kunci-uji", base_url=stub_url, backoff_factor=0, cache_size=2)
+
+    for keyword in ["satu", "dua", "tiga", "empat"]:
+        finder.search_news([keyword], page_size=10)
+
+    assert len(finder._cache) == 2
+    seen = len(StubNewsApi.requests_seen)
+    finder.search_news(["empat"], page_size=10)
+    assert len(StubNewsApi.requests_seen) == seen
+    finder.search_news(["satu"], page_size=10)
+    assert len(StubNewsApi.requests_seen) == seen + 1
+
+
+def test_stale_archive_hits_do_not_block_the_api(stub_url, tmp_path, make_article):
+    from modules.keyword_extractor import get_shared_extractor
+    from modules.news_archive import NewsArchive
+
+    extractor = get_shared_extractor()
+    archive = NewsArchive(str(tmp_path / "arsip.db"), extractor.stemmer, extractor.stopwords)
+    archive.add_articles([
+        make_article(f"https://lama.id/{i}", "Harian Lama", "Liputan kesehatan lama.", published_at="2025-01-01T08:00:00Z")
+        for i in range(3)
+    ])
+    finder = NewsFinder("kunci-uji", base_url=stub_url, backoff_factor=0, archive=archive)
+
+    articles = finder.fetch_news(["kesehatan"], [], max_results=3, since="2026-10-01")
+
+    assert [a["url"] for a in articles] == [f"https://contoh.id/{i}" for i in range(3)]
+    assert StubNewsApi.requests_seen[-1]["from"] == "2026-10-01"
+    archive.close()
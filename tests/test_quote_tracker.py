@@ -0,0 +1,51 @@
+"""
+Exact and fuzzy pickup of release quotes in news articles.
+"""
+
+from modules.quote_tracker import QuotePickupMatcher, track_quote_pickup
+
+QUOTES = [
+    "Kami ingin layanan kesehatan masyarakat menjangkau setiap desa tanpa kecuali",
+    "Kolaborasi dengan swasta mempercepat pemerataan layanan kesehatan di daerah",
+    "Terima kasih",
+]
+
+
+def test_exact_hit_reports_span():
+    text = ("Menteri berkata, \"KAMI ingin layanan kesehatan masyarakat menjangkau setiap desa "
+            "tanpa kecuali,\" di Jakarta.")
+    hits = QuotePickupMatcher(QUOTES).match(text)
+
+    assert [(hit["quote_index"], hit["match"], hit["score"]) for hit in hits] == [(0, "exact", 1.0)]
+    assert text[hits[0]["start"]:hits[0]["end"]] == (
+        "KAMI ingin layanan kesehatan masyarakat menjangkau setiap desa tanpa kecuali"
+    )
+
+
+def test_fuzzy_hit_for_edited_quote():
+    # Kutipan dipotong dan disunting oleh redaksi
+    text = "Ia menyebut kolaborasi dengan swasta mempercepat pemerataan layanan kesehatan bagi warga."
+    hits = QuotePickupMatcher(QUOTES).match(text)
+
+    assert [(hit["quote_index"], hit["match"]) for hit in hits] == [(1, "fuzzy")]
+    assert 0.5 <= hits[0]["score"] < 1.0
+    assert QuotePickupMatcher(QUOTES, min_containment=0.9).match(text) == []
+
+
+def test_track_quote_pickup_counts_outlets(make_article):
+    articles = [
+        make_article("https://a.id/1", "Harian A", "\"" + QUOTES[0] + ",\" ujar Menteri. Terima kasih."),
+        make_article("https://b.id/1", "Harian B", "Kolaborasi dengan swasta mempercepat pemerataan layanan kesehatan."),
+        make_article("https://c.id/1", "Harian A", QUOTES[0] + " dan " + QUOTES[1]),
+        make_article("https://d.id/1", "Harian D", "Berita lain tentang cuaca."),
+    ]
+
+    report = track_quote_pickup(QUOTES, articles)
+
+    assert [(entry["exact"], entry["fuzzy"], entry["outlets"]) for entry in report] == [
+        (2, 0, ["Harian A"]),
+        (1, 1, ["Harian B", "Harian A"]),
+        (0, 0, []),
+    ]
+    assert report[0]["hits"][0]["url"] == "https://a.id/1"
+    assert report[0]["hits"][0]["published_at"] == "2026-10-01T08:00:00Z"
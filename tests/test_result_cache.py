@@ -0,0 +1,48 @@
+"""Tests for the two-tier result cache."""
+
+import os
+import pickle
+
+from modules.result_cache import ResultCache, content_key
+
+
+def test_disk_tier_round_trip(tmp_path):
+    directory = tmp_path / "cache"
+    key = content_key(b"rilis", "analyze", "1")
+    analysis = {"keywords": [("kesehatan", 0.5)], "key_phrases": ["layanan kesehatan"]}
+    ResultCache(str(directory)).put(key, analysis)
+    assert os.stat(directory).st_mode & 0o077 == 0
+
+    # Instans baru hanya dapat membaca dari disk
+    cache = ResultCache(str(directory))
+    assert cache.get(key) == {"keywords": [["kesehatan", 0.5]], "key_phrases": ["layanan kesehatan"]}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_planted_pickle_is_never_loaded(tmp_path):
+    key = content_key(b"rilis")
+    folder = tmp_path / key[:2]
+    folder.mkdir()
+    (folder / f"{key}.pkl").write_bytes(pickle.dumps({"planted": True}))
+    (folder / f"{key}.json").write_bytes(pickle.dumps({"planted": True}))
+
+    assert ResultCache(str(tmp_path)).get(key, "miss") == "miss"
+
+
+def test_shared_writable_directory_disables_disk_tier(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o777)
+
+    cache = ResultCache(str(shared))
+    assert cache.directory is None
+    cache.put("key", "teks")
+    assert cache.get("key") == "teks"
+    assert not any(shared.iterdir())
+
+
+def test_values_that_are_not_json_stay_in_memory(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.put("key", {1, 2})
+    assert cache.get("key") == {1, 2}
+    assert not list(tmp_path.rglob("*.json"))
@@ -0,0 +1,125 @@
+"""
+TF-IDF weights, sentence scores and key phrase selection over TermMatrix.
+
+Expected TF-IDF numbers are those of scikit-learn's TfidfVectorizer
+(smooth idf, sublinear_tf off, l2 norm) on the same corpus.
+"""
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from modules.keyword_extractor import TERM_PATTERN, KeywordExtractor
+from modules.term_matrix import TermMatrix
+
+CORPUS = [
+    "Kementerian Kesehatan meluncurkan program layanan kesehatan masyarakat di Kota Bandung.",
+    "Program ini menjangkau puskesmas di seluruh Jawa Barat.",
+    "Tenaga kesehatan setempat dilibatkan dalam program layanan.",
+    "Warga berharap program layanan kesehatan berjalan berkelanjutan.",
+    "Puskesmas mendapat tambahan tenaga kesehatan dan obat.",
+    "Menteri menyebut layanan masyarakat harus menjangkau desa.",
+]
+
+EXPECTED_ROWS = {
+    0: {"bandung": 0.36621, "di": 0.300297, "kementerian": 0.36621, "kesehatan": 0.434515, "kota": 0.36621,
+        "layanan": 0.217257, "masyarakat": 0.300297, "meluncurkan": 0.36621, "program": 0.217257},
+    2: {"dalam": 0.459883, "dilibatkan": 0.459883, "kesehatan": 0.27283, "layanan": 0.27283, "program": 0.27283,
+        "setempat": 0.459883, "tenaga": 0.377111},
+}
+
+EXPECTED_RANKING = [
+    ("kesehatan", 0.203291), ("layanan", 0.167082), ("program", 0.164834), ("tenaga", 0.120112),
+    ("menjangkau", 0.111414), ("puskesmas", 0.111414), ("masyarakat", 0.10731), ("di", 0.104203),
+]
+
+
+def _matrix(sentences=CORPUS) -> TermMatrix:
+    return TermMatrix.from_counts([Counter(TERM_PATTERN.findall(sentence.lower())) for sentence in sentences])
+
+
+@pytest.fixture(scope="module")
+def extractor() -> KeywordExtractor:
+    return KeywordExtractor()
+
+
+def test_tfidf_weights():
+    matrix = _matrix()
+    weights = TermMatrix._tfidf(matrix.matrix).toarray()
+
+    assert len(matrix.terms) == 31
+    assert matrix.terms == sorted(matrix.terms)
+    for row, expected in EXPECTED_ROWS.items():
+        actual = {matrix.terms[column]: weights[row, column] for column in np.nonzero(weights[row])[0]}
+        assert actual.keys() == expected.keys()
+        np.testing.assert_allclose([actual[term] for term in expected], list(expected.values()), atol=1e-6)
+    np.testing.assert_allclose(np.linalg.norm(weights, axis=1), 1.0)
+
+
+def test_rank_tfidf_mean_weights():
+    matrix = _matrix()
+    # Kosakata penuh (2 * num_keywords >= jumlah istilah) agar tidak bergantung pada pemotongan max_features
+    ranked = matrix.rank_tfidf(len(matrix.terms))[:len(EXPECTED_RANKING)]
+
+    # Seri menjangkau/puskesmas dipecah menurut abjad
+    assert [term for term, _ in ranked] == [term for term, _ in EXPECTED_RANKING]
+    np.testing.assert_allclose([score for _, score in ranked], [score for _, score in EXPECTED_RANKING], atol=1e-6)
+
+
+def test_presence_scores_match_whole_tokens():
+    matrix = _matrix([
+        "Desain poster desain spanduk disiapkan.",
+        "Dana desa dipakai membangun jalan desa.",
+        "Kesehatan warga desa terjaga.",
+    ])
+
+    # Setiap istilah dihitung sekali per kalimat, istilah tak dikenal diabaikan
+    np.testing.assert_array_equal(matrix.presence_scores(["desa"]), [0, 1, 1])
+    np.testing.assert_array_equal(matrix.presence_scores(["desa", "kesehatan", "tidakada"]), [0, 1, 2])
+    np.testing.assert_array_equal(matrix.presence_scores(["desain"]), [1, 0, 0])
+
+
+def test_lexrank_scores():
+    scores = _matrix().lexrank_scores(exclude={"di", "ini", "dan", "dalam"})
+
+    np.testing.assert_allclose(scores, [0.244242, 0.105486, 0.2271, 0.14776, 0.165498, 0.109914], atol=1e-6)
+    assert scores.sum() == pytest.approx(1.0)
+
+
+def test_lexrank_isolated_sentence_scores_lowest():
+    scores = _matrix([
+        "Program layanan kesehatan menjangkau desa.",
+        "Layanan kesehatan desa diperluas program baru.",
+        "Program kesehatan desa mendapat dukungan.",
+        "Cuaca cerah sepanjang pekan.",
+    ]).lexrank_scores()
+
+    assert int(np.argmin(scores)) == 3
+    assert _matrix([]).lexrank_scores().shape == (0,)
+
+
+def test_keyword_keyphrases_ignore_partial_words(extractor):
+    matrix = _matrix([
+        "Tim desain menyiapkan desain gedung baru.",
+        "Cuaca cerah sepanjang pekan.",
+        "Dana desa dipakai membangun jalan.",
+    ])
+
+    selected = extractor._select_keyphrases(matrix, 2, lambda: [("desa", 1.0), ("jalan", 0.5)], method="keywords")
+
+    assert selected == [2, 0]
+
+
+def test_extract_keyphrases_by_method(extractor):
+    text = ("Program layanan kesehatan menjangkau desa. Cuaca cerah sepanjang pekan. "
+            "Layanan kesehatan desa diperluas dengan program baru. Program kesehatan desa mendapat dukungan.")
+
+    lexrank = extractor.extract_keyphrases(text, 3, method="lexrank")
+    keywords = extractor.extract_keyphrases(text, 4, method="keywords")
+
+    assert "Cuaca cerah sepanjang pekan." not in lexrank
+    assert len(lexrank) == 3 and set(lexrank) <= set(extractor.build_context(text).sentences)
+    assert sorted(keywords) == sorted(extractor.build_context(text).sentences)
+    with pytest.raises(ValueError):
+        extractor.extract_keyphrases(text, 2, method="acak")
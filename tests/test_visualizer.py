@@ -0,0 +1,61 @@
+"""
+Persistence of the dashboard rollups.
+"""
+
+import os
+
+from modules import visualizer
+from modules.visualizer import MetricsStore
+
+
+def _analysis(*keywords):
+    return {"keywords": [(keyword, 0.5) for keyword in keywords]}
+
+
+def _files(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_saves_only_changes_and_reloads(tmp_path, monkeypatch):
+    monkeypatch.setattr(visualizer, "COMPACT_PARTS", 3)
+    store = MetricsStore(str(tmp_path))
+
+    # Rollup yang tidak berubah tidak ditulis; baris baru menjadi file bagian
+    store.add_release("a", _analysis("kesehatan", "puskesmas"), day="2026-10-01")
+    assert _files(tmp_path) == ["ingested.part-000000000000.parquet", "keywords.part-000000000000.parquet"]
+    store.add_release("b", _analysis("desa"), day="2026-10-02")
+    assert _files(tmp_path) == [
+        "ingested.part-000000000000.parquet", "ingested.part-000000000001.parquet",
+        "keywords.part-000000000000.parquet", "keywords.part-000000000002.parquet",
+    ]
+
+    # Baris tersimpan yang berubah membuat rollup ditulis ulang sebagai satu file
+    store.add_release("c", _analysis("kesehatan"), day="2026-10-01")
+    assert [name for name in _files(tmp_path) if name.startswith("keywords.")] == ["keywords.parquet"]
+
+    # Bagian digabung setelah COMPACT_PARTS file
+    for release_id in "defg":
+        store.add_release(release_id, _analysis(), day="2026-10-03")
+    assert "ingested.parquet" in _files(tmp_path)
+    assert len([name for name in _files(tmp_path) if name.startswith("ingested.part-")]) <= visualizer.COMPACT_PARTS
+
+    reloaded = MetricsStore(str(tmp_path))
+    for name, rollup in store.rollups.items():
+        assert reloaded.rollups[name].columns == rollup.columns
+    assert not reloaded.add_release("a", _analysis("lain"))
+
+
+def test_load_skips_parts_already_compacted(tmp_path):
+    store = MetricsStore(str(tmp_path))
+    store.add_release("a", _analysis("kesehatan"), day="2026-10-01")
+    store.add_release("b", _analysis("desa"), day="2026-10-02")
+    stale = (tmp_path / "ingested.part-000000000001.parquet").read_bytes()
+
+    # Penggabungan yang terputus meninggalkan bagian lama di samping file utama
+    store.ingested.saved_rows_changed = True
+    store.ingested.saved_version = -1
+    store._save()
+    (tmp_path / "ingested.part-000000000001.parquet").write_bytes(stale)
+
+    reloaded = MetricsStore(str(tmp_path))
+    assert reloaded.ingested.columns == store.ingested.columns